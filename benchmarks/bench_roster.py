@@ -0,0 +1,179 @@
+"""
+benchmarks/bench_roster.py
+Бенчмарк операций со списком студентов (utils.file_manager).
+
+Генерирует списки размером «листов × студентов на листе», замеряет время
+(медиана по повторам) и пиковую память (tracemalloc) для:
+- add_or_check_student — новый студент (запись файла) и уже известный (индекс);
+- apply_mutations — пачка из 200 новых студентов одной записью;
+- ensure_group_sheet / remove_group_sheet;
+- построения словаря имён для синхронизации пользователей при запуске (холодное и из индекса).
+Результаты сохраняются в JSON; --compare печатает изменение относительно
+предыдущего прогона.
+
+Запуск из корня репозитория:
+    python -m benchmarks.bench_roster
+    python -m benchmarks.bench_roster --sheets 1 10 --students 50 500 --format csv
+    python -m benchmarks.bench_roster --compare benchmarks/results/roster-<...>.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from utils import file_manager
+from utils.roster_backends import Sheet, get_backend
+
+FORMATS = {"xlsx": "roster.xlsx", "parquet": "roster.parquet", "csv": "roster"}
+BURST_SIZE = 200
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def generate_roster(path, sheets, students):
+    """Создаёт список из sheets групп по students студентов."""
+    data = {
+        f"ГР-{group:03d}": Sheet(None, [(f"Имя{i}", f"Фамилия{group}-{i}") for i in range(students)])
+        for group in range(sheets)
+    }
+    get_backend(path).write(data)
+
+
+def measure(func, repeat):
+    """Медиана времени (с) по repeat запускам и пиковая память (КиБ) отдельным запуском."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024
+
+
+def _counter():
+    value = 0
+
+    def next_value():
+        nonlocal value
+        value += 1
+        return value
+
+    return next_value
+
+
+def bench_case(directory, fmt, sheets, students, repeat):
+    """Все операции для одного размера списка: [{"op", "seconds", "peak_kib"}, ...]."""
+    path = os.path.join(directory, f"{sheets}x{students}-{FORMATS[fmt]}")
+    generate_roster(path, sheets, students)
+    file_manager.set_storage_path(path)
+    next_id = _counter()
+    first_group = "ГР-000"
+
+    def add_new():
+        file_manager.add_or_check_student("Новый", f"Студент{next_id()}", first_group)
+
+    def add_existing():
+        file_manager.add_or_check_student("Имя0", "Фамилия0-0", first_group)
+
+    def add_burst():
+        batch = next_id()
+        file_manager.apply_mutations(
+            [("add_student", "Пачка", f"Студент{batch}-{i}", first_group) for i in range(BURST_SIZE)]
+        )
+
+    def add_and_remove_sheet():
+        group = f"ТЕСТ-{next_id()}"
+        file_manager.ensure_group_sheet(group)
+        file_manager.remove_group_sheet(group)
+
+    def ensure_existing_sheet():
+        file_manager.ensure_group_sheet(first_group)
+
+    def name_map_cold():
+        file_manager._invalidate_index()
+        file_manager.load_name_map()
+
+    def name_map_warm():
+        file_manager.load_name_map()
+
+    operations = [
+        ("add_or_check_student:new", add_new),
+        ("add_or_check_student:existing", add_existing),
+        (f"apply_mutations:burst{BURST_SIZE}", add_burst),
+        ("ensure_group_sheet+remove_group_sheet", add_and_remove_sheet),
+        ("ensure_group_sheet:existing", ensure_existing_sheet),
+        ("name_map:cold", name_map_cold),
+        ("name_map:warm", name_map_warm),
+    ]
+
+    results = []
+    for name, func in operations:
+        seconds, peak_kib = measure(func, repeat)
+        results.append({"op": name, "seconds": round(seconds, 6), "peak_kib": round(peak_kib, 1)})
+        print(f"{fmt:8} {sheets:>4} x {students:<5} {name:40} {seconds * 1000:10.2f} ms {peak_kib:10.1f} KiB")
+    return results
+
+
+def compare(results, previous_path):
+    """Печатает отношение времени к предыдущему прогону (>1 — медленнее)."""
+    with open(previous_path, encoding="utf-8") as fh:
+        previous = json.load(fh)
+    key = lambda row: (row["format"], row["sheets"], row["students"], row["op"])  # noqa: E731
+    before = {key(row): row for row in previous["results"]}
+    print(f"\nСравнение с {previous_path}:")
+    for row in results:
+        old = before.get(key(row))
+        if not old or not old["seconds"]:
+            continue
+        ratio = row["seconds"] / old["seconds"]
+        marker = "  ⚠️" if ratio > 1.2 else ""
+        print(f"{row['format']:8} {row['sheets']:>4} x {row['students']:<5} {row['op']:40} x{ratio:6.2f}{marker}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк операций со списком студентов.")
+    parser.add_argument("--sheets", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--students", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--format", choices=sorted(FORMATS), nargs="+", default=["xlsx"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="путь к JSON с результатами (по умолчанию benchmarks/results/)")
+    parser.add_argument("--compare", help="JSON предыдущего прогона для сравнения")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="roster-bench-") as directory:
+        for fmt in args.format:
+            for sheets in args.sheets:
+                for students in args.students:
+                    for row in bench_case(directory, fmt, sheets, students, args.repeat):
+                        results.append({"format": fmt, "sheets": sheets, "students": students, **row})
+
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+    output = args.output or os.path.join(RESULTS_DIR, f"roster-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    payload = {
+        "created_at": stamp,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(output, "w", encoding="utf-8") as fh:
+        json.dump(payload, fh, ensure_ascii=False, indent=2)
+    print(f"\nРезультаты сохранены в {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,22 @@ bot.py
 Точка входа для запуска Discord-бота.
 """
 
-import discord
-from discord.ext import commands
-from config import TOKEN
+import logging
+import time
+
+_process_started = time.perf_counter()
+
+import discord  # noqa: E402 - время импортов входит в отчёт о запуске
+from discord.ext import commands  # noqa: E402
+from config import CHUNK_GUILDS_AT_STARTUP, MAX_MESSAGES, MEMBER_CACHE_PROFILE, TOKEN  # noqa: E402
+from utils import roster  # noqa: E402
+from utils.feedback import attach_registry  # noqa: E402
+from utils.logging_setup import bind_context, setup_logging, stop_logging  # noqa: E402
+from utils.startup import StartupReport, resident_memory_mib  # noqa: E402
+
+logger = logging.getLogger("bot")
+startup = StartupReport(_process_started)
+startup.mark("импорты")
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -13,13 +26,56 @@ intents.guilds = True
 intents.members = True
 intents.messages = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+if MEMBER_CACHE_PROFILE == "minimal":
+    # Кэшируются только участники, зашедшие при работе бота; остальные — через fetch_members
+    member_cache_flags = discord.MemberCacheFlags.none()
+    member_cache_flags.joined = True
+else:
+    member_cache_flags = discord.MemberCacheFlags.from_intents(intents)
+
+bot = commands.Bot(
+    command_prefix='!',
+    intents=intents,
+    member_cache_flags=member_cache_flags,
+    chunk_guilds_at_startup=CHUNK_GUILDS_AT_STARTUP,
+    max_messages=MAX_MESSAGES or None,
+)
 bot.remove_command("help")
+bot.startup = startup  # отметки этапов дополняет EventsCog.on_ready
+attach_registry(bot)  # bot.feedback_channels — общий для всех модулей кэш feedback-каналов
 
 @bot.event
 async def on_ready():
     """Вызывается, когда бот полностью готов к работе."""
-    print(f"✅ Бот {bot.user} успешно запущен и готов к работе!")
+    logger.info("Бот %s запущен и готов к работе", bot.user)
+    memory = resident_memory_mib()
+    if memory is not None:
+        logger.info(
+            "Память после READY: %.1f МиБ (профиль кэша: %s)", memory, MEMBER_CACHE_PROFILE,
+            extra={"memory_mib": round(memory, 1)},
+        )
+
+
+@bot.before_invoke
+async def bind_command_context(ctx: commands.Context):
+    """Поля guild_id, command, user_id попадают во все записи журнала, сделанные командой."""
+    bind_context(
+        guild_id=ctx.guild.id if ctx.guild else None,
+        command=ctx.command.qualified_name if ctx.command else None,
+        user_id=ctx.author.id,
+    )
+    ctx.started_at = time.perf_counter()
+
+
+@bot.after_invoke
+async def log_command(ctx: commands.Context):
+    """Одна запись на выполненную команду: длительность и исход."""
+    started_at = getattr(ctx, "started_at", None)
+    latency_ms = round((time.perf_counter() - started_at) * 1000, 1) if started_at is not None else None
+    logger.info(
+        "Команда %s выполнена", ctx.command.qualified_name if ctx.command else ctx.invoked_with,
+        extra={"latency_ms": latency_ms, "failed": ctx.command_failed},
+    )
 
 
 async def load_extensions():
@@ -28,14 +84,20 @@ async def load_extensions():
     await bot.load_extension("cogs.general_commands")
     await bot.load_extension("cogs.commands")
     await bot.load_extension("cogs.commands_labs")
-    print("🔧 Коги успешно загружены.")
+    startup.mark("загрузка когов")
+    logger.info("Коги загружены")
 
 
 async def main():
     """Основная точка входа."""
-    async with bot:
-        await load_extensions()
-        await bot.start(TOKEN)
+    setup_logging()
+    try:
+        async with bot:
+            await load_extensions()
+            await bot.start(TOKEN)
+    finally:
+        await roster.close()
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,20 @@
 # cogs/commands.py
 
+import asyncio
+import io
+import time
+
 from discord.ext import commands
 import discord
 from discord import PermissionOverwrite
-from utils.file_manager import ensure_group_sheet, remove_group_sheet
+from database.models import AuditEvent, User
+from utils import roster
+from utils.audit import audit, parse_since
+from utils.members import fetch_all_members
 from typing import Optional
 
+AUDIT_PAGE_SIZE = 20  # сколько событий показывает !audit
+
 class GroupManagementCog(commands.Cog):
     """Управление учебными группами."""
 
@@ -40,7 +49,7 @@ class GroupManagementCog(commands.Cog):
 
         # 1) Excel: гарантируем лист
         try:
-            created = ensure_group_sheet(group_name)
+            created = await roster.ensure_group_sheet(group_name)
         except Exception:
             await ctx.send(f"❌ Не удалось создать/проверить лист для группы **{group_name}**. Смотри логи бота.")
             return
@@ -135,6 +144,10 @@ class GroupManagementCog(commands.Cog):
         category_msg = "категория создана" if category_created else "категория обновлена"
         channel_msg = "канал создан" if channel_created else "канал обновлён"
 
+        audit.record(
+            guild, "group.add", actor=ctx.author, group=group_name,
+            roster_created=created, role_created=role_created, channel_created=channel_created,
+        )
         await ctx.send(
             f"✅ Группа **{group_name}** готова: {excel_msg}, {role_msg}, {category_msg}, {channel_msg}."
         )
@@ -169,7 +182,7 @@ class GroupManagementCog(commands.Cog):
 
         statuses = []
 
-        sheet_removed = remove_group_sheet(group_name)
+        sheet_removed = await roster.remove_group_sheet(group_name)
         statuses.append("лист удалён" if sheet_removed else "листа не было")
 
         role = discord.utils.get(guild.roles, name=group_name)
@@ -215,6 +228,7 @@ class GroupManagementCog(commands.Cog):
             else:
                 statuses.append("категория/каналы не найдены")
 
+        audit.record(guild, "group.remove", actor=ctx.author, group=group_name, statuses=statuses)
         await ctx.send(f"ℹ️ Группа **{group_name}**: {', '.join(statuses)}.")
 
     @remove_group.error
@@ -224,5 +238,154 @@ class GroupManagementCog(commands.Cog):
         else:
             await ctx.send(f"❌ Ошибка: {error}")
 
+    # -------------------------- Синхронизация списка с базой --------------------------
+
+    @commands.command(name="rosterimport", aliases=["roster_import"])
+    @commands.has_permissions(administrator=True)
+    async def roster_import(self, ctx):
+        """
+        Загружает список студентов из Excel в таблицу roster_entries
+        (содержимое таблицы заменяется целиком).
+        Использование: !rosterimport
+        """
+        try:
+            count = await roster.import_to_db()
+        except Exception as e:
+            await ctx.send(f"❌ Не удалось загрузить список в базу: `{e}`")
+            return
+        await ctx.send(f"📥 Список студентов загружен в базу: {count} записей.")
+
+    @commands.command(name="rosterexport", aliases=["roster_export"])
+    @commands.has_permissions(administrator=True)
+    async def roster_export(self, ctx):
+        """
+        Переписывает листы Excel по таблице roster_entries: недостающие
+        студенты добавляются, отсутствующие в базе — удаляются.
+        Использование: !rosterexport
+        """
+        try:
+            count = await roster.export_from_db()
+        except Exception as e:
+            await ctx.send(f"❌ Не удалось выгрузить список в Excel: `{e}`")
+            return
+        await ctx.send(f"📤 Список студентов выгружен в Excel: {count} записей.")
+
+    @commands.command(name="rostercheck", aliases=["roster_check"])
+    @commands.has_permissions(administrator=True)
+    async def roster_check(self, ctx):
+        """
+        Сверяет список студентов, таблицу users и участников сервера:
+        незарегистрированные участники, роль не своей группы, строки списка
+        без аккаунта Discord. Подробности — CSV-вложением.
+        Использование: !rostercheck
+        """
+        guild: discord.Guild = ctx.guild
+        if guild is None:
+            await ctx.send("❗ Команду нужно вызывать с сервера (не в ЛС).")
+            return
+
+        from utils import roster_report  # pandas грузится только при первой сверке
+
+        async with ctx.typing():
+            roster_rows = await roster.list_students()
+            users = await User.all().values("discord_id", "first_name", "last_name", "group")
+            members = [
+                {
+                    "discord_id": member.id,
+                    "display_name": member.display_name,
+                    "roles": [role.name for role in member.roles],
+                }
+                for member in await fetch_all_members(guild)
+            ]
+            report = await asyncio.to_thread(roster_report.build_report, roster_rows, users, members)
+            counts = roster_report.summarize(report)
+            data = await asyncio.to_thread(roster_report.to_csv_bytes, report)
+
+        summary = "\n".join(f"• {problem}: **{count}**" for problem, count in counts.items())
+        await ctx.send(
+            f"📋 Сверка списка: {len(roster_rows)} строк, {len(users)} в базе, {len(members)} участников.\n{summary}",
+            file=discord.File(io.BytesIO(data), filename=f"rostercheck-{guild.id}.csv"),
+        )
+
+    @roster_import.error
+    @roster_export.error
+    @roster_check.error
+    async def roster_sync_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send("⛔ Эта команда только для администраторов.")
+        else:
+            await ctx.send(f"❌ Ошибка: {error}")
+
+    # -------------------------- Регистрация --------------------------
+
+    @commands.command(name="dialogs", aliases=["registrations", "диалоги"])
+    @commands.has_permissions(administrator=True)
+    async def registration_dialogs(self, ctx):
+        """
+        Показывает, сколько диалогов регистрации сейчас открыто.
+        Использование: !dialogs
+        """
+        events = self.bot.get_cog("EventsCog")
+        if events is None:
+            await ctx.send("❗ Модуль событий не загружен.")
+            return
+        total = len(events.registration_dialogs)
+        await ctx.send(
+            f"📨 Открыто диалогов регистрации: **{total}** "
+            f"(ведётся: {events.active_dialogs}, в очереди: {total - events.active_dialogs})."
+        )
+
+    @registration_dialogs.error
+    async def registration_dialogs_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send("⛔ Эта команда только для администраторов.")
+        else:
+            await ctx.send(f"❌ Ошибка: {error}")
+
+    # -------------------------- Журнал аудита --------------------------
+
+    @commands.command(name="audit", aliases=["журнал"])
+    @commands.has_permissions(administrator=True)
+    async def audit_log(self, ctx, user: discord.User, since: Optional[str] = None):
+        """
+        Последние события журнала аудита по участнику.
+        Использование: !audit @user [since], где since — 30m, 24h, 7d или дата 2026-10-01.
+        """
+        if ctx.guild is None:
+            await ctx.send("❗ Команду нужно вызывать с сервера (не в ЛС).")
+            return
+        try:
+            after = parse_since(since) if since else None
+        except ValueError:
+            await ctx.send("❗ Не понял период. Примеры: `30m`, `24h`, `7d`, `2026-10-01`.")
+            return
+
+        await audit.flush()  # события из очереди тоже должны попасть в ответ
+        started = time.perf_counter()
+        query = AuditEvent.filter(guild_id=ctx.guild.id, subject_id=user.id)
+        if after is not None:
+            query = query.filter(created_at__gte=after)
+        events = await query.order_by("-created_at").limit(AUDIT_PAGE_SIZE)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if not events:
+            await ctx.send(f"ℹ️ В журнале нет событий по **{user.display_name}** ({elapsed_ms:.1f} мс).")
+            return
+        lines = [f"📜 Журнал по **{user.display_name}** — последние {len(events)} ({elapsed_ms:.1f} мс):"]
+        for event in events:
+            actor = f" — <@{event.actor_id}>" if event.actor_id else ""
+            text = (event.payload or {}).get("text", "")
+            lines.append(f"`{event.created_at:%Y-%m-%d %H:%M}` **{event.kind}**{actor} {text}".rstrip())
+        await ctx.send("\n".join(lines)[:2000], allowed_mentions=discord.AllowedMentions.none())
+
+    @audit_log.error
+    async def audit_log_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send("⛔ Эта команда только для администраторов.")
+        elif isinstance(error, (commands.MissingRequiredArgument, commands.UserNotFound)):
+            await ctx.send("❗ Укажи участника. Пример: `!audit @user 7d`")
+        else:
+            await ctx.send(f"❌ Ошибка: {error}")
+
 async def setup(bot):
     await bot.add_cog(GroupManagementCog(bot))
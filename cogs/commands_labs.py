@@ -1,39 +1,36 @@
-﻿from discord.ext import commands
+﻿import logging
+
+from discord.ext import commands
 import discord
 from database.models import User, LabWork
 from tortoise.exceptions import DoesNotExist
 from typing import Union
 
-from utils.feedback import ensure_feedback_channel, send_feedback_message
+from utils.audit import audit
+from utils.feedback import deliver_feedback, feedback_channels
+from utils.feedback_index import referenced_member_ids
 from cogs.labs.views import LabReviewView
 from cogs.labs.utils import safe_respond
 
+logger = logging.getLogger(__name__)
+
 class LabsCog(commands.Cog):
     """Команды для сдачи и проверки лабораторных работ."""
 
     def __init__(self, bot):
         self.bot = bot
-        self.feedback_channels: dict[int, discord.TextChannel] = {}
-        
-    async def _get_or_create_feedback_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
-        cached = self.feedback_channels.get(guild.id)
-        if cached and cached.guild:
-            return cached
 
-        channel = await ensure_feedback_channel(guild)
-        if channel:
-            self.feedback_channels[guild.id] = channel
-        return channel
+    async def _get_or_create_feedback_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
+        return await feedback_channels.resolve(guild)
 
     async def _log_feedback(self, guild: discord.Guild, text: str) -> None:
-        channel = await self._get_or_create_feedback_channel(guild)
-        if channel:
-            try:
-                await channel.send(text)
-                return
-            except Exception:
-                pass
-        await send_feedback_message(guild, text)
+        member_ids = referenced_member_ids(text)
+        audit.record(guild, "lab", subject=next(iter(member_ids)) if len(member_ids) == 1 else None, text=text)
+        feedback_log = getattr(self.bot, "feedback_log", None)  # общий буферизованный лог (EventsCog)
+        if feedback_log is not None:
+            await feedback_log.log(guild, text, member_ids)
+            return
+        await deliver_feedback(guild, text, member_ids)
 
     # -------------------- Команды студента --------------------
 
@@ -119,7 +116,7 @@ class LabsCog(commands.Cog):
             await ctx.send(f"{msg}\n📘 Лабораторная №{lab_number}\n📎 {file_url}")
 
         except Exception as e:
-            print(f"[!submit] Ошибка: {e}")
+            logger.exception("[!submit] Ошибка")
             await ctx.send(f"❌ Ошибка при обработке `!submit`: `{e}`")
 
     
@@ -8,14 +8,50 @@ cogs/events.py
 """
 
 import asyncio
+import logging
+import time
+from datetime import timedelta
 import discord
 from discord.ext import commands
 from discord import PermissionOverwrite
+from config import GUILD_BOOTSTRAP_CONCURRENCY, REGISTRATION_DIALOG_LIMIT, REGISTRATION_RETRY_COOLDOWN
 from database.init_db import init_db
-from utils.file_manager import add_or_check_student, ensure_excel_exists
-from utils.feedback import ensure_feedback_channel, send_feedback_message
+from utils import roster
+from utils.dm_router import DMRouter
+from utils.members import current_member, iter_member_pages
+from utils.personal_channels import PersonalChannelIndex
+from utils.startup import format_memory, resident_memory_mib
+from utils.role_engine import RoleEngine
+from utils.feedback import feedback_channels
+from utils.feedback_index import delete_member_messages, referenced_member_ids
+from utils.feedback_log import FeedbackLogger
+from utils.audit import audit
+from utils.logging_setup import log_context
 from cogs.views import ChannelConflictView, DeleteChannelView
 
+logger = logging.getLogger(__name__)
+
+REGISTRATION_ATTEMPTS = 3
+REGISTRATION_TIMEOUT = 300.0  # секунд на ответ в диалоге регистрации
+# Сессии без регистрации: до истечения REGISTRATION_RETRY_COOLDOWN участнику повторно не пишем
+SESSION_FINISHED = ("cancelled", "timeout", "failed", "forbidden")
+USER_SYNC_BATCH_SIZE = 500  # строк users в одном INSERT при синхронизации
+
+
+def _pending_question(intro: str, attempts: int, suggestion, typed) -> str:
+    """Вопрос, на котором остановился диалог регистрации (для продолжения после простоя)."""
+    if suggestion and typed:
+        return (
+            f"🔎 В списке группы **{suggestion[2]}** есть **{suggestion[0]} {suggestion[1]}**. Это ты? "
+            f"Ответь `да` или `нет` (тогда запишу как «{typed[0]} {typed[1]}»)."
+        )
+    if suggestion:
+        return (
+            f"Возможно, ты имел в виду группу **{suggestion[2]}**? "
+            f"Ответь `да`, чтобы продолжить с ней, или введи данные заново. Осталось попыток: {attempts}."
+        )
+    return f"{intro}\nОсталось попыток: {attempts}."
+
 
 # cogs/events.py
 
@@ -24,7 +60,34 @@ class EventsCog(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.feedback_channels = {}
+        self.bootstrapped = False  # полная инициализация уже выполнена в этом процессе
+        self.bootstrapped_guilds = set()
+        self._bootstrap_lock = asyncio.Lock()
+        # Диалоги регистрации — фоновые задачи: member_id → Task
+        self.registration_dialogs: dict[int, asyncio.Task] = {}
+        self.active_dialogs = 0  # сколько диалогов сейчас ведётся (остальные ждут слота)
+        self._dialog_slots = asyncio.Semaphore(REGISTRATION_DIALOG_LIMIT)
+        self.dm_router = DMRouter()  # один обработчик ЛС для всех диалогов
+        self.roles = RoleEngine()  # один member.edit(roles=...) на участника
+        # member_id → личный канал; общий для всех модулей через bot.personal_channels
+        self.personal_channels = PersonalChannelIndex()
+        bot.personal_channels = self.personal_channels
+        # Лог в feedback склеивается в сообщения до 2000 символов; общий для всех модулей
+        self.feedback_log = FeedbackLogger()
+        bot.feedback_log = self.feedback_log
+        # Журнал аудита (таблица audit_events), пишется пачками в фоне
+        self.audit = audit
+        bot.audit = audit
+
+    async def cog_unload(self):
+        """Остановка бота: отменяем открытые диалоги регистрации."""
+        tasks = list(self.registration_dialogs.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.dm_router.close()
+        await self.feedback_log.close()
+        await self.audit.close()
 
     # -------------------------------------------------------------------------
     # События
@@ -32,97 +95,274 @@ class EventsCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        """Инициализация при запуске бота."""
-        print(f'✅ Бот {self.bot.user} запущен!')
-        await init_db()
-        ensure_excel_exists()
-
-        for guild in self.bot.guilds:
-            fb = await self.get_or_create_feedback_channel(guild)
-            self.feedback_channels[guild.id] = fb
-            await self.setup_unknown_role_and_channel(guild)
-            await self.log_action(guild, f"🚀 Бот готов к работе на сервере **{guild.name}**.")
-            
-            await self.sync_users_from_guild(guild)
-
-            unknown_role = discord.utils.get(guild.roles, name="Неизвестные")
-            if not unknown_role:
-                unknown_role = await self.get_or_create_role(guild, "Неизвестные")
-
-            total_checked = 0
-            total_dialogs_started = 0
-
-            for member in guild.members:
-                if member.bot:
-                    continue
-                total_checked += 1
+        """
+        Инициализация при запуске бота.
+        on_ready повторяется после переподключения к шлюзу: полная инициализация
+        выполняется один раз за процесс, дальше — только инкрементальный проход.
+        """
+        logger.info("Бот %s подключён", self.bot.user)
+        async with self._bootstrap_lock:
+            if self.bootstrapped:
+                await self.resync_guilds(self.bot.guilds)
+                return
+            startup = getattr(self.bot, "startup", None)
+            if startup and not startup.reported:
+                startup.mark("подключение и первый READY")
+            await init_db()
+            await roster.ensure_excel_exists()
+            if startup and not startup.reported:
+                startup.mark("база данных и список")
+                startup.reported = True
+                logger.info(startup.format(), extra={"startup_s": round(startup.total, 2)})
+
+            await self.report_interrupted_sessions()
+            await self.bootstrap_guilds(self.bot.guilds)
+            self.bootstrapped = True
+
+    async def bootstrap_guilds(self, guilds):
+        """
+        Инициализирует серверы параллельно: каждый сервер — отдельная задача,
+        одновременно не больше GUILD_BOOTSTRAP_CONCURRENCY. Общее время
+        ограничено самым медленным сервером, а не суммой всех.
+        """
+        semaphore = asyncio.Semaphore(GUILD_BOOTSTRAP_CONCURRENCY)
+        started = time.perf_counter()
+        memory_before = resident_memory_mib()
+
+        async def run(guild):
+            async with semaphore:
+                with log_context(guild_id=guild.id):
+                    await self.bootstrap_guild(guild)
+                self.bootstrapped_guilds.add(guild.id)
+
+        results = await asyncio.gather(*(run(guild) for guild in guilds), return_exceptions=True)
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "[bootstrap] %s: ошибка инициализации", guild.name,
+                    exc_info=result, extra={"guild_id": guild.id},
+                )
 
-                # 1️⃣ Если нет ролей вообще — добавляем 'Неизвестные'
-                if len(member.roles) == 1:
-                    await member.add_roles(unknown_role)
-                    await self.log_action(guild, f"⚙️ {member.mention} не имел ролей — назначена роль 'Неизвестные'.")
-                    await self.start_registration_dialog(member, guild, unknown_role)
-                    total_dialogs_started += 1
-                    continue
+        failed = sum(isinstance(result, Exception) for result in results)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "[bootstrap] Серверов: %d, с ошибками: %d, общее время %.2f с, память %s",
+            len(guilds), failed, elapsed, format_memory(memory_before, resident_memory_mib()),
+            extra={"guilds": len(guilds), "failed": failed, "latency_ms": round(elapsed * 1000, 1)},
+        )
 
-                # 2️⃣ Если роль 'Неизвестные' уже есть — тоже запускаем регистрацию
-                if unknown_role in member.roles:
-                    try:
-                        await self.start_registration_dialog(member, guild, unknown_role)
-                        total_dialogs_started += 1
-                        await self.log_action(guild, f"📩 Повторно запущен диалог регистрации для {member.display_name}.")
-                    except discord.Forbidden:
-                        await self.log_action(
-                            guild,
-                            f"⚠️ Не удалось отправить сообщение участнику {member.display_name} (возможно, закрыты ЛС)."
-                        )
+    async def bootstrap_guild(self, guild: discord.Guild):
+        """Инициализация одного сервера: feedback, роли, синхронизация, проверка участников."""
+        started = time.perf_counter()
+        stage_started = started
+
+        def progress(stage: str):
+            nonlocal stage_started
+            now = time.perf_counter()
+            logger.info(
+                "[bootstrap] %s: %s — %.2f с", guild.name, stage, now - stage_started,
+                extra={"stage": stage, "latency_ms": round((now - stage_started) * 1000, 1)},
+            )
+            stage_started = now
+
+        await self.get_or_create_feedback_channel(guild)
+        await self.setup_unknown_role_and_channel(guild)
+        await self.personal_channels.load_guild(guild)
+        await self.log_action(guild, f"🚀 Бот готов к работе на сервере **{guild.name}**.")
+        progress("feedback-канал и роль 'Неизвестные'")
+
+        unknown_role = discord.utils.get(guild.roles, name="Неизвестные")
+        if not unknown_role:
+            unknown_role = await self.get_or_create_role(guild, "Неизвестные")
+
+        # Участники читаются пачками (без полной загрузки сервера в кэш):
+        # каждая пачка сразу синхронизируется с базой и проверяется
+        all_known = await roster.load_name_map()
+        member_ids = []
+        created_count = total_checked = total_dialogs_started = 0
+        sync_seconds = 0.0
+        async for page in iter_member_pages(guild):
+            member_ids.extend(member.id for member in page)
+            sync_started = time.perf_counter()
+            created_count += await self._insert_new_users(page, all_known)
+            sync_seconds += time.perf_counter() - sync_started
+            checked, dialogs = await self.scan_members(guild, unknown_role, page)
+            total_checked += checked
+            total_dialogs_started += dialogs
+        await self.log_sync_result(guild, created_count, sync_seconds)
+        await self.save_checkpoint(guild, member_ids)
+        progress("синхронизация и проверка участников")
+
+        elapsed = time.perf_counter() - started
+        await self.log_action(
+            guild,
+            f"🔎 Проверка завершена: обработано {total_checked} участников, "
+            f"запущено {total_dialogs_started} диалогов регистрации ({elapsed:.1f} с). "
+            f"Открыто диалогов: {len(self.registration_dialogs)}."
+        )
 
-            await self.log_action(
-                guild,
-                f"🔎 Проверка завершена: обработано {total_checked} участников, "
-                f"запущено {total_dialogs_started} диалогов регистрации."
+    async def resync_guilds(self, guilds):
+        """
+        Повторный READY: серверы, добавленные после запуска, инициализируются полностью,
+        для остальных обрабатываются только участники, которых нет в сохранённой отметке.
+        """
+        new_guilds = [guild for guild in guilds if guild.id not in self.bootstrapped_guilds]
+        if new_guilds:
+            await self.bootstrap_guilds(new_guilds)
+
+        started = time.perf_counter()
+        for guild in guilds:
+            if guild in new_guilds:
+                continue
+            try:
+                with log_context(guild_id=guild.id):
+                    await self.resync_guild(guild)
+            except Exception:
+                logger.exception("[resync] %s: ошибка синхронизации", guild.name, extra={"guild_id": guild.id})
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "[resync] Инкрементальная синхронизация после переподключения: %.2f с", elapsed,
+            extra={"latency_ms": round(elapsed * 1000, 1)},
+        )
+
+    async def resync_guild(self, guild: discord.Guild):
+        """Обрабатывает участников, появившихся с момента последней отметки."""
+        from database.models import GuildCheckpoint
+
+        checkpoint = await GuildCheckpoint.get_or_none(guild_id=guild.id)
+        processed = set(checkpoint.processed_member_ids) if checkpoint else set()
+        unknown_role = await self.get_or_create_role(guild, "Неизвестные")
+        all_known = await roster.load_name_map()
+        member_ids = []
+        created_count = total_checked = total_dialogs_started = 0
+        async for page in iter_member_pages(guild):
+            member_ids.extend(member.id for member in page)
+            new_members = [member for member in page if member.id not in processed]
+            if not new_members:
+                continue
+            created_count += await self._insert_new_users(new_members, all_known)
+            checked, dialogs = await self.scan_members(guild, unknown_role, new_members)
+            total_checked += checked
+            total_dialogs_started += dialogs
+        await self.save_checkpoint(guild, member_ids)
+        if not total_checked:
+            return
+
+        await self.log_action(
+            guild,
+            f"🔄 После переподключения: новых участников {total_checked}, добавлено в базу {created_count}, "
+            f"запущено {total_dialogs_started} диалогов регистрации."
+        )
+
+    async def save_checkpoint(self, guild: discord.Guild, member_ids):
+        """Сохраняет время синхронизации и ID обработанных участников сервера."""
+        from database.models import GuildCheckpoint
+        from tortoise import timezone
+
+        await GuildCheckpoint.update_or_create(
+            guild_id=guild.id,
+            defaults={"last_sync_at": timezone.now(), "processed_member_ids": sorted(member_ids)},
+        )
+
+    async def scan_members(self, guild: discord.Guild, unknown_role: discord.Role, members=None) -> tuple[int, int]:
+        """
+        Назначает 'Неизвестные' участникам без ролей и запускает регистрацию.
+        members — подмножество участников (по умолчанию все). Возвращает (проверено, диалогов).
+        """
+        from database.models import RegistrationSession
+        from tortoise import timezone
+
+        total_checked = 0
+        total_dialogs_started = 0
+        # Кому уже писали и диалог недавно завершился без регистрации — до конца
+        # REGISTRATION_RETRY_COOLDOWN повторно не пишем (сам участник может написать !verify)
+        sessions = RegistrationSession.filter(
+            guild_id=guild.id,
+            status__in=SESSION_FINISHED,
+            updated_at__gt=timezone.now() - timedelta(hours=REGISTRATION_RETRY_COOLDOWN),
+        )
+        if members is not None:
+            sessions = sessions.filter(member_id__in=[member.id for member in members])
+        finished = set(await sessions.values_list("member_id", flat=True))
+
+        without_roles = []
+        for member in guild.members if members is None else members:
+            if member.bot:
+                continue
+            total_checked += 1
+
+            # 1️⃣ Если нет ролей вообще — 'Неизвестные' назначаются ниже, одной пачкой
+            if len(member.roles) == 1:
+                without_roles.append(member)
+                continue
+
+            # 2️⃣ Если роль 'Неизвестные' уже есть — продолжаем или запускаем регистрацию
+            if unknown_role in member.roles and member.id not in finished:
+                if self.spawn_registration_dialog(member, guild, unknown_role):
+                    total_dialogs_started += 1
+                    await self.log_action(guild, f"📩 Повторно запущен диалог регистрации для {member.display_name}.", about=member)
+
+        if without_roles:
+            # Роли могли измениться с момента чтения страницы: edit(roles=...) заменяет весь список
+            refreshed = await asyncio.gather(*(current_member(member) for member in without_roles))
+            without_roles = [member for member in refreshed if member is not None and len(member.roles) == 1]
+        if without_roles:
+            changed, failed = await self.roles.apply_many(
+                ((member, [unknown_role], []) for member in without_roles),
+                reason="Участник без ролей",
             )
+            for member, error in failed:
+                await self.log_action(guild, f"⚠️ Не удалось назначить 'Неизвестные' {member.mention}: {error}", about=member)
+            for member in changed:
+                await self.log_action(guild, f"⚙️ {member.mention} не имел ролей — назначена роль 'Неизвестные'.", about=member)
+                if member.id not in finished and self.spawn_registration_dialog(member, guild, unknown_role):
+                    total_dialogs_started += 1
+
+        return total_checked, total_dialogs_started
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        """Личные сообщения — открытым диалогам регистрации (поиск по автору за O(1))."""
+        if isinstance(self.bot.command_prefix, str) and message.content.startswith(self.bot.command_prefix):
+            return  # команды (например, !verify) не считаются ответом в диалоге
+        self.dm_router.dispatch(message)
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
         """Добавление нового пользователя."""
         guild = member.guild
         unknown_role = await self.get_or_create_role(guild, "Неизвестные")
-        await member.add_roles(unknown_role)
-        await self.log_action(guild, f"🆕 Участник {member.mention} присоединился. Назначена роль 'Неизвестные'.")
-        await self.start_registration_dialog(member, guild, unknown_role)
+        await self.roles.apply(member, add=[unknown_role])
+        await self.log_action(
+            guild, f"🆕 Участник {member.mention} присоединился. Назначена роль 'Неизвестные'.", about=member, kind="member.join"
+        )
+        self.spawn_registration_dialog(member, guild, unknown_role, restart=True)
 
     @commands.Cog.listener()
-    async def on_member_remove(self, member):
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
         """При выходе участника предлагает удалить его личный канал.
-        Перед этим очищает старые сообщения об этом пользователе в feedback."""
-        guild = member.guild
+        Перед этим очищает старые сообщения об этом пользователе в feedback.
+        Raw-событие приходит и для участников, которых нет в кэше (профиль minimal):
+        on_member_remove discord.py вызывает только для закэшированных."""
+        guild = self.bot.get_guild(payload.guild_id)
+        if guild is None:
+            return
+        member = payload.user  # Member, если был в кэше, иначе User
         feedback = await self.get_or_create_feedback_channel(guild)
 
-        # 🧹 Очистка старых сообщений об этом пользователе
+        # 🧹 Очистка сообщений об этом пользователе — по индексу feedback_messages
         try:
-            async for msg in feedback.history(limit=100):  # можно увеличить лимит при необходимости
-                if (
-                    str(member.id) in msg.content
-                    or member.display_name.lower() in msg.content.lower()
-                    or (msg.embeds and any(member.display_name.lower() in str(e.description).lower() for e in msg.embeds))
-                ):
-                    try:
-                        await msg.delete()
-                    except Exception as e:
-                        print(f"⚠️ Не удалось удалить сообщение feedback: {e}")
+            await self.feedback_log.flush(guild)  # строки из буфера тоже должны попасть в индекс
+            await delete_member_messages(guild, member.id)
         except Exception as e:
-            print(f"⚠️ Ошибка при попытке очистки feedback: {e}")
-
-        # 🔍 Поиск личного канала по topic (где хранится member.id)
-        found_channel = None
-        for category in guild.categories:
-            for ch in category.text_channels:
-                if ch.topic and ch.topic.strip() == str(member.id):
-                    found_channel = ch
-                    break
-            if found_channel:
-                break
+            logger.warning("Ошибка при очистке feedback: %s", e, extra={"guild_id": guild.id, "member_id": member.id})
+
+        # 🔍 Личный канал — из индекса (users.personal_channel_id / topic)
+        found_channel = await self.personal_channels.find(guild, member.id)
+        self.audit.record(
+            guild, "member.leave", subject=member,
+            name=member.display_name, personal_channel_id=found_channel.id if found_channel else None,
+        )
 
         # ⚙️ Отправка выбора
         if found_channel:
@@ -134,7 +374,7 @@ class EventsCog(commands.Cog):
                 f"Хотите удалить этот канал?",
                 view=view
             )
-            await self.log_action(guild, f"👋 {member.display_name} покинул сервер. Найден личный канал {found_channel.name} (по topic).")
+            await self.log_action(guild, f"👋 {member.display_name} покинул сервер. Найден личный канал {found_channel.name}.")
 
         else:
             await feedback.send(
@@ -142,6 +382,18 @@ class EventsCog(commands.Cog):
             )
             await self.log_action(guild, f"ℹ️ {member.display_name} покинул сервер. Приватный канал не найден.")
     
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel):
+        self.personal_channels.channel_created(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        await self.personal_channels.channel_deleted(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        self.personal_channels.channel_updated(before, after)
+
     async def send_help_message(self, channel: discord.TextChannel, member: discord.Member, is_personal: bool = False):
         """Отправляет адаптированное приветствие и список доступных команд в канал."""
         user = member
@@ -173,6 +425,7 @@ class EventsCog(commands.Cog):
             "`!info` — Информация о боте.\n"
             "`!ping` — Проверка задержки.\n"
             "`!help` — Показать список команд.\n"
+            "`!verify` — Пройти регистрацию заново.\n"
         )
 
         if any(r for r in roles if r not in ["@everyone", "неизвестные"]) and not is_admin:
@@ -187,6 +440,10 @@ class EventsCog(commands.Cog):
                 "\n**Управление группами**\n"
                 "`!addgroup <название>` — добавить группу.\n"
                 "`!removegroup <название>` — удалить группу.\n"
+                "`!rosterimport` / `!rosterexport` — синхронизировать список студентов с базой.\n"
+                "`!rostercheck` — сверить список, базу и участников сервера.\n"
+                "`!dialogs` — открытые диалоги регистрации.\n"
+                "`!audit @user [период]` — журнал действий по участнику.\n"
             )
 
         if is_admin or any("преподаватель" in r for r in roles):
@@ -197,49 +454,59 @@ class EventsCog(commands.Cog):
                 "`!labfile @студент <номер>` — показать ссылку на файл.\n"
                 "`!deletelab @студент <номер>` — удалить лабораторную.\n"
             )
-            print(f"⚠️ Не удалось отправить приветствие в {channel.name}: {e}")
 
-    async def sync_users_from_guild(self, guild: discord.Guild):
-        """Добавляет в базу всех участников, которых ещё нет."""
+        embed.add_field(name="📋 Доступные команды", value=commands_text, inline=False)
+        try:
+            await channel.send(embed=embed)
+        except discord.HTTPException as e:
+            logger.warning("Не удалось отправить приветствие в %s: %s", channel.name, e, extra={"guild_id": channel.guild.id})
+
+    async def log_sync_result(self, guild: discord.Guild, created_count: int, elapsed: float):
+        rate = created_count / elapsed if elapsed > 0 else 0.0
+        await self.log_action(
+            guild,
+            f"🔁 Синхронизированы пользователи: добавлено {created_count} записей в базу "
+            f"за {elapsed:.2f} с ({rate:.0f} строк/с)."
+        )
+
+    async def _insert_new_users(self, members, all_known) -> int:
+        """
+        Вставляет в users участников, которых там ещё нет. Известные discord_id
+        читаются одним запросом, новые записи — пачками по USER_SYNC_BATCH_SIZE
+        в одной транзакции. Возвращает число добавленных.
+        """
         from database.models import User
-        import pandas as pd
-        from utils.file_manager import file_path
-
-        df = pd.read_excel(file_path, None)  # загружаем все листы
-        all_known = {}
-        for sheet, data in df.items():
-            for _, row in data.iterrows():
-                full_name = f"{str(row['ИМЯ']).strip()} {str(row['ФАМИЛИЯ']).strip()}"
-                all_known[full_name.lower()] = sheet  # { "иван иванов": "ГР-01", ... }
-
-        created_count = 0
-        for member in guild.members:
-            if member.bot:
-                continue
+        from tortoise.transactions import in_transaction
 
-            existing = await User.get_or_none(discord_id=member.id)
-            if existing:
+        members = [member for member in members if not member.bot]
+        known_ids = set(
+            await User.filter(discord_id__in=[member.id for member in members]).values_list("discord_id", flat=True)
+        )
+
+        new_users = []
+        for member in members:
+            if member.id in known_ids:
                 continue  # уже в базе
+            known_ids.add(member.id)
 
             display = member.display_name.strip().split()
             if len(display) >= 2:
                 first, last = display[0], display[1]
-                group = all_known.get(f"{first.lower()} {last.lower()}", "Неизвестные")
+                group = all_known.get((first.casefold(), last.casefold()), "Неизвестные")
             else:
                 first, last, group = member.display_name, "-", "Неизвестные"
 
-            await User.create(
-                discord_id=member.id,
-                first_name=first,
-                last_name=last,
-                group=group
-            )
-            created_count += 1
+            new_users.append(User(discord_id=member.id, first_name=first, last_name=last, group=group))
 
-        await self.log_action(
-            guild,
-            f"🔁 Синхронизированы пользователи: добавлено {created_count} записей в базу."
-        )
+        if not new_users:
+            return 0
+        new_ids = [user.discord_id for user in new_users]
+        async with in_transaction():
+            # ignore_conflicts: участник мог зарегистрироваться, пока шла синхронизация,
+            # поэтому добавленные считаются по базе, а не по длине списка
+            existing = await User.filter(discord_id__in=new_ids).count()
+            await User.bulk_create(new_users, batch_size=USER_SYNC_BATCH_SIZE, ignore_conflicts=True)
+            return await User.filter(discord_id__in=new_ids).count() - existing
 
 
 
@@ -247,65 +514,221 @@ class EventsCog(commands.Cog):
     # Регистрация и структура групп
     # -------------------------------------------------------------------------
 
-    async def start_registration_dialog(self, member: discord.Member, guild: discord.Guild, unknown_role: discord.Role):
-        """Диалог в личке: запрос имени, фамилии и группы."""
+    def spawn_registration_dialog(
+        self, member: discord.Member, guild: discord.Guild, unknown_role: discord.Role, restart: bool = False
+    ) -> bool:
+        """
+        Запускает диалог регистрации фоновой задачей, не дожидаясь ответа студента.
+        Одновременно ведётся не больше REGISTRATION_DIALOG_LIMIT диалогов, остальные ждут слота.
+        Возвращает False, если диалог с участником уже открыт.
+        """
+        if member.id in self.registration_dialogs:
+            return False
+        self.registration_dialogs[member.id] = asyncio.create_task(
+            self._supervise_dialog(member, guild, unknown_role, restart),
+            name=f"registration-{member.id}",
+        )
+        return True
+
+    async def _supervise_dialog(
+        self, member: discord.Member, guild: discord.Guild, unknown_role: discord.Role, restart: bool
+    ):
+        """Обёртка фоновой задачи: слот, ошибки диалога в feedback, снятие с учёта."""
+        try:
+            async with self._dialog_slots:
+                self.active_dialogs += 1
+                try:
+                    await self.start_registration_dialog(member, guild, unknown_role, restart=restart)
+                finally:
+                    self.active_dialogs -= 1
+        except discord.Forbidden:
+            # ЛС закрыты: сессия завершается, чтобы проверка участников при следующих
+            # запусках не писала ему снова до конца REGISTRATION_RETRY_COOLDOWN
+            await self.finish_session(guild, member, "forbidden")
+            await self.log_action(
+                guild,
+                f"⚠️ Не удалось отправить сообщение участнику {member.display_name} (возможно, закрыты ЛС).",
+                about=member,
+            )
+        except Exception as e:
+            await self.log_action(guild, f"❌ Ошибка в диалоге регистрации {member.display_name}: {e}", about=member)
+        finally:
+            self.registration_dialogs.pop(member.id, None)
+
+    async def finish_session(self, guild: discord.Guild, member: discord.abc.Snowflake, status: str):
+        """Завершает активную сессию регистрации участника со статусом status."""
+        from database.models import RegistrationSession
+        from tortoise import timezone
+
+        await RegistrationSession.filter(guild_id=guild.id, member_id=member.id, status="active").update(
+            status=status, updated_at=timezone.now()  # update() не обновляет auto_now, а от него считается пауза
+        )
+
+    async def report_interrupted_sessions(self):
+        """
+        Считает активные сессии, срок ответа по которым истёк, пока бот был выключен.
+        Они не закрываются: проверка участников продолжит их с повторным вопросом.
+        """
+        from database.models import RegistrationSession
+        from tortoise import timezone
+
+        interrupted = await RegistrationSession.filter(status="active", expires_at__lte=timezone.now()).count()
+        if interrupted:
+            logger.info("Сессий регистрации, прерванных простоем бота: %d — будут продолжены", interrupted)
+
+    async def start_registration_dialog(
+        self, member: discord.Member, guild: discord.Guild, unknown_role: discord.Role, restart: bool = False
+    ):
+        """
+        Диалог в личке: запрос имени, фамилии и группы.
+        Состояние хранится в registration_sessions: активная сессия продолжается
+        без повторного приветствия, restart=True начинает диалог заново.
+        Если срок ответа истёк, пока бот был выключен, студент получает
+        последний вопрос повторно и новый срок.
+        """
+        from database.models import RegistrationSession
+        from tortoise import timezone
+
         intro = (
             "👋 Привет! Добро пожаловать!\n"
             "Введи свои данные в формате: `ИМЯ ФАМИЛИЯ ГРУППА`\n"
             "Пример: Иван Иванов ГР-01\n"
             "Напиши `отмена`, чтобы прервать."
         )
-        await member.send(intro)
 
-        def check(m: discord.Message):
-            return m.author == member and isinstance(m.channel, discord.DMChannel)
+        session = await RegistrationSession.get_or_none(guild_id=guild.id, member_id=member.id)
+        resumed = not restart and session is not None and session.status == "active"
+        interrupted = resumed and session.expires_at <= timezone.now()
+
+        attempts = REGISTRATION_ATTEMPTS
+        # Подсказка бота при опечатке: (имя, фамилия, группа) — принимается ответом «да»
+        suggestion = None
+        typed = None
+        if resumed:
+            attempts = session.attempts_left
+            state = session.suggestion or {}
+            suggestion = tuple(state["suggestion"]) if state.get("suggestion") else None
+            typed = tuple(state["typed"]) if state.get("typed") else None
+
+        async def save(status: str = "active"):
+            """Сохраняет состояние диалога; срок ответа отсчитывается заново."""
+            session.status = status
+            session.attempts_left = attempts
+            session.suggestion = {"suggestion": suggestion, "typed": typed} if suggestion else None
+            session.expires_at = timezone.now() + timedelta(seconds=REGISTRATION_TIMEOUT)
+            await session.save()
+
+        if session is None:
+            session = RegistrationSession(guild_id=guild.id, member_id=member.id)
+        if not resumed:
+            await save()
+            await member.send(intro)
+        elif interrupted:
+            await save()
+            await member.send(
+                "⏳ Бот был недоступен, продолжим регистрацию.\n" + _pending_question(intro, attempts, suggestion, typed)
+            )
+
+        first_prompt = True
+        while attempts > 0 or suggestion:
+            if not first_prompt:
+                await save()
+            first_prompt = False
 
-        attempts = 3
-        while attempts > 0:
+            timeout = max((session.expires_at - timezone.now()).total_seconds(), 0.0)
             try:
-                msg = await self.bot.wait_for("message", check=check, timeout=300.0)
+                msg = await self.dm_router.wait_for_message(member.id, timeout=timeout)
             except asyncio.TimeoutError:
+                await save("timeout")
                 await member.send("⏰ Время истекло. Напиши `!verify`, чтобы попробовать снова.")
-                await self.log_action(guild, f"⏰ {member.display_name} не завершил регистрацию (таймаут).")
+                await self.log_action(guild, f"⏰ {member.display_name} не завершил регистрацию (таймаут).", about=member, kind="registration.timeout")
                 return
 
             content = msg.content.strip()
             if content.lower() in ("отмена", "cancel", "stop"):
-                await member.send("🚫 Регистрация отменена.")
-                await self.log_action(guild, f"🚫 {member.display_name} отменил регистрацию.")
+                await save("cancelled")
+                await member.send("🚫 Регистрация отменена. Напиши `!verify`, чтобы начать заново.")
+                await self.log_action(guild, f"🚫 {member.display_name} отменил регистрацию.", about=member, kind="registration.cancelled")
                 return
 
-            parts = content.split()
-            if len(parts) < 3:
-                attempts -= 1
-                await member.send(f"❌ Неверный формат. Осталось попыток: {attempts}.")
-                await self.log_action(guild, f"⚠️ {member.display_name} ввёл неправильный формат. Осталось попыток: {attempts}.")
+            pending, suggestion = suggestion, None
+            if pending and content.lower() in ("да", "yes", "+"):
+                first_name, last_name, group = pending
+            elif pending and typed and content.lower() in ("нет", "no", "-"):
+                # Отказ от подсказки имени — регистрируем так, как ввёл студент
+                first_name, last_name, group = typed
+            elif attempts <= 0:
+                break
+            elif pending and content.lower() in ("нет", "no", "-"):
+                await member.send(f"✏️ Хорошо, введи данные заново. Осталось попыток: {attempts}.")
                 continue
+            else:
+                parts = content.split()
+                if len(parts) < 3:
+                    attempts -= 1
+                    await member.send(f"❌ Неверный формат. Осталось попыток: {attempts}.")
+                    await self.log_action(guild, f"⚠️ {member.display_name} ввёл неправильный формат. Осталось попыток: {attempts}.", about=member)
+                    continue
 
-            first_name, last_name, *group_parts = parts
-            group = " ".join(group_parts).strip()
+                first_name, last_name, *group_parts = parts
+                group = " ".join(group_parts).strip()
+
+                group_exists, student_exists = await roster.lookup_student(first_name, last_name, group)
+                if not group_exists:
+                    attempts -= 1
+                    typed = None
+                    closest = await roster.suggest_group(group)
+                    if closest:
+                        suggestion = (first_name, last_name, closest)
+                        await member.send(
+                            f"⚠️ Группа '{group}' не найдена. Возможно, ты имел в виду **{closest}**? "
+                            f"Ответь `да`, чтобы продолжить с ней, или введи данные заново. Осталось попыток: {attempts}."
+                        )
+                    else:
+                        await member.send(f"⚠️ Группа '{group}' не найдена. Попробуй снова.")
+                    await self.log_action(guild, f"⚠️ {member.display_name} указал неизвестную группу '{group}'. Осталось попыток: {attempts}.", about=member)
+                    continue
 
-            if add_or_check_student(first_name, last_name, group):
+                if not student_exists:
+                    closest = await roster.suggest_student(first_name, last_name, group)
+                    if closest:
+                        suggestion = (*closest, group)
+                        typed = (first_name, last_name, group)
+                        await member.send(
+                            f"🔎 В списке группы **{group}** есть **{closest[0]} {closest[1]}**. Это ты? "
+                            f"Ответь `да` или `нет` (тогда запишу как «{first_name} {last_name}»)."
+                        )
+                        continue
+
+            if await roster.add_or_check_student(first_name, last_name, group):
                 await self.assign_group_role_and_channels(guild, member, first_name, last_name, group, unknown_role)
+                await save("registered")
                 await member.send(f"✅ Ты успешно зарегистрирован в группе **{group}**.")
-                await self.log_action(guild, f"✅ {member.display_name} добавлен в группу {group}.")
+                await self.log_action(
+                    guild, f"✅ {member.display_name} добавлен в группу {group}.", about=member,
+                    kind="registration.registered", group=group, first_name=first_name, last_name=last_name,
+                )
                 return
             else:
                 attempts -= 1
                 await member.send(f"⚠️ Группа '{group}' не найдена. Попробуй снова.")
-                await self.log_action(guild, f"⚠️ {member.display_name} указал неизвестную группу '{group}'. Осталось попыток: {attempts}.")
+                await self.log_action(guild, f"⚠️ {member.display_name} указал неизвестную группу '{group}'. Осталось попыток: {attempts}.", about=member)
 
-        await member.send("❌ Попытки закончились. Ты останешься в 'Неизвестные'.")
-        await self.log_action(guild, f"❌ {member.display_name} не прошёл регистрацию после 3 попыток.")
+        await save("failed")
+        await member.send("❌ Попытки закончились. Ты останешься в 'Неизвестные'. Напиши `!verify`, чтобы попробовать снова.")
+        await self.log_action(
+            guild, f"❌ {member.display_name} не прошёл регистрацию после {REGISTRATION_ATTEMPTS} попыток.", about=member,
+            kind="registration.failed",
+        )
 
     async def assign_group_role_and_channels(
         self, guild: discord.Guild, member: discord.Member, first_name: str, last_name: str, group: str, unknown_role: discord.Role
     ):
         """Создание роли, категории и каналов для группы."""
         group_role = await self.get_or_create_role(guild, group)
-        await member.add_roles(group_role)
-        if unknown_role in member.roles:
-            await member.remove_roles(unknown_role)
+        # member мог быть прочитан до начала диалога; роли, выданные за это время, не должны пропасть
+        member = await current_member(member) or member
+        await self.roles.apply(member, add=[group_role], remove=[unknown_role], reason="Регистрация в группе")
 
         # Категория
         category = discord.utils.get(guild.categories, name=group)
@@ -351,13 +774,14 @@ class EventsCog(commands.Cog):
                 overwrites=overwrites,
                 topic=str(member.id)
             )
-            await self.log_action(guild, f"👤 Создан личный канал {personal_channel.mention} для {member.display_name}.")
+            await self.personal_channels.assign(guild, member.id, personal_channel)
+            await self.log_action(guild, f"👤 Создан личный канал {personal_channel.mention} для {member.display_name}.", about=member)
             await self.send_help_message(personal_channel, member, is_personal=True)
         else:
             # ⚠️ Новый лог и вызов интерактивного выбора
-            await self.log_action(guild, f"⚠️ Личный канал {personal_channel.name} уже существует для {member.display_name}.")
+            await self.log_action(guild, f"⚠️ Личный канал {personal_channel.name} уже существует для {member.display_name}.", about=member)
             feedback = await self.get_or_create_feedback_channel(guild)
-            view = ChannelConflictView(member, category, personal_channel, feedback)
+            view = ChannelConflictView(member, category, personal_channel, feedback, self.personal_channels)
             await feedback.send(
                 f'⚠️ Текстовый канал "{member.display_name}" в категории "{category.name}" уже существует.\n'
                 f'Выберите действие:',
@@ -402,26 +826,24 @@ class EventsCog(commands.Cog):
             await self.log_action(guild, "📩 Канал #неизвестные найден, права доступа обновлены.")
 
     async def get_or_create_feedback_channel(self, guild: discord.Guild) -> discord.TextChannel | None:
-        """Возвращает (или создаёт) канал обратной связи для сервера."""
-        cached = self.feedback_channels.get(guild.id)
-        if cached and cached.guild:
-            return cached
-
-        channel = await ensure_feedback_channel(guild)
-        if channel:
-            self.feedback_channels[guild.id] = channel
-        return channel
-
-    async def log_action(self, guild: discord.Guild, message: str) -> None:
-        """Отправляет событие в канал обратной связи (с запасным логированием)."""
-        channel = await self.get_or_create_feedback_channel(guild)
-        if channel:
-            try:
-                await channel.send(message)
-                return
-            except Exception:
-                pass
-        await send_feedback_message(guild, message)
+        """Возвращает (или создаёт) канал обратной связи для сервера (общий реестр bot.feedback_channels)."""
+        return await feedback_channels.resolve(guild)
+
+    async def log_action(
+        self, guild: discord.Guild, message: str, about: discord.abc.Snowflake | None = None,
+        kind: str = "log", **details,
+    ) -> None:
+        """
+        Добавляет событие в буферизованный лог канала обратной связи (с запасным логированием)
+        и в журнал аудита.
+        about — участник, к которому относится событие (упомянутые <@id> учитываются сами):
+        при его выходе сообщение будет удалено.
+        kind и details — тип события и дополнительные поля записи аудита.
+        """
+        member_ids = referenced_member_ids(message, [about])
+        subject = about if about is not None else (next(iter(member_ids)) if len(member_ids) == 1 else None)
+        self.audit.record(guild, kind, subject=subject, text=message, **details)
+        await self.feedback_log.log(guild, message, member_ids)
 
 async def setup(bot: commands.Bot):
     """Extension entry point for discord.py."""
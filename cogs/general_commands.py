@@ -20,8 +20,48 @@ class GeneralCommands(commands.Cog):
 
     @commands.command(aliases=["подтвердиться", "верифицируйся", "verify_me"])
     async def verify(self, ctx: commands.Context) -> None:
-        # TODO: реализовать реальную верификацию
-        await ctx.send("🔒 Команда верификации пока в разработке. Свяжитесь с модератором.")
+        """
+        Заново запускает регистрацию в ЛС (после таймаута, отмены или неудачных попыток).
+        Использование: !verify — на сервере или в личных сообщениях бота.
+        """
+        from database.models import RegistrationSession
+
+        events = self.bot.get_cog("EventsCog")
+        if events is None:
+            await ctx.send("❗ Модуль событий не загружен.")
+            return
+
+        guild = ctx.guild
+        if guild is None:
+            # В ЛС: сервер последней сессии регистрации, иначе первый общий сервер
+            session = await RegistrationSession.filter(member_id=ctx.author.id).order_by("-updated_at").first()
+            guild = self.bot.get_guild(session.guild_id) if session else None
+            if guild is None and ctx.author.mutual_guilds:
+                guild = ctx.author.mutual_guilds[0]
+        if guild is None:
+            await ctx.send("❗ Не нашёл сервер для регистрации. Напиши `!verify` в любом канале сервера.")
+            return
+
+        member = guild.get_member(ctx.author.id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(ctx.author.id)
+            except discord.NotFound:
+                await ctx.send("❗ Ты не состоишь на сервере.")
+                return
+
+        unknown_role = await events.get_or_create_role(guild, "Неизвестные")
+        if unknown_role not in member.roles:
+            await ctx.send("✅ Ты уже зарегистрирован.")
+            return
+        if not events.spawn_registration_dialog(member, guild, unknown_role, restart=True):
+            await ctx.send("ℹ️ Регистрация уже идёт — ответь на последнее сообщение бота в ЛС.")
+            return
+        await events.log_action(
+            guild, f"🔁 {member.display_name} заново начал регистрацию (!verify).", about=member, kind="registration.verify"
+        )
+        if ctx.guild is not None:
+            await ctx.send(f"📩 {member.mention}, написал тебе в личные сообщения.")
 
 
 class HelpCog(commands.Cog):
@@ -46,7 +86,8 @@ class HelpCog(commands.Cog):
             value=(
                 "`!info` — справка о боте.\n"
                 "`!ping` — измерение задержки соединения.\n"
-                "`!help` — текущее меню помощи."
+                "`!help` — текущее меню помощи.\n"
+                "`!verify` — пройти регистрацию заново (в ЛС)."
             ),
             inline=False,
         )
@@ -75,7 +116,12 @@ class HelpCog(commands.Cog):
                 name="🏷️ Управление группами",
                 value=(
                     "`!addgroup <название>` — создать учебную группу.\n"
-                    "`!removegroup <название>` — удалить учебную группу."
+                    "`!removegroup <название>` — удалить учебную группу.\n"
+                    "`!rosterimport` — загрузить список студентов из Excel в базу.\n"
+                    "`!rosterexport` — выгрузить список студентов из базы в Excel.\n"
+                    "`!rostercheck` — сверить список, базу и участников сервера.\n"
+                    "`!dialogs` — число открытых диалогов регистрации.\n"
+                    "`!audit @user [период]` — журнал действий по участнику."
                 ),
                 inline=False,
             )
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import logging
+
 import discord
 from discord import PermissionOverwrite, ui
 
+logger = logging.getLogger(__name__)
+
 
 class ChannelConflictView(ui.View):
     """
@@ -17,12 +21,14 @@ class ChannelConflictView(ui.View):
         category: discord.CategoryChannel,
         existing_channel: discord.TextChannel,
         feedback_channel: discord.TextChannel | None = None,
+        personal_channels=None,
     ):
         super().__init__(timeout=None)
         self.member = member
         self.category = category
         self.existing_channel = existing_channel
         self.feedback_channel = feedback_channel  # чтобы избежать AttributeError
+        self.personal_channels = personal_channels  # utils.personal_channels.PersonalChannelIndex
 
     async def _delete_original_message(self, interaction: discord.Interaction) -> None:
         """Удаляет исходное сообщение с кнопками (если возможно)."""
@@ -52,16 +58,22 @@ class ChannelConflictView(ui.View):
             await self._delete_original_message(interaction)
             return
 
-        # сначала очищаем старые topic с этим ID
-        for channel in self.category.text_channels:
+        # сначала очищаем topic старого канала с этим ID (по индексу, без обхода категории)
+        if self.personal_channels is not None:
+            old_channel = await self.personal_channels.find(self.member.guild, self.member.id)
+            old_channels = [old_channel] if old_channel else []
+        else:
+            old_channels = [
+                channel for channel in self.category.text_channels
+                if channel.topic and channel.topic.strip() == str(self.member.id)
+            ]
+        for channel in old_channels:
             if channel.topic and channel.topic.strip() == str(self.member.id):
                 try:
                     await channel.edit(topic=None)
-                    print(
-                        f"⚙️ Очистил topic у старого канала {channel.name} (ID совпадал)."
-                    )
+                    logger.info("Очищен topic у старого канала %s (ID совпадал)", channel.name)
                 except Exception as error:
-                    print(f"⚠️ Не удалось очистить topic у {channel.name}: {error}")
+                    logger.warning("Не удалось очистить topic у %s: %s", channel.name, error)
 
         base_name = self.member.display_name.lower().replace(" ", "-")
         new_name = base_name
@@ -87,6 +99,8 @@ class ChannelConflictView(ui.View):
             overwrites=overwrites,
             topic=str(self.member.id),
         )
+        if self.personal_channels is not None:
+            await self.personal_channels.assign(self.member.guild, self.member.id, new_channel)
 
         await interaction.response.send_message(
             f"✅ Создан новый личный канал {new_channel.mention}.",
@@ -11,9 +11,58 @@ load_dotenv()
 # Discord токен
 TOKEN = os.getenv('DISCORD_TOKEN')
 
-# Путь к Excel-файлу со студентами
+# Путь к списку студентов: *.xlsx, *.parquet или каталог с CSV (формат — по расширению)
 FILE_PATH = os.getenv('READER_FILE_PATH', os.path.join(os.getcwd(), 'students.xlsx'))
 
+# Окно (в секундах), за которое изменения списка студентов собираются в одну запись файла
+ROSTER_FLUSH_INTERVAL = float(os.getenv('ROSTER_FLUSH_INTERVAL', '0.5'))
+
+# Сколько серверов инициализируется одновременно при запуске (on_ready)
+GUILD_BOOTSTRAP_CONCURRENCY = int(os.getenv('GUILD_BOOTSTRAP_CONCURRENCY', '4'))
+
+# Сколько диалогов регистрации в ЛС ведётся одновременно (остальные ждут очереди)
+REGISTRATION_DIALOG_LIMIT = int(os.getenv('REGISTRATION_DIALOG_LIMIT', '25'))
+# Через сколько часов бот снова сам предлагает регистрацию тем, чей диалог
+# завершился без результата (таймаут, отмена, попытки закончились); !verify — в любой момент
+REGISTRATION_RETRY_COOLDOWN = float(os.getenv('REGISTRATION_RETRY_COOLDOWN', '24'))
+
+# Сколько запросов на смену ролей участников одного сервера выполняется параллельно
+ROLE_EDIT_CONCURRENCY = int(os.getenv('ROLE_EDIT_CONCURRENCY', '5'))
+
+# Как часто (в секундах) накопленные строки лога отправляются в feedback-канал одним сообщением
+FEEDBACK_FLUSH_INTERVAL = float(os.getenv('FEEDBACK_FLUSH_INTERVAL', '2.0'))
+
+# Выключатель feedback-канала: после стольких ошибок подряд лог копится локально
+FEEDBACK_BREAKER_THRESHOLD = int(os.getenv('FEEDBACK_BREAKER_THRESHOLD', '3'))
+# Через сколько секунд пробовать снова (одна пробная отправка)
+FEEDBACK_BREAKER_RESET = float(os.getenv('FEEDBACK_BREAKER_RESET', '30'))
+# Сколько записей лога хранить в локальной очереди на сервер (старые вытесняются)
+FEEDBACK_SPOOL_SIZE = int(os.getenv('FEEDBACK_SPOOL_SIZE', '1000'))
+
+# Журнал аудита: события пишутся в базу пачками до AUDIT_BATCH_SIZE штук,
+# не реже раза в AUDIT_FLUSH_INTERVAL секунд
+AUDIT_BATCH_SIZE = int(os.getenv('AUDIT_BATCH_SIZE', '500'))
+AUDIT_FLUSH_INTERVAL = float(os.getenv('AUDIT_FLUSH_INTERVAL', '1.0'))
+
+# Журнал работы: JSON-строки в файле с ротацией (запись в фоновом потоке)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_FILE = os.getenv('LOG_FILE', 'logs/bot.jsonl')
+# Размер файла (в байтах), после которого он ротируется, и сколько старых файлов хранить
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+# Дублировать журнал в консоль (обычным текстом)
+LOG_CONSOLE = os.getenv('LOG_CONSOLE', '1') == '1'
+
+# Профиль кэша участников:
+# full    — списки участников всех серверов загружаются при старте и держатся в памяти;
+# minimal — в кэше только участники, проявившие активность, списки читаются постранично по запросу
+MEMBER_CACHE_PROFILE = os.getenv('MEMBER_CACHE_PROFILE', 'full')
+CHUNK_GUILDS_AT_STARTUP = os.getenv(
+    'CHUNK_GUILDS_AT_STARTUP', '1' if MEMBER_CACHE_PROFILE == 'full' else '0'
+) == '1'
+# Сколько сообщений держать в кэше (0 — не кэшировать)
+MAX_MESSAGES = int(os.getenv('MAX_MESSAGES', '1000' if MEMBER_CACHE_PROFILE == 'full' else '100'))
+
 # Конфигурация Tortoise ORM + Aerich для миграций
 TORTOISE_CONFIG = {
     "connections": {
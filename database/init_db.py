@@ -3,11 +3,22 @@ database/init_db.py
 Инициализация Tortoise ORM при запуске бота.
 """
 
+import logging
+
 from tortoise import Tortoise
 from config import TORTOISE_CONFIG
 
+logger = logging.getLogger(__name__)
+
+_initialized = False
+
+
 async def init_db():
-    """Подключает базу данных и создаёт таблицы при необходимости."""
+    """Подключает базу данных и создаёт таблицы при необходимости (один раз за процесс)."""
+    global _initialized
+    if _initialized:
+        return
     await Tortoise.init(config=TORTOISE_CONFIG)
     await Tortoise.generate_schemas()
-    print("Схемы базы данных успешно сгенерированы.")
+    _initialized = True
+    logger.info("Схемы базы данных сгенерированы")
@@ -12,6 +12,7 @@ class User(models.Model):
     first_name = fields.TextField()
     last_name = fields.TextField()
     group = fields.TextField()
+    personal_channel_id = fields.BigIntField(null=True, index=True)  # личный канал студента
 
     labworks: fields.ReverseRelation["LabWork"]
 
@@ -41,3 +42,117 @@ class LabWork(models.Model):
     class Meta:
         table = "labworks"
         unique_together = ("user", "lab_number")  # одна лабораторная на одного пользователя
+
+
+class RosterEntry(models.Model):
+    """
+    Строка списка студентов (зеркало students.xlsx в базе).
+    Имена хранятся и как есть, и в casefold-виде для индексированного поиска.
+    """
+    id = fields.IntField(pk=True)
+    first_name = fields.TextField()
+    last_name = fields.TextField()
+    first_name_cf = fields.CharField(max_length=255)
+    last_name_cf = fields.CharField(max_length=255)
+    group = fields.CharField(max_length=255, index=True)
+
+    class Meta:
+        table = "roster_entries"
+        # Проверка при регистрации — один запрос по этому составному индексу
+        unique_together = ("group", "first_name_cf", "last_name_cf")
+        indexes = (("first_name_cf", "last_name_cf"),)
+
+    def __str__(self):
+        return f"{self.first_name} {self.last_name} ({self.group})"
+
+
+class GuildCheckpoint(models.Model):
+    """
+    Отметка начальной синхронизации сервера.
+    После переподключения к шлюзу обрабатываются только участники,
+    которых нет в processed_member_ids.
+    """
+    id = fields.IntField(pk=True)
+    guild_id = fields.BigIntField(unique=True)
+    last_sync_at = fields.DatetimeField(null=True)
+    processed_member_ids = fields.JSONField(default=list)
+
+    class Meta:
+        table = "guild_checkpoints"
+
+    def __str__(self):
+        return f"{self.guild_id}: {self.last_sync_at}"
+
+
+class RegistrationSession(models.Model):
+    """
+    Открытый (или завершённый) диалог регистрации в ЛС.
+    Переживает перезапуск бота: активная сессия продолжается с того же места,
+    без повторного приветствия.
+    """
+    id = fields.IntField(pk=True)
+    guild_id = fields.BigIntField()
+    member_id = fields.BigIntField()
+    status = fields.CharField(max_length=20, default="active")  # active / registered / cancelled / timeout / failed / forbidden (закрыты ЛС)
+    attempts_left = fields.IntField(default=3)
+    suggestion = fields.JSONField(null=True)  # подсказка бота: {"suggestion": [имя, фамилия, группа], "typed": [...]}
+    started_at = fields.DatetimeField(auto_now_add=True)
+    expires_at = fields.DatetimeField(index=True)  # срок ответа на текущий вопрос
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "registration_sessions"
+        unique_together = ("guild_id", "member_id")
+        # Просроченные активные сессии закрываются одним запросом по этому индексу
+        indexes = (("status", "expires_at"),)
+
+    def __str__(self):
+        return f"{self.member_id}@{self.guild_id}: {self.status}"
+
+
+class FeedbackMessage(models.Model):
+    """
+    Связь строк сообщения feedback-канала с участником, о котором они.
+    Нужна, чтобы при выходе участника убрать ровно его строки: сообщение
+    удаляется, если все его строки — только о нём, иначе его строки вырезаются правкой.
+    """
+    id = fields.IntField(pk=True)
+    guild_id = fields.BigIntField()
+    channel_id = fields.BigIntField()
+    message_id = fields.BigIntField(index=True)
+    member_id = fields.BigIntField()
+    # Строки [line_start, line_end) сообщения из line_count строк.
+    # NULL — запись до построчного индекса: относится ко всему сообщению
+    line_start = fields.IntField(null=True)
+    line_end = fields.IntField(null=True)
+    line_count = fields.IntField(null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "feedback_messages"
+        indexes = (("guild_id", "member_id"),)
+
+    def __str__(self):
+        return f"{self.message_id} → {self.member_id}"
+
+
+class AuditEvent(models.Model):
+    """
+    Структурированная запись о действии бота или администратора.
+    actor — кто сделал (None — сам бот), subject — над кем (участник).
+    """
+    id = fields.IntField(pk=True)
+    guild_id = fields.BigIntField()
+    actor_id = fields.BigIntField(null=True)
+    subject_id = fields.BigIntField(null=True)
+    kind = fields.CharField(max_length=64)  # member.join, registration.registered, group.created, log, ...
+    payload = fields.JSONField(null=True)
+    created_at = fields.DatetimeField()
+
+    class Meta:
+        table = "audit_events"
+        # !audit @user [since] — поиск по subject_id и времени; обзор сервера — по guild_id и времени
+        indexes = (("guild_id", "created_at"), ("subject_id", "created_at"))
+
+    def __str__(self):
+        return f"{self.created_at:%Y-%m-%d %H:%M} {self.kind} ({self.subject_id})"
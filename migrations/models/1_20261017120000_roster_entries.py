@@ -0,0 +1,53 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "roster_entries" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "first_name" TEXT NOT NULL,
+    "last_name" TEXT NOT NULL,
+    "first_name_cf" VARCHAR(255) NOT NULL,
+    "last_name_cf" VARCHAR(255) NOT NULL,
+    "group" VARCHAR(255) NOT NULL,
+    CONSTRAINT "uid_roster_entr_group_1fcbc2" UNIQUE ("group", "first_name_cf", "last_name_cf")
+) /* Строка списка студентов (зеркало students.xlsx в базе). */;
+CREATE INDEX IF NOT EXISTS "idx_roster_entr_group_e584b7" ON "roster_entries" ("group");
+CREATE INDEX IF NOT EXISTS "idx_roster_entr_first_n_1a4aa3" ON "roster_entries" ("first_name_cf", "last_name_cf");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "roster_entries";"""
+
+
+MODELS_STATE = (
+    "eJztWm1P2zoU/itRPoHEUJu2tHffCpQNDdor6N2msclyE6dEJE6XOIJq4r9f23Gakzjpba"
+    "vBgJsvITkvzvFzHPuch/4yg9Ahfnx4gWdfwujOfG/8MikOCL8pqw4MEy8WuUIIGJ750tbH"
+    "s3tuJIV4FrMI24zLXezHhIscEtuRt2BeSIX196TVtSxx7bTktS2vM3kdiGv3KNUaQAFNiT"
+    "Rq5fKupckdeS99uz2j7FAYyErV7Xykbkequ/LaA+OB93SsQzFfJ7T5hD06f3tTS6j3MyGI"
+    "hXPCbknEJ3hzYyYxvzuQOUc0CWb86ccP/uxRhzyQWBiJx8Udcj3iO4U15TnCU8oRWy6k7J"
+    "yyM2kosJwhO/STgObGiyW7DenK2qNMSOeEkggzIoZnUSIWGU18X63HbN2l8ecmaYjAxyEu"
+    "TnyxVIV3GkAuMxEaT6boejRFyNSWceYB0q9EdkjFJ8BDjeXs5yKEd1a72+8OOkfdgQBPiF"
+    "aS/mP66hyY1FHCM56aj1KPGU4tJMY5qCARm4NbdPpvkDNI16GcCXKY8w3g1eCc4+p6PkFJ"
+    "5OuoTslDDazQpwQqD3UDUNXCfCmYrgFsOvo6FSMHcfzTF4Lx5+HVycfh1d7l8Ou+1CyV5m"
+    "Iy/pCZh/xsSA+N8cnF5LiEecwwS2Id8ZNbHFUjnnvshPdOi9iEG6y8d7VN2AL7O9hlO8R8"
+    "quUf4AfkEzpnt2LNt9akLkuU1dovpURpLKkqfQ6EODNs3231OQCf5nPY/nNgBNv84EW7bE"
+    "VVvk0OdtiSklngMY4OwkzH/5TjxryA1GxOJd8S/o5yPsxuXuOpGxHsTKi/VCtlXXrOL0fX"
+    "0+Hl34UcnQ6nI6GxCvnJpHtHpS1qNYjx5Xz60RCPxrfJeCThDWM2j+Qbc7vpN1PEhBMWIh"
+    "reI+yAAjCTZqgVMp8sRF52yXvRs8n6S8l6hhFIu4pe33MDEsd4TlBVz3LszWsr62r/nSrs"
+    "F7bzqgL7L8vqdPpWq3M06HX7/d6gtaq0ddW6kvv4/IOouguJ1svwDE/7FlNK/J3zUfRv8r"
+    "FrPkT/X5mE2gwAj6bRVIgKisS9q+znM4KliO5ZGBFvTj+RpQT5nEeEqU0qQFXE3T9qmFcG"
+    "7mO2ejJp/t1F+H7FKcFFxefOZ0xY2ikOr0+GpyNTIix6j3scOagAtdCEVliSrGx1VWAFZQ"
+    "mmfG931CxEzAr1K34YkWhEWbQ0K9hUqD5Yx6hG0hARbumRbXhVyPS1AKOHAe2Y0oFp06pY"
+    "yXaN0TacobEn//ZzKxUBBn1x2hETI2aJw2cXHz748YOhBgD0ZQuOtV/DtL7RyX6n4q4tg+"
+    "3YGoWgQoYvhbywC6aSTstN3zUwtACxAeKHGNgHBR/LsHFM3NB33gF2YwCBMsDDrPBaEDoE"
+    "FYNcDLQUQhLdgfyJvHYUsCC1pC7B9VT2PAqTRbrVRjFD4ltFtpuS2+C5TG/fbGLf8N/PxX"
+    "/nydiOqYVez8cdviFmZLXot8G94NTAvgPs2uazKVWuOb4J+Eu8d6+3CfHd69Uz30JXs9C3"
+    "BLzs1+C9Gd7gXN4M6JXDUyH8rOfl0wCsdZx/pkGSbWlFZ5S1q/Utkej4tuiE2jYoC2HdmR"
+    "antl47KgWoxbVSVPUAcCDXOPViO4ycA9hukHUleq+9SVlb3yHAUlurkLPfhVS3TA0q1c1A"
+    "8wuWP1jBO+lS2ZraLfr9Hm7xJQD9zIxu00A1DdT/Cfaa8rIe8icvL98c3FsUm4UfMq5+RV"
+    "w6BJTn2acr4mM5YT0b+g+WX2ditH99PP7+evzxX6PuWYI="
+)
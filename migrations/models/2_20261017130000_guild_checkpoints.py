@@ -0,0 +1,54 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "guild_checkpoints" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "guild_id" BIGINT NOT NULL UNIQUE,
+    "last_sync_at" TIMESTAMP,
+    "processed_member_ids" JSON NOT NULL
+) /* Отметка начальной синхронизации сервера. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "guild_checkpoints";"""
+
+
+MODELS_STATE = (
+    "eJztWm1vm0gQ/iuIT62URg7GsXs6neQkbptr65wS37VqWqEFFgcFLy4sSqw2//32DTOw4L"
+    "OtvNXHF2xmZ5bZZ5bZZ4f9Yc5iH0fp/tssjPzjK+xdz+OQUPM344dJ0AyzP00qe4aJ5vNC"
+    "gQsociNhM+XKjrfUFq3ITWmCPN57gKIUM5GPUy8J5zSMCTf7mnXsA8yvtsWvXU9ce0CCxL"
+    "VjiB9f3ojmfvG/6wqJB3REp93Xwsw+EDeDotmWT+gAVR/ogK7tQyAfwO5gF5Ym6exzBPzY"
+    "YxCEZLrrg/1KxOiC4hnK0JXKckSBZtkDcumaDYCQI8UAgV7VfTuQXSPp7aBqJ4dndw3wiA"
+    "PoeiFRGIjh2S4Yage4YRVjU49WocNabOQYsFTqVsOo+rC0eEizwZ6ENO+l+iTpvnTT7sEJ"
+    "o+aTFFnGPIk9nKbYd2Z45uLECf1UzM2MhN8z7NB4iukVTtgMvfzGxCHx8S1O89v5tROEOP"
+    "JLGSL0eQdC7tDFXMhOCX0jFPm0dx0vjrIZKZTnC3oVk6W2SihTTHCCKObd0yTjGYJkUaSy"
+    "Sp40pKeFinQR2Pg4QFnE8wy3lg4UMtNxxmcT52I0cRxTy0G5BXhTlciLCc9fIpvx0U+5C6"
+    "+sA7tvD7qH9oCpCDeXkv6dfHQBjDQU8Iwn5p1oRxRJDYFxAapMoXXQHoXTRnSh1X9jnCP6"
+    "3EF+bVndbt/qdA8HPbvf7w06S7T1plWwH52+5cgzhZitRHKtykNRQB+hlDrpgngOojr8Jw"
+    "w8Gs5wfQCqtpUg+Mp4P/+zRkgU4MuI5CpFSIrl9BFisgLeyenH0cVk+PEv3v0sTb9HArDh"
+    "ZMRbLCFdVKQvDl+W47HsxPh0Onln8Fvjy9l4JNCMUzpNxBMLvckXk/uEMho7JL5xkA8xyc"
+    "W5qBTpumyoR/zPi7NxfbSb7KtRDz1q/DSiMN3qFVwn4ObvQUY8HkvDZTmAhiTd58/7w3z8"
+    "acDxKs2A8T/D8+N3w/MXH4efK9EeH384O6qGlndwxF5KvuIE1yA9coGLvOsblPiO1hJbcZ"
+    "Ou3jSzZlUJImgq4OUj5uNT1PcDcj/FyXUdK86bVrJhFtgbprQBCbYA0+hC5jQAvEzxQldT"
+    "BYwAkpiS3Nf4Qg0DwoA7QIIi6YviZoCDlbiPVU95d2doNYzp0sxS9m9PxNwhGc8J5reWRz"
+    "0hjwKBWB/cstH9EKknXrbvB+cC1yCMsJMlkY7qBN82wAptKqAyV3eLCo0+T1avgUsm9OFs"
+    "/DZXry6MZcxTimhWQ1COr1BSj3hhsRXe21ERbYsaaEnYAvkdbuLxQ9EVtrrfOhEmU3rF53"
+    "xnRejyQFmdKldRLZZoqrwOGPucbWz0OgCb9nXY/HWgGHls4XW2SUV1tm0MtkhJmTsLKUNn"
+    "i71y1fYe9srPbtVNMPLPSLRQM+UX2TyrSb1y75zNeVy2iXvZso36c4l6TclEea/n3BlOU7"
+    "Zb3rhAWW+/FcN+Zpn3aWqVOZ7eFSIER1vHo2zfxmPbePD9f20QGiMALNqNpkJUK/yVAdbR"
+    "fRMnOJyS93ghQD5lHiHi4RpQVeHub9XNLwbuXT57cmnx3iXoZllTgpOKjZ2NGFO5UxxeHA"
+    "9PRubd01RSz9lihJMRocnCrKmmwua9VRXVRCg6mGmGeJO6Kqz0wS/g8Eu7+lQdgKrkQYPS"
+    "JjVD44X4BR+ulQcI7Itd9ZE4pZnPRpfu30bpbf7tFpQvO7Cvlw2V1h0drDpcID+Pe1U/cp"
+    "dLBxKAmwEYCvxurw44lByUpwiU/xADb69kYxkeSnEQR/4rUN0YQKAMcOOWHgtch6AiEIuB"
+    "FkJYRPdh/URcuwpYEFrcFODmUvY0ibO5TLVJSh3+rjpeIIvb4L5a3r5cR7+tfz9W/bsIxm"
+    "aVWmj1eLXDHaqMLCf9JriXjFrYt4BdSz7rlso1w52Av1L37vXWKXz3es2Vb97WMNE3BLxq"
+    "1+K9Ht5gXV4P6KXBQyH8qOvlwwD8TI6aiG1pzc4o3642b4n4jm+TY9YeoIWQd6ojqzp3hG"
+    "dZ+/VU1La0jgLjJEy9OPH34HYDr6LovYN1aG3zDgFSbY0h5+dCGs5jt6i0J4GfG4P35VTZ"
+    "uLRbtmtPA29Z0W03UO0G6v8EewO9bIb8wenlzsG9AdksHWRcniKuLALK8s37cxwhMWA9Gv"
+    "qB5V8zMNqnj7v75+N3/wI488It"
+)
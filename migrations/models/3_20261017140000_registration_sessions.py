@@ -0,0 +1,69 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "registration_sessions" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "guild_id" BIGINT NOT NULL,
+    "member_id" BIGINT NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "attempts_left" INT NOT NULL,
+    "suggestion" JSON,
+    "started_at" TIMESTAMP NOT NULL,
+    "expires_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    CONSTRAINT "uid_registratio_guild_i_717a17" UNIQUE ("guild_id", "member_id")
+) /* Открытый (или завершённый) диалог регистрации в ЛС. */;
+CREATE INDEX IF NOT EXISTS "idx_registratio_expires_81565e" ON "registration_sessions" ("expires_at");
+CREATE INDEX IF NOT EXISTS "idx_registratio_status_a3993b" ON "registration_sessions" ("status", "expires_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "registration_sessions";"""
+
+
+MODELS_STATE = (
+    "eJztXG1v2zYQ/iuCP7WAG9iSHLvFMMBJ3TZb6wyJtxZ9gUBLlCNEllyJWmJ0+e/jm6yTKH"
+    "m2ljiOqy9OTN6RvOco8vjw5B+teehgPz56m3i+c3qF7etF6AWk9Ur70QrQHNN/qkTaWgst"
+    "FpkAKyBo6nOdGRO27JU0r0XTmETIZq27yI8xLXJwbEfegnhhwNS+Jh2zi9mnqbNPw+afPV"
+    "CC+GdH438c8YVX97P/jSkvsYEMb9R4ydXMLv8yyKpN0UMHiDpABjRtHoPyAWwONqErJZ0j"
+    "hoAT2hQCL5gdurFfA26dm/UhFadCWFjkKpo9UC6GZgIghKUYINArDt90RdNIjHZQ1BPmmY"
+    "YGuujCoWclEgNunjkFpnbAMPTMNtm1dB1WfCNswELIKLpRtqEr/hBqg7aANG2l2JMYvhim"
+    "2YMTRs4nUaRriyi0cRxjx5rj+RRHlufEfG4mgfc9wRYJZ5hc4YjO0C/faLEXOPgWx+nXxb"
+    "Xleth3ciuE57AGeLlFlgtedhaQN1yQTfupZYd+Mg8y4cWSXIXBSlouKDMc4AgRzJonUcJW"
+    "iCDxfbmqpIuGGGkmIoYIdBzsosRn6wzTFgPIylqWNT6fWJejiWW1lDUo1QBPqiyyw4CtX3"
+    "w1Y9bP2BBe6F2zbw6MY3NARfgwVyX9O9F1BoxQ5PCMJ607Xo8IEhIc4wxUsYSWQXvizSrR"
+    "hVr/jXGK6L6D/FLXDaOvd4zjQc/s93uDzgpttWod7CdnbxnyVCCkO5HYq1JXZND7KCZWvA"
+    "xsCxEV/tcUPOLNcbkDiroFJzhS+Sj9ZwOXSMBXHklFMpdk2+kOfLIG3snZh9HlZPjhD9b8"
+    "PI6/+xyw4WTEanReuiyUPjt+nvfHqhHt49nknca+ap/PxyOOZhiTWcR7zOQmn1tsTCghoR"
+    "WENxZyICZpcVqU83TZaqh6/LfL83G5t6v0i173bKL9o/leXOsR3MThrV/cJLCZL7UpXQOI"
+    "F8RHrL9fW7ufBgyv3AwY/zW8OH03vHj2Yfip4O3x6fvzk6JrWQMn9KFkO457DZZHVjBF9v"
+    "UNihxLqQn1sEpWrZrr82IJCtCMw8ssZvbJ0Pc9mn4Mo+uyqDitWhsNU8feUKEtgmAdRBoG"
+    "jJwGIC6TceFUEQURAQxicuWOEi+UREAYxA4wQBHhi4zNQAyWi3308pD3cEwriZi+tJKY/t"
+    "fmPreChK0JrW9NHPWIcRRwxObg5pXuJ5B65G37fnDOcHU9H1tJ5KuoTvBtBaxQpwAqHeph"
+    "hUKjT5P1e+AqEnp/Pn6bihc3xjzmMUEkKQlQTq9QVI54plEL73qhiHJEdZVFWAfrOzzE44"
+    "cKV+jufmv5OJiRKzbnO2tclzpK7xRjFVmj86rC44Cxw6KNrR4HoNM8Dts/DgQjm268Vp2l"
+    "qEy38UGNJSmZzj1C0alxVi7q3sNZee923Qgj5zzwl3KmPJHDs5zUa8/OyYL5pY7f85qN1/"
+    "fF6yWUiRy9uubOcRzT0/LWBGW5fq0Ie89W3sfhKlM87SsUBNiv7Y+8fuOPuv5g5/9SJ1R6"
+    "AGg0B02JqEL85QFW0X0TRtibBb/jJQf5jI4IBTYuAVUSd3/KZp4YuHfp7ElLs+cuQjcrTg"
+    "lOKmo7tRgTcVIcXp4OX49ad4/DpF7gmccGzsy+pDuAsF5hVcvE2usY1ggoWLHQqJtzgJT7"
+    "VHgF/FJ7Bi5nJXMp2Mq+cr4FV9viKrrXBWddBzb7XAO84wC0NAW8owHZTHFsNgB3CmlMSJ"
+    "Gq1/iGID67vHG9u0Fyws+ISi6LQU1TgA1AUjt3416lDGFxM+JZpkmI9IU8VS0UXmlAEYEa"
+    "OA6YKuKqeRtdUJLLmoA8DUy/AMkM0uqcpaDRtDc1FUK4RKQ/yEZknoKtDE3amuY8gLEbfQ"
+    "grzmyuugco6x2aCWFTzdFBrUSqmvqHd++r60CF/f8CODl8u/BoaM4OQt+aW4GfMbtiP2K1"
+    "HcfI2cOxFfo5tQb+2vA/kVsEGrV5fz/Z+wBECJ4vSEz7cEsIsspJrujtbqIbe72WQ8p5Ns"
+    "MxkYeCTVN18lr/K0Fnz4iOXWTiFNaPqCbhn9NsiN99IX43oftBrLql1/Oau/H6LmPVJ+Lk"
+    "jRIim0udQ3u2qy519iS38oJagqNRQKJlq4wJBNXttQwgF7QwlfTwNpmWKj2EM25FJiJKrs"
+    "QtskolQttkEUrSDLzKYnZgs4B1wVpMEodaFx/d+vEtpKvg2yppW88rci8P1FhJ1A2KdFJK"
+    "hIkh515RAsN0K1islBWEA5TEnEJWmXY7p6NrNoqxG/rOiyKFlAIFqc1prlswdAgqAr4YKC"
+    "6EDCRgUiv5L1lR4uA1DFcUJguxMUQxsdizatkuK+CvPaTfVcprA/mG+9oV95U5QwV3Xe4m"
+    "1NodD3BAuVKrSb8N7jmlBvYasCuLz6a0l6J4EPAXmK9ebxPqq9er5r5YXcVE3xLwol6D92"
+    "Z4g315M6BXCg+F8E73y4cBeE8OSDxRpeRklCawVB+JWA7INkkQNggLYdwpX2JXY0f4dnu/"
+    "PBQ1daUhV3vtxXYYOW143MDrQnQ1QaAsrK0+IcBQW4mQ0zfFKpIgGlSa3wbYtwjeEVNl6x"
+    "vUvF7z+wA1L1CbA1RzgPqZYK8IL6shf/Dw8uDg3iLYzL3avPpdgcImIDXf/H6BfVRx6a3+"
+    "hMHTdIySDH13//H43b8YI/IF"
+)
@@ -0,0 +1,58 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" ADD "personal_channel_id" BIGINT;
+        CREATE INDEX IF NOT EXISTS "idx_users_persona_419d14" ON "users" ("personal_channel_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_users_persona_419d14";
+        ALTER TABLE "users" DROP COLUMN "personal_channel_id";"""
+
+
+MODELS_STATE = (
+    "eJztXG1v2kgQ/isWn1qJRmCbQKvTSSSlbe5ackq4a9UXWYu9JlaMTe31JaiX/377Zjz22h"
+    "z4EkKov5CwO7PeeWZfZp8d86M1Dx3sx0dvE893Tq+wfb0IvYC0Xmk/WgGaY/pPlUhba6HF"
+    "IhNgBQRNfa4zY8KWvZLmtWgakwjZrHUX+TGmRQ6O7chbEC8MmNrXpGN2Mfs0dfZp2PyzB0"
+    "oQ/+xo/I8jvvDqfva/MeUlNpDhjRovuZrZ5V8GWbUpntABog6QAU2bx6B8AJuDTehKSeeI"
+    "IeCENoXAC2aHbuzXgFvnZs+QilMhLCxyFc0eKBddMwEQwlIMEOgVu2+6omkkejso6gnzTE"
+    "MDj+jCrmclEgNunjkFpnZAN/TMNvlo6Tqs+EbYgIWQUXSjbENX/CHUBm0BadpK8Umi+6Kb"
+    "Zg8OGDmeRJGuLaLQxnGMHWuO51McWZ4T87GZBN73BFsknGFyhSM6Qr98o8Ve4OBbHKdfF9"
+    "eW62Hfya0QnsMa4OUWWS542VlA3nBBNuynlh36yTzIhBdLchUGK2m5oMxwgCNEMGueRAlb"
+    "IYLE9+Wqki4aoqeZiOgi0HGwixKfrTNMW3QgK2tZ1vh8Yl2OJpbVUtagVAPMVFlkhwFbv/"
+    "hqxqyfsS680Ltm3xwYx+aAivBurkr6d+LRGTBCkcMznrTueD0iSEhwjDNQxRJaBu2JN6tE"
+    "F2r9N8YpovsO8ktdN4y+3jGOBz2z3+8NOiu01ap1sJ+cvWXIU4GQ7kRir0pdkUHvo5hY8T"
+    "KwLURU+F9T8Ig3x+UOKOoWnOBI5aP0nw1cIgFfeSQVyVySbac78MkaeCdnH0aXk+GHP1jz"
+    "8zj+7nPAhpMRq9F56bJQ+uz4ed4fq0a0j2eTdxr7qn0+H484mmFMZhF/YiY3+dxifUIJCa"
+    "0gvLGQAzFJi9OinKfLVkPV479dno/LvV2lX/S6ZxPtH8334lpTcBOHt35xk8BmvtSmdA0g"
+    "XhAfsef92tr9MGB45UbA+K/hxem74cWzD8NPBW+PT9+fnxRdyxo4oZOS7TjuNVgeWcEU2d"
+    "c3KHIspSbUwypZtWquz4slKEAzDi+zmNknQ9/3aPoxjK7LouK0am00TB17Q4W2CIJ1EGkY"
+    "MHIagLhMxoVTRRREBDCIyZU7SrxQEgFhEDvAAEWELzI2AzFYLvbRy0PewzGtJGL60kpi+l"
+    "+b+9wKErYmtL41cdQjxlHAEZuDm1e6n0Dqkbft+8E5w9X1fGwlka+iOsG3FbBCnQKotKuH"
+    "FQqNPk3W74GrSOj9+fhtKl7cGPOYxwSRpCRAOb1CUTnimUYtvOuFIsoR1VUWYR2s7/AQjx"
+    "8qXKG7+63l42BGrtiY76xxXeoovVOMVWSNzqsK0wFjh0UbW00HoNNMh+2nA8HIphuvVWcp"
+    "KtNtfFBjSUqmc49QdGqclYu693BW3rtdN8LIOQ/8pRwpT+TwLAf12rNzsmB+qeP3vGbj9X"
+    "3xegllInuvrrlzHMf0tLw1QVmuXyvC3rOV93G4yhRP+woFAfZr+yOv3/ijrj/Y+b/UCZUe"
+    "ABrNQVMiqhB/eYBVdN+EEfZmwe94yUE+oz1CgY1LQJXE3Z+ymScG7l06etLSbN5F6GbFKc"
+    "FBRW2nFmMiTorDy9Ph61Hr7nGY1As881jHmdmXdAcQ1iusaplYex3DGgEFKxYadXMOkHKf"
+    "Cq+AX2rPwOWsZC4FW9lXzrfgaltcRfe64KzrwGafa4B3HICWpoB3NCCbKY7NBuBOIY0JKV"
+    "L1Gt8QxGeXN653N0hO+BlRyWUxqGkKsAFIaudu3KuUISxuRjzLNAmRvpCnqoXCKw0oIlAD"
+    "+wFTRVw1b6MLSnJZE5CngekXIJlBWp2zFDSaPk1NhRAuEekPshGZp2ArXZO2pjkPoO9GH8"
+    "KKM5ur7gHKng7NhLCp5uigViJVTf3Du/fVdaDC/n8BnBy+XXg0NGcHoW/NrcDPmF2xH7Ha"
+    "jmPkbHJshX5OrYG/NvxP5BaBRm3e30/2PgARgucLEtNnuCUEWeUgV/R2N9CNvV7LIeU8m+"
+    "GYyEPBpqk6ea3/laCzZ0THLjJxCutHVJPwz2k2xO++EL+b0P0gVt3S63nN3Xh9l7HqE3Hy"
+    "RgmRzaXOoc3tqkudPcmtvKCW4GgUkGjZKmMCQXV7LQPIBS1MJT28TaalSg/hjFuRiYiSK3"
+    "GLrFKJ0DZZhJI0A6+ymB3YLGBdsBaTxKHWxUe3fnwL6Sr4tkra1vOK3MsDNVYSdYMinZQS"
+    "YaLLuVeUQDfdChYrZQVhByUxp5BVpt3O6eiajWLshr7zokghpUBBanOaeyzoOgQVAV8MFB"
+    "dCBhIwqZX8l6wocfAahisKk4XYGKKYWGyuWrbLCvhrD+l3lfLaQL7hvnbFfWXOUMFdl7sJ"
+    "tXbHAxxQrtRq0G+De06pgb0G7MrisyntpSgeBPwF5qvX24T66vWquS9WVzHQtwS8qNfgvR"
+    "neYF/eDOiVwkMhvNP98mEA3pMDEk9UKTkZpQks1UcilgOyTRKEDcJCGHfKl9jV2BG+3d4v"
+    "D0VNXWnI1V57sR1GThseN/C6EF1NECgLa6tPCDDUViLk9E2xiiSIBpXmtwH2LYJ3xFDZ+g"
+    "Y1r9f8PkDNC9TmANUcoH4m2CvCy2rIHzy8PGi4FzRsCwPk187pr2jggZL6D3O93yL6z71r"
+    "vvqhh4K7pOab3y+wjyqyENTflHiaM0XJTr+7/wPS3b8PiW9v"
+)
@@ -0,0 +1,69 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "feedback_messages" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "guild_id" BIGINT NOT NULL,
+    "channel_id" BIGINT NOT NULL,
+    "message_id" BIGINT NOT NULL,
+    "member_id" BIGINT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL
+) /* Связь сообщения feedback-канала с участником, о котором оно. */;
+CREATE INDEX IF NOT EXISTS "idx_feedback_me_message_87aef9" ON "feedback_messages" ("message_id");
+CREATE INDEX IF NOT EXISTS "idx_feedback_me_guild_i_1e7197" ON "feedback_messages" ("guild_id", "member_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "feedback_messages";"""
+
+
+MODELS_STATE = (
+    "eJztXG1zmzgQ/iuMP7UzacbGdkw7NzeTpEmba5vcJL5rpy/DyCAcJhhcEJdkevnvpzfMCo"
+    "HP0MZxHL5gLO0K6Vkhnl0t/OjMIhcHye4xxu4EOVcfcJKgKe68Mn50QjRjJ1UiO0YHzee5"
+    "ACsgaBJwHU8K2zMhzWvRJCExcggV8FCQYFrk4sSJ/Tnxo5CpfU27A7PHjn2THQcePx/xc8"
+    "fgP6IagyMvGbzk50N+dPnREk0YWWde8FLEj10gJ84n4lxeRPz0+XGUS4mrD8ziVWSroj/O"
+    "jiH+GcUqqSjOu1DFAH9Eu3iXYeZGDgXND6ctPEV4vobspOfmXenvwW6Ly4juwZYlIBPRpg"
+    "cuZhkAWz7gwRDoDQSEzcbeBWqyJQislStnloQAwFYlbqJnfVBU3/Z8iqWh/z3FNommmFzi"
+    "mE60L99osR+6+IbeuPTvl8409QPX9l0mP8OzCY7Zn29Mbn5lez4OXGXNEJK83Ca3c152Ep"
+    "JjLsim9cR2oiCdhbnw/JZcRuFC2g8JK53iEMeIYNY8iVO2ZoRpEMh1JltGxBByEdF3oONi"
+    "D6UBW3mYtuhAXtax7dOzsX1xNLbtjrYqZRrgTpRFThSyFY12NeGj5wvnC7M3GA2s/t7Aoi"
+    "K8m4uS0Z24dA6MUOTwnI47d7weESQkOPg5qNAIKrQH/rQSXaj1/xhniC4DOSvIUc6X8/XB"
+    "/NI0+/2R2e3vWcPBaDS0ugu89aplwB+cvGHYU4GIPp3E8yszRg6+c4nCEAe14Vf1WgM0No"
+    "BkErUNoOrdlwEeYJ1ZO/7Zsl8TfqDWTv/m60+MGUQ2Ijr+r2kN8We4YgVSNAsmcKXqbnby"
+    "GA1CB+iehcGtvA+XYD0++XB0Md7/8CcnMknyPeD47Y+PWI3JS28Lpc/2nqvGWTRifDwZvz"
+    "XYX+Pz2ekRhzdKyDTmV8zlxp87rE8oJZEdRtc2csGSkZVmqN0xUuVdAQbAChhBv0axa2s1"
+    "kRlVyepVM3NWLEEhXR1dCS7rpvT33jDecHiJnat5xG7UEpewKLLUJRQ8xFlI13AJe9A7cH"
+    "IyK0sgwYY+C2TngmYPHMij+fElpM5WXi2Yv0LCIamHxH8PlFuwOdiEqZV0yx28bR2sdNe8"
+    "/BpScQLcKuGOKZpDUA79MARGigECZS6uUBC9tYp60n/uQx+zB7uel0gMgIMoh9oF3TDzsc"
+    "lLK94ntA2C3ltdj9LaEZAu96AzPxZOGDmfpLdrzOPIoSSJPiIWD+tkRc+wdQCfogO4CSCv"
+    "mX4FKCF2chs6DQhYUfcXUDAJ+KYwsEfCuDJMNMoFLV22GuoW/+Pi7LTc2lX6Rav7DjH+NQ"
+    "I/uTcfqPObl4YOs6UxoWsA8cNkl13v9876pwHDS5kBp3/vnx++3T9/9mH/U8Hap4fvzw6K"
+    "pmUNHNCbckPY8Xs0+RjFV2WsOKtayoapYa+pUJ19EcA0+pA5WYCXSV440URhTL1bzhQkFY"
+    "R8oYQBYcAdIEFRItuAgyncx6zY09iaoZUwpi+dNKFnO9zmdpiyNUFEzlse9UA8ChhidXBV"
+    "pW2KZP0kzjmunh9gO40DHdUxvqmAFeoUQKVd3S4qdPRpvPwZuGBC789O32TixQejinlCEE"
+    "lLCMrhJYrLEc81GuHdjIpoLqqnLcImWN+hE4/vi67Qp/uNHeBwSi7ZnO8uMV1mKLNb5Cqy"
+    "xuRVhdtBbqzXuh2ATns71L8dCEYOffDaTZaiMt3WBg2WpHQy80mzzYqibrtdsSnOc9V2Bb"
+    "R8OncbblKpmq3VN8XqJSET2Xt9zW26Q1+u34hhb9jK+zCxygzPpikr5fqtPZrag/n/pUao"
+    "tADQaB1NiagW+FMB1tE9jmLsT8N3+JaDfEJ7hEIHl4AqA3d/yWYeGbh32ezJSvP7LkbXi5"
+    "gSnFR07HTEmAhPcf/icP/1UefuYSKp53jqs46zYV/QJ4AYvRZVLRPbWRZhjYGCnQiNpjkH"
+    "SNtPhVvAL41nYHNWRi5FtHKk+bdga1tsRQ97wNd1YbPPDRB3tEBLExB37MNoJswJtrQwJg"
+    "yR6tv4fRH47PHGzd4KyQlPERUli0FPU4ANwKC2suNepQxh8fLAs0yTEOkLaqhaKLwygCIC"
+    "NbAfMFXE0/M2eqBEyZqAcRqYfgGSGeSolZGCRrOr6akQMHldNiLzFByta3KsWc4D6Ht/BG"
+    "EF+fJV+wBlV1deA9Ampql1BABcnUa/NG9eya/PY3L4Zu5Tas4coTa9/klmV2wGV2uzi58S"
+    "/I9kF4GyNv+fR7sfgAjBszlJ6DW8kgBZ5STX9NY30fsbvZbDkPN0ihMinYJVU3VUrZ9K0N"
+    "mwQMc6MnEK60fcMOCvaLaB300J/K4S7gdctabVVc31WH2dXPWRGHmlhMh2U2fb7u2qTZ0N"
+    "ya08pyPB8VFI4ttOWSQQVO8sjQByQRtTSb/+FyiU8BDOYyuLbyCAoAOIKpUI1ckilEEz8C"
+    "rLoAubBVEXbCQkdenokt2bILmB4Sr4tkrW1vNl35PYvsHKQJ1VDCdlgTDRZeUVJdBNryKK"
+    "lUUFYQcR+B6DgkH2oYtFJNFBCfaiwH1RDCEpn5aQfybKZUHXIagI2MLSTAgjkCCSWhn/kh"
+    "UlBl4S4YqjdC4eDHFCbHav2o7HCvhrD9l/PeS1gnwb+1pX7Cs3hg7ustxNqLW+OMAW5Uot"
+    "Jn0d3BWlFvYGsGuLz6phL01xK+AvRL6Gw1VCX8NhdeyL1VVM9JqAF/VavFfDGzyXVwN6oX"
+    "BfCK/1eXk/AG+Ig8QTVUo8oyyBpdolYjkgdZIgHEALIe+UL7Hr3BG+3T4qp6IDU2vIM177"
+    "iRPF7o72IbMqiq4nCJTR2moPAVJtjSFnb4pVJEG0qLTfBtg0Bu+KqVJ7B1XVa78P0HADtX"
+    "WgWgfqKcFeQS+rIb93ernVcM8pbYtCFDTO6a9o4J6S+rdzva/B/pV3zRcfeiiYS2oevzvH"
+    "AarIQtC/KfE47xQtO/3u1ztId/8BJKy5zQ=="
+)
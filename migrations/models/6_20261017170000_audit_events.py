@@ -0,0 +1,75 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "audit_events" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "guild_id" BIGINT NOT NULL,
+    "actor_id" BIGINT,
+    "subject_id" BIGINT,
+    "kind" VARCHAR(64) NOT NULL,
+    "payload" JSON,
+    "created_at" TIMESTAMP NOT NULL
+) /* Структурированная запись о действии бота или администратора. */;
+CREATE INDEX IF NOT EXISTS "idx_audit_event_guild_i_b4af51" ON "audit_events" ("guild_id", "created_at");
+CREATE INDEX IF NOT EXISTS "idx_audit_event_subject_5ee94b" ON "audit_events" ("subject_id", "created_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "audit_events";"""
+
+
+MODELS_STATE = (
+    "eJztXFtvo0YU/iuIp0TKRjbg2KmqStlsdpt2N6kS96JuKzTA4NBgcLl0E7X5750b5gwDrq"
+    "Ebr+3wQuKZc+bynWE4t5m/9Xns4TA9Psu9ILv4C0eZ/pX2tx6hOSb/1NQeaTpaLMo6WpAh"
+    "J2TkiNLZmBKyCuSkWYJc2qaPwhSTIg+nbhIssiCOKMdv+cAyhvRpGew5YE+TPk0Eys2y1p"
+    "yA/zF7MhqTl3jgyVvzNfZjDIh80BDv3uVEmP+x2HPEnqeAygDdTfiTMwzL0QiigQaoHEg7"
+    "AF24gMhTBgUwEXMxQD+i/JhC7cUuwTqIZj2qnwnV3yKycuOENG4MhpZWxU7MiTcpzcwBw3"
+    "G0g6s4wrARwcHr3Zp5Hh5pae78gd1M6tuDswTDEb262gEQKZCKhDEAw0SHbOXkUfBnju0s"
+    "nuHsDidk/Xz8nRQHkYcfcEp/ftRneRB6duBRejfBKMOejTKd0H3UxVhramkzi3vbD3DoSd"
+    "sKJ2Xldva4YGWXUfaWEdLF7NhuHObzqCRePGZ3cbSkDvhWNMMRTmh/pCxLcrrBRHkYiv2o"
+    "2HP4DEsSPjXA42Ef5SHdpig3H0BZptv21fXUvr2Y2raubGEFB3j/RJEbR3T7C+hmSGc/o0"
+    "N4ZQytsTUxT6wJIWHDXJaMn3jXJTCckcFzNdWfWD3KEKdgsilBhTKSoX0dzBrRhVz/jXGB"
+    "6CqQi4IS5XLv3xzMp4ZhmmNjYJ5MRtZ4PJoMlnirVauAf335jmJPCGLyKePfuUIYJfhsq2"
+    "gNPuTqBL5Yvy8be3kDWh99ma/Hvyv+92S2KvLndyipx72gryBOJrKL280cPdghjmbZHfl5"
+    "Yq1A86ezm/Nvz24OTqxDGdIrUWOwKhncBXoMY1SD73e311f1+AKWCsReQHSKf7QwSHdwca"
+    "9AlmJBW56n6Z8hRPTgw9kvVbDP31+/ZtjEaTZLWCusgdcV5IEmo4D/htRkwRzXC0DmrMpA"
+    "sB4X/+zgol8hiunlh4vb6dmHHyR5vDmbXtAag5U+VkoPTioyWjai/Xw5/VajP7Vfr68uqm"
+    "Jb0k1/1emYUJ7FdhR/spEHMSmKi6Inqpj690CLogUOcu8/ocSzlZrYiJto1aq5Ma+WoAjN"
+    "mJAomnScwqx+i7FHW/qA0xSxrVuxvKskK81vXxDbc07d2gbnJpjll4adMOAsYKCIJ7cqTo"
+    "EFAg0tXysG8wpYKgPFkHGAUWcNtbYWDBiPeySZmqCqxrrD0PjCoF28ypju4cHEKqb/DL1y"
+    "KOYJHDbvhg8PtiwAcXibPuhMmO8cWzZhawT4hGXdbe4DwCZagsBOSuZCkqr/w4O48ZGZoK"
+    "i97DtZ3XM8dzCzFXqzujerX4pp4d6hKMJha/hlvl4AnQUgNInWApD5nksAX2Cf2Tj+xbbf"
+    "En7A1i//7vtPbwM2CoRM0LuOwkfxHu6ITSi2jG01Cd9RveH8Drv3izioD8ZWSVaahFwPcZ"
+    "fULUzCIbQO3FKZFSVQwZbiguOqmm25UI9mz1OoOoMwHdf8JSUcKvVQ8T8B5RPYHGzCUEoa"
+    "oqX7OllhrvllH4LRAWaViNtCzhEoh3YYAjPFAIE6E5cz8NFOqnzCfjahjTmEQy9LYIyWG4"
+    "gwMm0ByQlrkHctWZ9QNghab20tyskRh3S1BV3YsXDBiPUkrF1tkcQuUZLIJ2L5sU7XtAx7"
+    "A/AlGoDbAPKG1a8QpZmdPkZuBwWsyvsZVLDdCYhsk8bV6IWXwlw1u2GrmFcD//8KgHVSuf"
+    "Wv/TxyqSw1h+wBWRClx7S/b/TNL4PPFhfbEu34PXJ+jpP7Oq24qFqpDRPBfiJEbeIiMAcO"
+    "ak4ToJcJvdBRSKWEsnpNQaiCUF+o0YAw0B2kJDbo2QY6mKT7GA0xjb2ZWo3G9FHPU8zyCY"
+    "jM7SinewL3nPd61BfSo4Ag1gdXZtonT9b/xLnE1Q9CbOdJqKI6xQ8NsEKeTmk4O6QKXfwy"
+    "Xf0NXGpC76+v3hXk1Q9jJeUsQ1leo6A0Jz2VHJtLe9IVE9VXNmED7O/QiMfPpa7ICVPGYI"
+    "2EKWPQmDBFqyqvgwist3odAE//OrR/HTKMXPLhtbtsRXW8vQw6bEm5Mw+ybsGKKm8frtgW"
+    "47kpXAElny+8jkEqmbOX+rZIvcZlIkav7rldI/T1/H0WfFdfZYFn15SVev5eHl3lQe3/Wi"
+    "E0SgBw9IamQFRx/MkAq+i+jRMczKLv8SMD+ZKMCEUurgFVOO5+FM3sGLhPxeopSsv3LkGf"
+    "lj4luKjI3MmMccYtxbPb87M3F/rTl/Gk3uBZQAdOp31LvgB89opXtY7saJWHNQEMdso5uu"
+    "YcICWeCkPAp/y8a91J4LFi34LQNg9Fj4bA1vVgs4fwqPIEtOQAv6MJvZkwJ3j1MWM1jG9y"
+    "x+eQNW4M10hOeImoSFkMapoCbAA6taWIexOzcn5dpARwKFDjOfSv4KlzeC4cjkM9Ly/lbQ"
+    "xBiZQ1Af00MP0CJDOIWUszBY0WvampEDB5XTQi8hRcZWhirkXOAxi7OYawgnz5pjhAXe/S"
+    "MQBlYRrKQADAzWn0K/Pmpfz60ieHHxYBUc37U+svNrtiO3S1Prv4JcG/I1EEorUFf+1sPA"
+    "BlGZ4vspT04dc4yJrvZqjybW6hm1u9l0OX82yG00wYBeum6shc/Qn17ifUyW6QdHT4S5y9"
+    "43dbHL/ruPuBrtpS6jLnZqS+SV11R4S8VkJkH9TZt3e7KaizJbmVN2QmOLmIsuRRr/MEgu"
+    "qjlR5ARmhjQhm0v4FCcg/h0reyvAMBOB2AV6mGqE0WoXCagaMs1gA2C7wuWEuz3KMXXB4/"
+    "hOkDdFfB0ypFW4frXs64H5MVjrpJ1Z1UOML4kKUjSmCYfoMXq/AKwgEicB+DhEFx0cXSk+"
+    "iiFPtx6L2qupCkqyXED0fqFgwdgoqALNa/NbPJ/yUqagS8wsOVxPmCfxiSNLPpu2q7Pi1g"
+    "xx6K36rLaw363ve1Kd9XKQwV3FW5m5BrLy5R23Su1HLRt8FdYuph7wC7svms6/ZSGPcC/o"
+    "rnazRax/U1GjX7vmhdw0JvCXiVr8d7PbzBd3k9oJcMz4XwRr+XzwPwlhhILFGlxjIqElia"
+    "TSKaA9ImCcIFaqFysXhxpTrUHeHp9nG9KmoZSkO+9iZI3TjxjpSLzJpUdDVBoE6tbbYQoK"
+    "qtaMjFSbGGJIgelf5ugG3T4D2+VFpHUGW+/n6AjgHU3oDqDaiXBHuDetkM+bOrl3sN94Ko"
+    "bXGEws45/Q0NPFNS/37u9y20f+ms+fKih4q4BOfb729wiBqyENQ7JXbzTVGy058+v4H09C"
+    "/5dXEc"
+)
@@ -0,0 +1,71 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "feedback_messages" ADD "line_start" INT;
+        ALTER TABLE "feedback_messages" ADD "line_end" INT;
+        ALTER TABLE "feedback_messages" ADD "line_count" INT;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "feedback_messages" DROP COLUMN "line_start";
+        ALTER TABLE "feedback_messages" DROP COLUMN "line_end";
+        ALTER TABLE "feedback_messages" DROP COLUMN "line_count";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v2zgS/iuCPyWAG9iSnTjF4YA0Tbu5bZND4rtdbHsQaIlydJElr162Cfby349vso"
+    "YipbXUxLUdfVFjcoYin6GomYcj9s/eInJxkBydZa6fXvyBw7T31vizF6IFJn9oavtGDy2X"
+    "RR0tSNEsYOKIytmYCrIKNEvSGDm0TQ8FCSZFLk6c2F+mfhRSja/ZYGQO6XVksuuAXS16tR"
+    "Aot4paawL+xuzKZCxe4oIrb80z2I8TIOSBhvjtHS6E+T8jdh2z6ymQMsHtJvzKFYZFb4TQ"
+    "wABSMyg7ALdwgJCrdApgIsZigvuI8iMKtRs5BGs/nHeoPhOqX0Myc6OYNG4OhiOjjJ0YE2"
+    "9SGtkMdGdmHFxFIYaNCA1e72jGedg3kmz2X+yk0r1dOErQHXFXxzgAJgVWkTAGYFjokM2c"
+    "LPR/z7CdRnOc3uGYzJ8v/yHFfujiB5zQn19688wPXNt3qbwTY5Ri10Zpj8h96Ym+amppM8"
+    "t72/Nx4ErLChdl5Xb6uGRll2H6gQnSyTyznSjIFmEhvHxM76JwJe3zpWiOQxzT+5GyNM7o"
+    "AhNmQSDWo3zN4SMsRPjQgI6LPZQFdJmi2rwDRVnPtq+up/btxdS2e8oSlmuA508UOVFIlz"
+    "+fLoZ09HPahTfmcHQymljHowkRYd1clZw88VsXwHBFBs/VtPfE6lGKuASzTQEqtJEM7Tt/"
+    "Xoku1PprjHNE60DOCwqUi7V/czCfmqZlnZgD63gyHp2cjCeDFd5qVR3w7y4/UuyJQEReZf"
+    "w9lxujAJ8tFY3Bh1qtwBfz93VjLy9A66Mv63X4t8X/noxWRf78DsV63HP5EuJkILu43CzQ"
+    "gx3gcJ7ekZ/Hoxo0/312c/7T2c3B8ehQhvRK1JisSgZ3iR6DCGnw/cft9ZUeX6BSgtj1iU"
+    "/xPyPwkx2c3DXIUixoy4sk+T2AiB58Pvu1DPb5p+t3DJsoSecxa4U18K6EPPBkFPDfk5rU"
+    "X2C9AWTNsg2E6lH+xw5O+hpTTC8/X9xOzz7/U7LH+7PpBa0xWeljqfTguGSjVSPGL5fTnw"
+    "z60/jt+uqibLaV3PS3Hu0TytLIDqNvNnIhJnlxXvREHVPvHnhRtGCGnPtvKHZtpSYyoypZ"
+    "tWphLsolKERzZiSKJu2nCKs/YOzSlj7jJEFs6VYi77JIbfjtCWF7waUbx+A8BBt5RWAnAj"
+    "hN4MRDRARDGgyuXOEUBCgwDvOMvK9vQCADI80BDKXETYymAQ7oj9OXIlFQpQn+MIzNMGy3"
+    "Ltbu0PtL9L6G9I+hW3TFOobd5rfh3YMtC0BmvE0P3EwE/xxbNuDRGOiJuLzd2AdATfRAIQ"
+    "1yE6u8iQsR432yQFH1pOD9eNtqbpCSEHR6VJ4NYnaOwb15e14fdFTcVaJXgLDAs8WgJB4E"
+    "2pd3zoGzS5pxbIjjoTQZIb0zAKb9nt6VptIAtATnDZj6OX7q1ByAyQAfptNWtMsCL2aYBY"
+    "sdr9LxKq8ltnTuUBjioDH8sl5ngNYGEK5kYwPIei9lgB+wzmwc/3zZbwg/UOumf2v4Az/E"
+    "dpKiWEMCVIIvK+0Rsfid79gSrFhHG9aDirXMYQdpjo8TZWHjmbpS6mDVOCAdC1gJNRmgex"
+    "0Gj2IW7AgrKCbstpKCH2ngcH6Hnftl5OvTccoi/TpSkAcizkq6ASk4hAyPUyYOJJJEE4ZD"
+    "1sGBjAgPgiG9ASJ5zt5I0TmkN2AQfgzKJ7A52ISplFTky+zrYAXl5hX3kNidMeAtJM0xKI"
+    "dcGgIjxZB1KXc/p0QEyTkp6wmK1II8oUKyWSBZZgSYGZibVMnGrMUwNWYFJ30OaT0LmnOR"
+    "cMKI+SRoJmMZRw6JksgrYuWtJ2tSQx0D9BoZoG0AedPxF0pSO3kMnRYOWFn3GVywLXN2d8"
+    "TjqtyHlRIdNKtho6yHCv3vSoFo5XL3/uZloUNtaczIGpD6YXJE7/f33uanwbNlRmyJd/wJ"
+    "zX6J4nudV5xX1XrDxLDfiFCTnXGYBS3tiwG/TPiFM0VUSinWewrCFYT+gsYDwsB3kPax4E"
+    "Yf8MEk38es2Lbem6FpPKYvvSzBLKOM2NwOM7om8K2zzo/6QX4UMMT64MpK+0RlPxtH5fkB"
+    "trM4UFGd4ocKWKFOq0TMHXKFLn6d1r8DV57Qp+urj7l4+cVYSjpOUZppHJTqtNdCY3OJrz"
+    "0lRK1KUJgpQTx+KXdFTpk1B2ukzJqDypRZWlV6HERyVKPHAeh0j0PzxyHFyCEvXrvNUqTT"
+    "7WzQYknKZgs/bbdZUdbttiu2JXiu2q6Als+WbstNKlmzs/q2WF1DmYjeq2tu2xQdvf4ebQ"
+    "JvmKvM8Wybs6bX7+zR1h40/tcaodICQKMLNAWiCvEnA6yi+yGKsT8Pf8aPDORL0iMUOlgD"
+    "qiDu/iWa2TFwn/LZk5cWz12Mvq04JTipyNjJiHHKI8Wz2/Oz9xe9px/DpN7guU87Tod9S9"
+    "4AfPQKq6oT69cxrDFQsBOu0TbnACn7qXAL+JSfeKA7C+JEiW/B1jbfihYfE4BzLfJmD+Fh"
+    "FRPQ0gzwjhZkM+GnBvUHTajb+BYnPoescXO4RnLCa0RFymJQ0xRgA5DUlnbcq5SVE0xESg"
+    "CHAlWeRPIWnjsCTwaB/VBPTJHyNoagRMqagDwNTL8AyQxi1NJIQaP53dRUCPhNjGhE5Ck4"
+    "StfEWPOcB9B36wTCCr58qtoH0N1d+pRLmZim0hEA8Mirpv5rPpyRPrApODn8sPSJa96dW/"
+    "Jqsyu2w1frPi94TfDvyC4C8dr8P3Z2PwClKV4s04Tcw2uSHK/obW6iW1u9lkPKeT7HSSqC"
+    "gnVTdWSt7oyS9meUsI+M2hH+kmZH/G4L8bsO3Q981YZWlzU3Y/VN+qo7YuS1EiK7TZ19e7"
+    "arNnW2JLfyhowExxdhGj/2dEwgqO7XMoBM0MZE0m9+BlHl8RwDyJ4oJ81qhJpkEQrSDHzK"
+    "MhrAZgHrgo0kzVx6xPHRQ5A8QLoKfq2St3W47vG8+zFYQdRNynRSToTxLkufKIFuehUsVs"
+    "4Kwg4i5cCa/ESevqRjGg5KsBcF7psyhSQdDyR+zKTbgq5DUBGwxfrnJlfxX6JCY+AahiuO"
+    "siV/McRJatNn1XY8WsA+e8h/q5TXGvId97Up7qswhgpuXe4m1NqLYzQ3nSu1mvRNcJeUOt"
+    "hbwK4sPuvSXoriXsBfYr7G43Wor/G4mvuidRUTvSHgZb0O7/XwBu/l9YBeKbwUwht9X74M"
+    "wFsSILFEFU1klCewVIdENAekSRKEA9xC5b+WyP9TDeg7wq/bT/Su6MhUGvKM937iRLHbVw"
+    "6brHLR1QQBnVtbHSFAV1vxkPMvxSqSIDpUurMBts2Dd/lUabyDKut15wO03EDtAqgugHpN"
+    "sFe4l9WQv7h7uddwL4nbFoUoaJ3TX9HACyX17+d638D7l741Xx30UDKX0Pzw8w0OUEUWgn"
+    "qmxG4+KUp2+tPzB0hP/wcMe0CD"
+)
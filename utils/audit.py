@@ -0,0 +1,131 @@
+"""
+utils/audit.py
+Журнал действий бота (таблица audit_events).
+
+record() не обращается к базе: событие кладётся в очередь, а фоновая
+задача записывает накопленное одним bulk_create — пачками до
+AUDIT_BATCH_SIZE событий, не реже раза в AUDIT_FLUSH_INTERVAL секунд.
+"""
+
+import asyncio
+import datetime
+import logging
+import re
+
+from config import AUDIT_BATCH_SIZE, AUDIT_FLUSH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+_PERIOD_RE = re.compile(r"^(\d+)\s*([mhdw])$", re.IGNORECASE)
+_PERIOD_UNITS = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def _snowflake_id(value) -> int | None:
+    return getattr(value, "id", value)
+
+
+def parse_since(value: str) -> datetime.datetime:
+    """
+    Начало периода для !audit: относительный срок (30m, 24h, 7d, 2w)
+    или дата/время ISO (2026-10-01, 2026-10-01T12:00). Без часового пояса — UTC.
+    Бросает ValueError, если строка не распознана.
+    """
+    value = value.strip()
+    match = _PERIOD_RE.match(value)
+    if match:
+        amount, unit = int(match.group(1)), _PERIOD_UNITS[match.group(2).lower()]
+        return datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(**{unit: amount})
+    moment = datetime.datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=datetime.timezone.utc)
+    return moment
+
+
+class AuditLog:
+    """Очередь событий аудита с пакетной записью в базу."""
+
+    def __init__(self, batch_size: int = AUDIT_BATCH_SIZE, flush_interval: float = AUDIT_FLUSH_INTERVAL):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self.written = 0  # записано событий
+        self.batches = 0  # выполнено bulk_create
+
+    def record(self, guild, kind: str, subject=None, actor=None, **payload) -> None:
+        """
+        Добавляет событие в очередь (без ожидания записи).
+        guild, subject, actor — объекты Discord или их ID; payload — произвольные поля (JSON).
+        """
+        from database.models import AuditEvent
+        from tortoise import timezone
+
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(), name="audit-writer")
+        self._queue.put_nowait(
+            AuditEvent(
+                guild_id=_snowflake_id(guild),
+                actor_id=_snowflake_id(actor),
+                subject_id=_snowflake_id(subject),
+                kind=kind,
+                payload=payload or None,
+                created_at=timezone.now(),
+            )
+        )
+
+    async def _run(self) -> None:
+        from database.models import AuditEvent
+
+        loop = asyncio.get_running_loop()
+        while True:
+            batch, waiters, stop = [], [], False
+            item = await self._queue.get()
+            deadline = loop.time() + self.flush_interval
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, asyncio.Future):
+                    waiters.append(item)  # flush(): пишем сразу, не дожидаясь таймера
+                else:
+                    batch.append(item)
+                if stop or waiters or len(batch) >= self.batch_size:
+                    break
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            if batch:
+                try:
+                    await AuditEvent.bulk_create(batch)
+                    self.written += len(batch)
+                    self.batches += 1
+                except Exception as e:
+                    logger.warning("Не удалось записать %d событий аудита: %s", len(batch), e)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            if stop:
+                return
+
+    async def flush(self) -> None:
+        """Немедленно записывает все события, поставленные в очередь до вызова."""
+        if self._task is None or self._task.done():
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(waiter)
+        await waiter
+
+    async def close(self) -> None:
+        """Записывает остаток очереди и останавливает фоновую задачу."""
+        if self._task is None or self._task.done():
+            return
+        self._queue.put_nowait(None)
+        await self._task
+
+
+audit = AuditLog()
@@ -0,0 +1,103 @@
+"""
+utils/circuit_breaker.py
+Автоматический выключатель (circuit breaker) с локальной очередью.
+
+Для каждого ключа (например, сервера) считаются ошибки подряд. После
+failure_threshold ошибок выключатель «размыкается»: вызовы не делаются,
+данные складываются в локальную очередь (spool). Через reset_timeout
+секунд пропускается один пробный вызов; успех замыкает выключатель,
+и очередь можно отправить, ошибка — снова размыкает его.
+"""
+
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class _State:
+    __slots__ = ("state", "failures", "opened_at", "spool", "dropped")
+
+    def __init__(self, spool_size: int):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.spool = deque(maxlen=spool_size)
+        self.dropped = 0  # вытеснено из переполненной очереди
+
+
+class CircuitBreaker:
+    """Выключатели по ключам с общей настройкой."""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0, spool_size: int = 1000, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.spool_size = spool_size
+        self.clock = clock
+        self._states: dict[object, _State] = {}
+
+    def _get(self, key) -> _State:
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _State(self.spool_size)
+        return state
+
+    def state(self, key) -> str:
+        return self._get(key).state
+
+    def allow(self, key) -> bool:
+        """Можно ли делать вызов. После reset_timeout пропускает один пробный вызов."""
+        state = self._get(key)
+        if state.state == CLOSED:
+            return True
+        if state.state == OPEN and self.clock() - state.opened_at >= self.reset_timeout:
+            state.state = HALF_OPEN
+            return True
+        return False
+
+    def record_success(self, key) -> bool:
+        """Отмечает успешный вызов. True — если выключатель был разомкнут и теперь замкнулся."""
+        state = self._get(key)
+        recovered = state.state != CLOSED
+        state.state = CLOSED
+        state.failures = 0
+        return recovered
+
+    def record_failure(self, key) -> bool:
+        """Отмечает ошибку. True — если выключатель только что разомкнулся."""
+        state = self._get(key)
+        state.failures += 1
+        if state.state == HALF_OPEN or (state.state == CLOSED and state.failures >= self.failure_threshold):
+            state.state = OPEN
+            state.opened_at = self.clock()
+            return True
+        return False
+
+    def spool(self, key, item) -> None:
+        """Кладёт данные в локальную очередь (при переполнении вытесняются самые старые)."""
+        state = self._get(key)
+        if len(state.spool) == state.spool.maxlen:
+            state.dropped += 1
+        state.spool.append(item)
+
+    def respool(self, key, items) -> None:
+        """Возвращает неотправленные данные в начало очереди, сохраняя порядок."""
+        state = self._get(key)
+        for item in reversed(items):
+            if len(state.spool) == state.spool.maxlen:
+                state.dropped += 1
+                break
+            state.spool.appendleft(item)
+
+    def drain(self, key) -> tuple[list, int]:
+        """Забирает всю очередь: (данные по порядку, сколько было вытеснено)."""
+        state = self._get(key)
+        items, dropped = list(state.spool), state.dropped
+        state.spool.clear()
+        state.dropped = 0
+        return items, dropped
+
+    def pending(self, key) -> int:
+        return len(self._get(key).spool)
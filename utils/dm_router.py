@@ -0,0 +1,105 @@
+"""
+utils/dm_router.py
+Маршрутизатор личных сообщений для диалогов (регистрация и т. п.).
+
+Вместо bot.wait_for("message", check=...) на каждого участника — один
+обработчик on_message и словарь author_id → ожидание: входящее сообщение
+находит своего адресата за O(1), сколько бы диалогов ни было открыто.
+Таймауты всех ожиданий обслуживает одна задача по куче сроков.
+"""
+
+import asyncio
+import heapq
+import itertools
+
+import discord
+
+
+class _Waiter:
+    """Ожидание следующего сообщения от одного участника."""
+
+    __slots__ = ("future", "deadline")
+
+    def __init__(self, future: asyncio.Future, deadline: float):
+        self.future = future
+        self.deadline = deadline
+
+
+class DMRouter:
+    """Раздаёт личные сообщения ожидающим диалогам и завершает их по таймауту."""
+
+    def __init__(self):
+        self._waiters: dict[int, _Waiter] = {}
+        self._timers: list[tuple[float, int, int, _Waiter]] = []  # (срок, порядковый номер, author_id, ожидание)
+        self._counter = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._timer_task: asyncio.Task | None = None
+
+    def __len__(self):
+        return len(self._waiters)
+
+    def dispatch(self, message: discord.Message) -> bool:
+        """Передаёт личное сообщение ожидающему диалогу. True — если сообщение кто-то ждал."""
+        if message.author.bot or not isinstance(message.channel, discord.DMChannel):
+            return False
+        waiter = self._waiters.pop(message.author.id, None)
+        if waiter is None or waiter.future.done():
+            return False
+        waiter.future.set_result(message)
+        return True
+
+    async def wait_for_message(self, author_id: int, timeout: float) -> discord.Message:
+        """Ждёт следующее личное сообщение от author_id; по истечении timeout — asyncio.TimeoutError."""
+        loop = asyncio.get_running_loop()
+        previous = self._waiters.get(author_id)
+        if previous is not None and not previous.future.done():
+            previous.future.cancel()
+
+        waiter = _Waiter(loop.create_future(), loop.time() + timeout)
+        self._waiters[author_id] = waiter
+        self._schedule(author_id, waiter)
+        try:
+            return await waiter.future
+        finally:
+            if self._waiters.get(author_id) is waiter:
+                del self._waiters[author_id]
+
+    def _schedule(self, author_id: int, waiter: _Waiter) -> None:
+        earliest = self._timers[0][0] if self._timers else None
+        heapq.heappush(self._timers, (waiter.deadline, next(self._counter), author_id, waiter))
+        if self._timer_task is None or self._timer_task.done():
+            self._wakeup = asyncio.Event()
+            self._timer_task = asyncio.create_task(self._run_timers(), name="dm-router-timers")
+        elif earliest is None or waiter.deadline < earliest:
+            self._wakeup.set()
+
+    async def _run_timers(self) -> None:
+        """Одна задача на все таймауты: спит до ближайшего срока или нового, более раннего."""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            while self._timers and (self._timers[0][3].future.done() or self._timers[0][0] <= now):
+                _, _, author_id, waiter = heapq.heappop(self._timers)
+                if waiter.future.done():
+                    continue  # ответ уже пришёл — запись устарела
+                waiter.future.set_exception(asyncio.TimeoutError())
+                if self._waiters.get(author_id) is waiter:
+                    del self._waiters[author_id]
+
+            delay = self._timers[0][0] - now if self._timers else None
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def close(self) -> None:
+        """Отменяет все ожидания и задачу таймеров."""
+        for waiter in self._waiters.values():
+            if not waiter.future.done():
+                waiter.future.cancel()
+        self._waiters.clear()
+        self._timers.clear()
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            self._timer_task = None
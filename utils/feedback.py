@@ -4,13 +4,20 @@ Utilities for creating and using feedback channels across bot components.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
 import discord
 
+from config import FEEDBACK_BREAKER_RESET, FEEDBACK_BREAKER_THRESHOLD, FEEDBACK_SPOOL_SIZE
+from utils.circuit_breaker import CircuitBreaker
+from utils.feedback_index import record_message
+
 logger = logging.getLogger(__name__)
 
+MESSAGE_LIMIT = 2000  # Discord message length limit
+
 
 async def ensure_feedback_channel(
     guild: discord.Guild,
@@ -86,6 +93,229 @@ async def ensure_feedback_channel(
     return channel
 
 
+class FeedbackChannelRegistry:
+    """
+    Per-guild cache of feedback channels shared by every bot component.
+
+    Each guild's channel is resolved once via ``ensure_feedback_channel`` and
+    then served from memory. Channel delete/update events and guild removal
+    invalidate the cached entry, so the next lookup resolves it again.
+    """
+
+    def __init__(self) -> None:
+        self._channels: dict[int, discord.TextChannel] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def get(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
+        """Return the cached channel if it still exists in the guild."""
+        channel = self._channels.get(guild.id)
+        if channel is not None and guild.get_channel(channel.id) is None:
+            del self._channels[guild.id]
+            return None
+        return channel
+
+    async def resolve(
+        self,
+        guild: discord.Guild,
+        *,
+        bot_member: Optional[discord.Member] = None,
+    ) -> Optional[discord.TextChannel]:
+        """Return the guild's feedback channel, creating it on first use."""
+        channel = self.get(guild)
+        if channel is not None:
+            return channel
+
+        lock = self._locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:  # concurrent callers share one ensure_feedback_channel call
+            channel = self.get(guild)
+            if channel is None:
+                channel = await ensure_feedback_channel(guild, bot_member=bot_member)
+                if channel is not None:
+                    self._channels[guild.id] = channel
+        return channel
+
+    def forget(self, guild_id: int) -> None:
+        self._channels.pop(guild_id, None)
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        cached = self._channels.get(channel.guild.id)
+        if cached is not None and cached.id == channel.id:
+            self.forget(channel.guild.id)
+
+    async def on_guild_channel_update(
+        self,
+        before: discord.abc.GuildChannel,  # noqa: ARG002 - discord.py event signature
+        after: discord.abc.GuildChannel,
+    ) -> None:
+        cached = self._channels.get(after.guild.id)
+        if cached is None or cached.id != after.id:
+            return
+        if isinstance(after, discord.TextChannel) and after.name.endswith("-feedback"):
+            self._channels[after.guild.id] = after
+        else:
+            self.forget(after.guild.id)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.forget(guild.id)
+        self._locks.pop(guild.id, None)
+
+
+feedback_channels = FeedbackChannelRegistry()
+
+
+def attach_registry(bot) -> FeedbackChannelRegistry:
+    """Expose the shared registry as ``bot.feedback_channels`` and subscribe it to channel events."""
+    bot.feedback_channels = feedback_channels
+    bot.add_listener(feedback_channels.on_guild_channel_delete, "on_guild_channel_delete")
+    bot.add_listener(feedback_channels.on_guild_channel_update, "on_guild_channel_update")
+    bot.add_listener(feedback_channels.on_guild_remove, "on_guild_remove")
+    return feedback_channels
+
+
+feedback_breaker = CircuitBreaker(
+    failure_threshold=FEEDBACK_BREAKER_THRESHOLD,
+    reset_timeout=FEEDBACK_BREAKER_RESET,
+    spool_size=FEEDBACK_SPOOL_SIZE,
+)
+# Pending "reset timeout expired" probes, so a quiet guild's spool still gets delivered
+_probe_timers: dict[int, asyncio.TimerHandle] = {}
+_probe_tasks: set[asyncio.Task] = set()
+
+
+async def deliver_feedback(
+    guild: discord.Guild,
+    text: str,
+    member_ids=(),
+    *,
+    bot_member: Optional[discord.Member] = None,
+) -> Optional[discord.Message]:
+    """
+    Send ``text`` to the guild's feedback channel behind a per-guild circuit breaker.
+
+    After repeated failures the breaker opens: messages are kept in a local
+    spool instead of hitting the API (and ``ensure_feedback_channel``) again.
+    Once ``FEEDBACK_BREAKER_RESET`` seconds pass, a probe delivers the spool,
+    oldest first: either the next message or, if the guild stays quiet, a
+    scheduled probe. Returns the last sent message, or ``None`` if the text
+    was spooled.
+    """
+    return await deliver_feedback_lines(guild, [(text, member_ids)], bot_member=bot_member)
+
+
+async def deliver_feedback_lines(
+    guild: discord.Guild,
+    entries,
+    *,
+    bot_member: Optional[discord.Member] = None,
+) -> Optional[discord.Message]:
+    """
+    Like ``deliver_feedback`` for several log entries ``(text, member_ids)`` at once.
+    Entries are joined into as few messages as fit, and each entry's lines are
+    indexed under its own members.
+    """
+    for text, member_ids in entries:
+        feedback_breaker.spool(guild.id, (text, tuple(member_ids)))
+    if not feedback_breaker.allow(guild.id):
+        return None
+
+    try:
+        channel = await feedback_channels.resolve(guild, bot_member=bot_member)
+        if channel is None:
+            raise RuntimeError("feedback channel is unavailable")
+    except Exception as exc:
+        _record_failure(guild, exc)
+        return None
+    return await _drain_spool(guild, channel)
+
+
+def _record_failure(guild: discord.Guild, exc: Exception) -> None:
+    if feedback_breaker.record_failure(guild.id):
+        logger.warning(
+            "Feedback circuit opened for guild %s after %s: spooling locally (%s pending)",
+            guild.id,
+            exc,
+            feedback_breaker.pending(guild.id),
+        )
+        _schedule_probe(guild)
+
+
+def _schedule_probe(guild: discord.Guild) -> None:
+    """Retry the spool once the breaker's reset timeout expires, even if no new message arrives."""
+    timer = _probe_timers.pop(guild.id, None)
+    if timer is not None:
+        timer.cancel()
+    loop = asyncio.get_running_loop()
+    _probe_timers[guild.id] = loop.call_later(feedback_breaker.reset_timeout, _start_probe, guild)
+
+
+def _start_probe(guild: discord.Guild) -> None:
+    _probe_timers.pop(guild.id, None)
+    task = asyncio.create_task(_probe(guild), name=f"feedback-probe-{guild.id}")
+    _probe_tasks.add(task)
+    task.add_done_callback(_probe_tasks.discard)
+
+
+async def _probe(guild: discord.Guild) -> None:
+    if not feedback_breaker.pending(guild.id) or not feedback_breaker.allow(guild.id):
+        return  # nothing spooled (the next message will probe) or a probe is already running
+    try:
+        channel = await feedback_channels.resolve(guild)
+        if channel is None:
+            raise RuntimeError("feedback channel is unavailable")
+    except Exception as exc:
+        _record_failure(guild, exc)
+        return
+    await _drain_spool(guild, channel)
+
+
+async def _drain_spool(guild: discord.Guild, channel: discord.TextChannel) -> Optional[discord.Message]:
+    """
+    Deliver spooled texts in order, joined into messages of up to ``MESSAGE_LIMIT``
+    characters. Each text's line range is indexed under its members, so a member's
+    lines can later be cut out of a shared message. On failure the unsent rest goes
+    back to the spool; a failed index write is logged and does not stop delivery.
+    """
+    items, dropped = feedback_breaker.drain(guild.id)
+    if dropped:
+        items.insert(0, (f"⚠️ Пока канал был недоступен, потеряно записей лога: {dropped}.", ()))
+
+    batches: list[tuple[list[tuple[str, tuple]], int]] = []
+    for text, member_ids in items:
+        text = text[:MESSAGE_LIMIT]
+        if batches and batches[-1][1] + 1 + len(text) <= MESSAGE_LIMIT:
+            entries, size = batches[-1]
+            entries.append((text, member_ids))
+            batches[-1] = (entries, size + 1 + len(text))
+        else:
+            batches.append(([(text, member_ids)], len(text)))
+
+    sent = None
+    for index, (entries, _) in enumerate(batches):
+        try:
+            sent = await channel.send("\n".join(text for text, _ in entries))
+        except Exception as exc:
+            feedback_breaker.respool(guild.id, [entry for batch, _ in batches[index:] for entry in batch])
+            _record_failure(guild, exc)
+            return None
+        if feedback_breaker.record_success(guild.id):
+            logger.info("Feedback circuit closed for guild %s, flushing %s spooled messages", guild.id, len(batches))
+
+        spans, line = [], 0
+        for text, member_ids in entries:
+            end = line + text.count("\n") + 1
+            if member_ids:
+                spans.append((line, end, member_ids))
+            line = end
+        try:
+            await record_message(sent, spans, line)
+        except Exception as exc:
+            logger.warning("Failed to index feedback message %s in guild %s: %s", sent.id, guild.id, exc)
+    return sent
+
+
 async def send_feedback_message(
     guild: discord.Guild,
     message: str,
@@ -94,15 +324,9 @@ async def send_feedback_message(
     fallback_logger=logger.warning,
 ) -> None:
     """
-    Send a message into the feedback channel. Falls back to logging when the
-    channel cannot be created or accessed.
+    Send a message into the feedback channel. While the channel is failing,
+    messages are spooled by the circuit breaker and also written to the log.
     """
-    channel = await ensure_feedback_channel(guild, bot_member=bot_member)
-    if channel:
-        try:
-            await channel.send(message)
-            return
-        except Exception as exc:  # pragma: no cover - defensive logging
-            fallback_logger("Failed to send feedback message to %s: %s", guild.id, exc)
-
-    fallback_logger("Feedback fallback for guild %s: %s", guild.id, message)
+    sent = await deliver_feedback(guild, message, bot_member=bot_member)
+    if sent is None:
+        fallback_logger("Feedback fallback for guild %s: %s", guild.id, message)
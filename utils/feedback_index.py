@@ -0,0 +1,166 @@
+"""
+utils/feedback_index.py
+Какие сообщения feedback-канала относятся к какому участнику.
+
+При отправке лога бот записывает в таблицу feedback_messages, какие строки
+какого сообщения относятся к какому участнику. При выходе участника его
+строки убираются без обхода истории канала и без поиска по именам:
+сообщения, где все строки только о нём, удаляются пачками по 100 через
+delete_messages, а из общих сообщений его строки вырезаются правкой.
+"""
+
+import datetime
+import logging
+import re
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+MENTION_RE = re.compile(r"<@!?(\d+)>")
+BULK_DELETE_LIMIT = 100  # максимум сообщений в одном запросе delete_messages
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)  # старше — Discord удаляет только по одному
+
+
+def referenced_member_ids(text: str, about=()) -> set[int]:
+    """ID участников, упомянутых в тексте (<@id>), плюс явно переданные about."""
+    ids = {int(match) for match in MENTION_RE.findall(text or "")}
+    ids.update(member.id for member in about if member is not None)
+    return ids
+
+
+async def record_message(message: discord.Message, spans, line_count: int) -> None:
+    """
+    Запоминает, о ком строки сообщения feedback.
+    spans — [(line_start, line_end, member_ids)]: строки [line_start, line_end) относятся к member_ids;
+    line_count — всего строк в сообщении.
+    """
+    from database.models import FeedbackMessage
+
+    if message.guild is None:
+        return
+    rows = [
+        FeedbackMessage(
+            guild_id=message.guild.id,
+            channel_id=message.channel.id,
+            message_id=message.id,
+            member_id=member_id,
+            line_start=line_start,
+            line_end=line_end,
+            line_count=line_count,
+        )
+        for line_start, line_end, member_ids in spans
+        for member_id in set(member_ids)
+    ]
+    if rows:
+        await FeedbackMessage.bulk_create(rows)
+
+
+def _lines(rows) -> set[int]:
+    return {line for row in rows for line in range(row.line_start, row.line_end)}
+
+
+async def delete_member_messages(guild: discord.Guild, member_id: int) -> tuple[int, int]:
+    """
+    Убирает из feedback строки, которые относятся только к member_id.
+    Сообщение, все строки которого — только о нём, удаляется; из остальных
+    его строки вырезаются правкой (строки о других участниках и общие строки
+    остаются). Возвращает (удалено сообщений, отредактировано).
+    """
+    from database.models import FeedbackMessage
+
+    mine = await FeedbackMessage.filter(guild_id=guild.id, member_id=member_id)
+    if not mine:
+        return 0, 0
+    message_ids = {row.message_id for row in mine}
+    by_message: dict[int, list] = {}
+    for row in await FeedbackMessage.filter(message_id__in=list(message_ids)):
+        by_message.setdefault(row.message_id, []).append(row)
+
+    to_delete: dict[int, list[int]] = {}  # channel_id → message_id
+    to_edit: list[tuple[list, set[int]]] = []  # (строки индекса сообщения, вырезаемые строки)
+    for message_id, rows in by_message.items():
+        own = [row for row in rows if row.member_id == member_id]
+        others = [row for row in rows if row.member_id != member_id]
+        if any(row.line_start is None for row in rows):
+            # Запись до построчного индекса: сообщение целиком, общие сообщения остаются
+            if not others:
+                to_delete.setdefault(own[0].channel_id, []).append(message_id)
+            continue
+        exclusive = _lines(own) - _lines(others)
+        if len(exclusive) >= own[0].line_count:
+            to_delete.setdefault(own[0].channel_id, []).append(message_id)
+        elif exclusive:
+            to_edit.append((rows, exclusive))
+
+    deleted = 0
+    bulk_after = discord.utils.utcnow() - BULK_DELETE_MAX_AGE + datetime.timedelta(minutes=5)
+    for channel_id, ids in to_delete.items():
+        channel = guild.get_channel(channel_id)
+        if not isinstance(channel, discord.TextChannel):
+            continue
+        recent = [i for i in ids if discord.utils.snowflake_time(i) > bulk_after]
+        old = [i for i in ids if discord.utils.snowflake_time(i) <= bulk_after]
+        for start in range(0, len(recent), BULK_DELETE_LIMIT):
+            chunk = [discord.Object(id=i) for i in recent[start:start + BULK_DELETE_LIMIT]]
+            try:
+                await channel.delete_messages(chunk)
+                deleted += len(chunk)
+            except discord.HTTPException as e:
+                logger.warning("Не удалось удалить сообщения feedback: %s", e, extra={"guild_id": guild.id})
+        for message_id in old:
+            try:
+                await channel.get_partial_message(message_id).delete()
+                deleted += 1
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                logger.warning("Не удалось удалить сообщение feedback: %s", e, extra={"guild_id": guild.id})
+
+    edited = 0
+    gone: set[int] = {message_id for ids in to_delete.values() for message_id in ids}
+    for rows, exclusive in to_edit:
+        if await _cut_lines(guild, rows, exclusive, member_id):
+            edited += 1
+        else:
+            gone.add(rows[0].message_id)
+
+    await FeedbackMessage.filter(guild_id=guild.id, member_id=member_id).delete()
+    if gone:
+        await FeedbackMessage.filter(message_id__in=list(gone)).delete()
+    return deleted, edited
+
+
+async def _cut_lines(guild: discord.Guild, rows, exclusive: set[int], member_id: int) -> bool:
+    """
+    Вырезает строки exclusive из сообщения и сдвигает диапазоны остальных участников.
+    False — сообщения больше нет (его записи индекса нужно удалить).
+    """
+    first = rows[0]
+    channel = guild.get_channel(first.channel_id)
+    if not isinstance(channel, discord.TextChannel):
+        return False
+    try:
+        message = await channel.get_partial_message(first.message_id).fetch()
+        lines = message.content.split("\n")
+        if len(lines) != first.line_count:
+            # Сообщение изменено вручную — по номерам строк его не править
+            logger.warning("Сообщение feedback %s не совпадает с индексом, пропущено", first.message_id, extra={"guild_id": guild.id})
+            return True
+        await message.edit(content="\n".join(line for index, line in enumerate(lines) if index not in exclusive))
+    except discord.NotFound:
+        return False
+    except discord.HTTPException as e:
+        logger.warning("Не удалось отредактировать сообщение feedback: %s", e, extra={"guild_id": guild.id})
+        return True
+
+    def shift(line: int) -> int:
+        return line - sum(1 for removed in exclusive if removed < line)
+
+    line_count = first.line_count - len(exclusive)
+    for row in rows:
+        if row.member_id == member_id:
+            continue
+        row.line_start, row.line_end, row.line_count = shift(row.line_start), shift(row.line_end), line_count
+        await row.save(update_fields=["line_start", "line_end", "line_count"])
+    return True
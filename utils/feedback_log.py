@@ -0,0 +1,113 @@
+"""
+utils/feedback_log.py
+Буферизованный лог в feedback-канал.
+
+Строки лога не отправляются по одной: для каждого сервера они копятся
+в буфере и склеиваются в сообщения до 2000 символов (лимит Discord).
+Буфер отправляется по таймеру (FEEDBACK_FLUSH_INTERVAL) или сразу,
+как только следующая строка в сообщение уже не помещается. При массовой
+регистрации это десятки сообщений вместо тысяч и меньше упоров в лимиты.
+Для каждой строки запоминается, о ком она: в индексе feedback_messages
+хранятся диапазоны строк по участникам, и при выходе участника из общего
+сообщения вырезаются только его строки.
+Доставка идёт через deliver_feedback_lines: при сбоях канала строки копятся
+в локальной очереди выключателя и отправляются после его восстановления.
+"""
+
+import asyncio
+
+import discord
+
+from config import FEEDBACK_FLUSH_INTERVAL
+from utils.feedback import MESSAGE_LIMIT, deliver_feedback_lines
+
+
+def _split(text: str, limit: int = MESSAGE_LIMIT) -> list[str]:
+    """Режет слишком длинную строку на части не длиннее limit."""
+    return [text[start:start + limit] for start in range(0, len(text), limit)] or [""]
+
+
+class _Buffer:
+    """Накопленные строки одного сервера: (текст, ID участников, о которых строка)."""
+
+    __slots__ = ("guild", "entries", "size", "timer", "lock")
+
+    def __init__(self, guild: discord.Guild):
+        self.guild = guild
+        self.entries: list[tuple[str, frozenset[int]]] = []
+        self.size = 0
+        self.timer: asyncio.TimerHandle | None = None
+        self.lock = asyncio.Lock()  # сообщения сервера уходят строго по порядку
+
+    def take(self) -> list[tuple[str, frozenset[int]]]:
+        entries = self.entries
+        self.entries, self.size = [], 0
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        return entries
+
+
+class FeedbackLogger:
+    """Склеивает строки лога в сообщения по серверам."""
+
+    def __init__(self, flush_interval: float = FEEDBACK_FLUSH_INTERVAL, limit: int = MESSAGE_LIMIT):
+        self.flush_interval = flush_interval
+        self.limit = limit
+        self._buffers: dict[int, _Buffer] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.lines = 0  # принято строк
+        self.messages = 0  # отправлено сообщений
+
+    async def log(self, guild: discord.Guild, text: str, member_ids=()) -> None:
+        """Добавляет строку в буфер сервера; отправка — по таймеру или при заполнении сообщения."""
+        buffer = self._buffers.get(guild.id)
+        if buffer is None:
+            buffer = self._buffers[guild.id] = _Buffer(guild)
+        buffer.guild = guild
+
+        member_ids = frozenset(member_ids)
+        for piece in _split(text, self.limit):
+            full = None
+            if buffer.entries and buffer.size + 1 + len(piece) > self.limit:
+                full = buffer.take()
+            # Строка попадает в буфер до ожидания отправки: flush() по таймеру,
+            # сработавший во время await, заберёт её вместе с остальными
+            buffer.entries.append((piece, member_ids))
+            buffer.size += len(piece) + (1 if len(buffer.entries) > 1 else 0)
+            self.lines += 1
+            self._arm(buffer)
+            if full:
+                await self._send(buffer, full)
+
+    def _arm(self, buffer: _Buffer) -> None:
+        if buffer.timer is None and buffer.entries:
+            loop = asyncio.get_running_loop()
+            buffer.timer = loop.call_later(self.flush_interval, self._flush_later, buffer.guild.id)
+
+    def _flush_later(self, guild_id: int) -> None:
+        task = asyncio.create_task(self.flush(guild_id), name=f"feedback-flush-{guild_id}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self, guild) -> None:
+        """Немедленно отправляет буфер сервера (guild — объект сервера или его ID)."""
+        buffer = self._buffers.get(getattr(guild, "id", guild))
+        if buffer is None:
+            return
+        buffer.timer = None
+        entries = buffer.take()
+        if entries:
+            await self._send(buffer, entries)
+
+    async def _send(self, buffer: _Buffer, entries: list[tuple[str, frozenset[int]]]) -> None:
+        async with buffer.lock:
+            if await deliver_feedback_lines(buffer.guild, entries) is not None:
+                self.messages += 1
+
+    async def close(self) -> None:
+        """Отправляет все буферы (при остановке бота)."""
+        for guild_id in list(self._buffers):
+            await self.flush(guild_id)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -1,30 +1,279 @@
 """
 utils/file_manager.py
-Работа с Excel, где каждая группа — отдельный лист.
+Работа со списком студентов, где каждая группа — отдельный лист.
 Колонки: ИМЯ | ФАМИЛИЯ
+
+Формат хранения (Excel, Parquet или каталог CSV) выбирается по расширению
+FILE_PATH — см. utils.roster_backends. Содержимое держится в памяти
+(RosterIndex) и перечитывается только тогда, когда меняется отпечаток
+хранилища (mtime/размер). Изменения применяются пачками (apply_mutations)
+и записываются атомарно через временный файл.
 """
 
-import os
-import pandas as pd
+import logging
+import threading
+
 from config import FILE_PATH
+from utils.fuzzy import TrigramIndex
+from utils.roster_backends import Sheet, get_backend, normalize_name
+
+logger = logging.getLogger(__name__)
+
+_backend = get_backend(FILE_PATH)
+_index = None
+_index_lock = threading.RLock()
+
+
+class RosterIndex:
+    """
+    Индекс списка студентов, построенный по всем листам.
+    - sheets: {группа: Sheet} — исходные данные для перезаписи файла;
+    - groups: множество групп;
+    - students: {(имя, фамилия): группа} в casefold-виде.
+    Триграммные индексы для подсказок строятся лениво, при первом запросе.
+    """
+
+    def __init__(self, sheets, stamp):
+        self.sheets = sheets
+        self.stamp = stamp
+        self.groups = set()
+        self.students = {}
+        self._members = set()  # (группа, имя, фамилия) — для проверки внутри конкретной группы
+        self._group_grams = None
+        self._student_grams = {}  # {группа: TrigramIndex по "имя фамилия"}
+        self.rebuild()
+
+    def rebuild(self):
+        """Пересобирает словари по текущим sheets."""
+        self.groups = set(self.sheets)
+        self.students = {}
+        self._members = set()
+        self._group_grams = None
+        self._student_grams = {}
+        for group, sheet in self.sheets.items():
+            for first, last in sheet.names():
+                self._add_key(group, normalize_name(first), normalize_name(last))
+
+    def _add_key(self, group, first, last):
+        if not first and not last:
+            return
+        self.students[(first, last)] = group
+        self._members.add((group, first, last))
+
+    def add_student(self, first_name, last_name, group):
+        self._add_key(group, normalize_name(first_name), normalize_name(last_name))
+        self._student_grams.pop(group, None)
+
+    def add_group(self, group):
+        self.groups.add(group)
+        self._group_grams = None
+
+    def has_student(self, first_name, last_name, group) -> bool:
+        return (group, normalize_name(first_name), normalize_name(last_name)) in self._members
+
+    def find_group(self, first_name, last_name):
+        """Группа студента или None — O(1) поиск по словарю."""
+        return self.students.get((normalize_name(first_name), normalize_name(last_name)))
+
+    def suggest_groups(self, query, limit=3):
+        """Ближайшие по написанию группы: [(оценка, группа), ...]."""
+        if self._group_grams is None:
+            self._group_grams = TrigramIndex()
+            for group in self.sheets:
+                self._group_grams.add(group, group)
+        return self._group_grams.search(query, limit=limit)
+
+    def suggest_students(self, first_name, last_name, group, limit=3):
+        """Ближайшие студенты группы: [(оценка, (имя, фамилия)), ...]."""
+        if group not in self.sheets:
+            return []
+        grams = self._student_grams.get(group)
+        if grams is None:
+            grams = TrigramIndex()
+            for first, last in self.sheets[group].names():
+                if first is None and last is None:
+                    continue
+                name = (str(first or "").strip(), str(last or "").strip())
+                grams.add(" ".join(name), name)
+            self._student_grams[group] = grams
+        return grams.search(f"{first_name} {last_name}", limit=limit, threshold=0.5)
+
+
+def get_index() -> RosterIndex:
+    """
+    Возвращает индекс списка студентов.
+    Хранилище перечитывается только если изменился его отпечаток (mtime/размер).
+    """
+    global _index
+    ensure_excel_exists()
+    with _index_lock:
+        stamp = _backend.stamp()
+        if _index is None or _index.stamp != stamp:
+            _index = RosterIndex(_backend.read(), stamp)
+        return _index
+
+
+def set_storage_path(path):
+    """Переключает список на другой файл или каталог (бенчмарки, утилиты)."""
+    global _backend
+    with _index_lock:
+        _backend = get_backend(path)
+        _invalidate_index()
+
+
+def _invalidate_index():
+    """Сбрасывает индекс: следующий вызов get_index() перечитает файл."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def _save_index(index: RosterIndex):
+    """Атомарно записывает все листы индекса и обновляет отпечаток хранилища."""
+    _backend.write(index.sheets)
+    index.stamp = _backend.stamp()
+
+
+# -----------------------------------------------------------------------------
+# Изменения списка. Каждая функция меняет только индекс в памяти и возвращает
+# (результат, изменён_ли_индекс); запись файла делает apply_mutations.
+# -----------------------------------------------------------------------------
+
+def _apply_add_student(index: RosterIndex, first_name, last_name, group):
+    if group not in index.groups:
+        return False, False  # Группа не найдена
+    if index.has_student(first_name, last_name, group):
+        return True, False
+    index.sheets[group].append(first_name, last_name)
+    index.add_student(first_name, last_name, group)
+    return True, True
+
+
+def _apply_add_sheet(index: RosterIndex, group_name):
+    if group_name in index.groups:
+        return False, False  # уже есть
+    index.sheets[group_name] = Sheet()
+    index.add_group(group_name)
+    return True, True
+
+
+def _apply_remove_sheet(index: RosterIndex, group_name):
+    if group_name not in index.groups:
+        return False, False
+    del index.sheets[group_name]
+    if not index.sheets:
+        index.sheets["General"] = Sheet()
+    index.rebuild()
+    return True, True
+
+
+def _apply_replace_students(index: RosterIndex, entries):
+    """Приводит все листы к списку [(группа, имя, фамилия), ...]. Возвращает число строк."""
+    wanted = {}
+    for group, first_name, last_name in entries:
+        key = (normalize_name(first_name), normalize_name(last_name))
+        wanted.setdefault(group, {})[key] = (first_name, last_name)
+
+    changed = False
+    for group in wanted:
+        if group not in index.sheets:
+            index.sheets[group] = Sheet()
+            changed = True
+    for group, sheet in index.sheets.items():
+        changed = sheet.sync_names(wanted.get(group, {})) or changed
+    if changed:
+        index.rebuild()
+    return sum(len(names) for names in wanted.values()), changed
+
+
+MUTATIONS = {
+    "add_student": _apply_add_student,
+    "add_sheet": _apply_add_sheet,
+    "remove_sheet": _apply_remove_sheet,
+    "replace_students": _apply_replace_students,
+}
+
+
+def apply_mutations(mutations):
+    """
+    Применяет пачку изменений [(имя, *аргументы), ...] и записывает файл один раз.
+    Возвращает список результатов в том же порядке; для неудачных изменений
+    вместо результата — объект исключения.
+    """
+    results = []
+    changed = []
+    with _index_lock:
+        try:
+            index = get_index()
+        except Exception as e:
+            return [e] * len(mutations)
+
+        for name, *args in mutations:
+            try:
+                result, dirty = MUTATIONS[name](index, *args)
+            except Exception as e:
+                result, dirty = e, False
+            results.append(result)
+            if dirty:
+                changed.append(len(results) - 1)
+
+        if changed:
+            try:
+                _save_index(index)
+            except Exception as e:
+                _invalidate_index()
+                for position in changed:
+                    results[position] = e
+    return results
+
+
+def lookup_student(first_name, last_name, group):
+    """Возвращает (группа_существует, студент_уже_в_группе) без записи файла."""
+    with _index_lock:
+        index = get_index()
+        return group in index.groups, index.has_student(first_name, last_name, group)
+
+
+def suggest_groups(query, limit=3):
+    """Подсказки групп для опечатки: [(оценка, группа), ...]."""
+    with _index_lock:
+        return get_index().suggest_groups(query, limit)
+
+
+def suggest_students(first_name, last_name, group, limit=3):
+    """Подсказки студентов группы для опечатки: [(оценка, (имя, фамилия)), ...]."""
+    with _index_lock:
+        return get_index().suggest_students(first_name, last_name, group, limit)
+
+
+def list_students():
+    """Все строки списка [(группа, имя, фамилия), ...] без повторов внутри группы."""
+    with _index_lock:
+        index = get_index()
+        students, seen = [], set()
+        for group, sheet in index.sheets.items():
+            for first_name, last_name in sheet.names():
+                key = (group, normalize_name(first_name), normalize_name(last_name))
+                if key in seen or not (key[1] or key[2]):
+                    continue
+                seen.add(key)
+                students.append((group, str(first_name or "").strip(), str(last_name or "").strip()))
+        return students
+
 
 def ensure_excel_exists():
-    """Создаёт пустой Excel, если его нет."""
-    if not os.path.exists(FILE_PATH):
-        print(f"Файл {FILE_PATH} не найден. Создаётся новый Excel.")
-        with pd.ExcelWriter(FILE_PATH, engine='openpyxl') as writer:
-            df = pd.DataFrame(columns=['ИМЯ', 'ФАМИЛИЯ'])
-            df.to_excel(writer, sheet_name='Неизвестные', index=False)
-        print("Создан Excel с листом 'Неизвестные'.")
+    """Создаёт пустой список (лист 'Неизвестные'), если его нет."""
+    if not _backend.exists():
+        logger.info("Файл %s не найден. Создаётся новый список (%s)", _backend.path, _backend.kind)
+        _backend.write({'Неизвестные': Sheet()})
+        logger.info("Создан список с листом 'Неизвестные'")
 
 def get_groups():
-    """Возвращает список всех групп (листов) в Excel."""
-    ensure_excel_exists()
+    """Возвращает список всех групп (листов)."""
     try:
-        sheets = pd.ExcelFile(FILE_PATH, engine='openpyxl').sheet_names
-        return sheets
-    except Exception as e:
-        print(f"Ошибка при чтении групп из Excel: {e}")
+        return list(get_index().sheets)
+    except Exception:
+        logger.exception("Ошибка при чтении групп из списка")
         return []
 
 def add_or_check_student(first_name, last_name, group):
@@ -34,69 +283,44 @@ def add_or_check_student(first_name, last_name, group):
     Если студент новый — добавляет его.
     Возвращает True, если группа существует.
     """
-    ensure_excel_exists()
-    try:
-        excel_data = pd.read_excel(FILE_PATH, sheet_name=None, engine='openpyxl')
-        if group not in excel_data:
-            return False  # Группа не найдена
-
-        df = excel_data[group]
-        mask = (df['ИМЯ'].str.lower() == first_name.lower()) & (df['ФАМИЛИЯ'].str.lower() == last_name.lower())
-        if not mask.any():
-            # Добавляем нового студента
-            new_row = pd.DataFrame([[first_name, last_name]], columns=['ИМЯ', 'ФАМИЛИЯ'])
-            df = pd.concat([df, new_row], ignore_index=True)
-            excel_data[group] = df
-            with pd.ExcelWriter(FILE_PATH, engine='openpyxl') as writer:
-                for sheet_name, sheet_df in excel_data.items():
-                    sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        return True
-    except Exception as e:
-        print(f"Ошибка при добавлении/проверке студента: {e}")
+    result = apply_mutations([("add_student", first_name, last_name, group)])[0]
+    if isinstance(result, Exception):
+        logger.error("Ошибка при добавлении/проверке студента", exc_info=result)
         return False
-    
+    return result
+
 def ensure_group_sheet(group_name: str) -> bool:
     """
-    Гарантирует наличие листа Excel для группы.
+    Гарантирует наличие листа для группы.
     Возвращает True, если лист создан заново; False, если уже существовал.
     """
-    ensure_excel_exists()
-    try:
-        excel_data = pd.read_excel(FILE_PATH, sheet_name=None, engine='openpyxl')
-        if group_name in excel_data:
-            return False  # уже есть
-
-        # создаём пустой лист с колонками
-        excel_data[group_name] = pd.DataFrame(columns=['ИМЯ', 'ФАМИЛИЯ'])
-        with pd.ExcelWriter(FILE_PATH, engine='openpyxl') as writer:
-            for sheet_name, sheet_df in excel_data.items():
-                sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        return True
-    except Exception as e:
-        print(f"Ошибка ensure_group_sheet('{group_name}'): {e}")
-        raise
+    result = apply_mutations([("add_sheet", group_name)])[0]
+    if isinstance(result, Exception):
+        logger.error("Ошибка ensure_group_sheet(%r)", group_name, exc_info=result)
+        raise result
+    return result
 
 
 def remove_group_sheet(group_name: str) -> bool:
     """
-    Удаляет лист группы из Excel, если он найден.
+    Удаляет лист группы из списка, если он найден.
     Возвращает True при успешном удалении, иначе False.
     """
-    ensure_excel_exists()
-    try:
-        excel_data = pd.read_excel(FILE_PATH, sheet_name=None, engine='openpyxl')
-        if group_name not in excel_data:
-            return False
-
-        del excel_data[group_name]
+    result = apply_mutations([("remove_sheet", group_name)])[0]
+    if isinstance(result, Exception):
+        logger.error("Ошибка remove_group_sheet(%r)", group_name, exc_info=result)
+        return False
+    return result
 
-        if not excel_data:
-            excel_data["General"] = pd.DataFrame(columns=['ИМЯ', 'ФАМИЛИЯ'])
 
-        with pd.ExcelWriter(FILE_PATH, engine='openpyxl') as writer:
-            for sheet_name, sheet_df in excel_data.items():
-                sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
-        return True
-    except Exception as e:
-        print(f"Ошибка remove_group_sheet('{group_name}'): {e}")
-        return False
+def load_name_map():
+    """
+    Возвращает словарь {(имя, фамилия): группа} в casefold-виде по всем листам.
+    Используется при синхронизации участников сервера с базой.
+    """
+    try:
+        with _index_lock:
+            return dict(get_index().students)
+    except Exception:
+        logger.exception("Ошибка при чтении списка студентов")
+        return {}
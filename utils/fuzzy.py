@@ -0,0 +1,60 @@
+"""
+utils/fuzzy.py
+Нечёткий поиск по триграммам: подсказки при опечатках в группе или имени.
+"""
+
+from collections import defaultdict
+
+
+def trigrams(text: str) -> set[str]:
+    """Множество триграмм строки (регистр и лишние пробелы не учитываются)."""
+    normalized = " ".join(str(text).casefold().split())
+    if not normalized:
+        return set()
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Инвертированный индекс триграмм: триграмма → номера строк.
+    Поиск считает общие триграммы только у строк, где они вообще встречаются,
+    и ранжирует кандидатов по коэффициенту Дайса.
+    """
+
+    def __init__(self):
+        self._values = []
+        self._sizes = []
+        self._postings = defaultdict(list)
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, text: str, value) -> None:
+        grams = trigrams(text)
+        if not grams:
+            return
+        position = len(self._values)
+        self._values.append(value)
+        self._sizes.append(len(grams))
+        for gram in grams:
+            self._postings[gram].append(position)
+
+    def search(self, query: str, limit: int = 3, threshold: float = 0.3) -> list[tuple[float, object]]:
+        """Лучшие совпадения [(оценка 0..1, значение), ...] по убыванию оценки."""
+        grams = trigrams(query)
+        if not grams:
+            return []
+
+        shared = defaultdict(int)
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        scored = []
+        for position, common in shared.items():
+            score = 2 * common / (len(grams) + self._sizes[position])
+            if score >= threshold:
+                scored.append((score, position))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(round(score, 3), self._values[position]) for score, position in scored[:limit]]
@@ -0,0 +1,147 @@
+"""
+utils/logging_setup.py
+Журнал работы бота: JSON-строки в файле с ротацией.
+
+Код бота пишет через logging.getLogger(__name__). Корневой логгер только
+кладёт запись в очередь (QueueHandler). Форматирование и запись в файл и
+консоль выполняет фоновый поток (QueueListener), поэтому медленный диск
+или stdout не задерживают обработчики команд и событий.
+Каждая строка файла — JSON-объект. К нему добавляются поля контекста
+(guild_id, command, user_id), заданные через bind_context / log_context,
+и поля из extra=..., например latency_ms.
+"""
+
+import atexit
+import contextlib
+import contextvars
+import copy
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+
+from config import LOG_BACKUP_COUNT, LOG_CONSOLE, LOG_FILE, LOG_LEVEL, LOG_MAX_BYTES
+
+_context: contextvars.ContextVar[dict] = contextvars.ContextVar("log_context", default={})
+
+# Атрибуты, которые есть у любой записи; всё остальное — контекст и extra
+_STANDARD_ATTRS = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime", "taskName"}
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def bind_context(**fields) -> contextvars.Token:
+    """
+    Добавляет поля ко всем записям текущей задачи asyncio.
+    Задачи, созданные после вызова, получают копию контекста.
+    """
+    fields = {key: value for key, value in fields.items() if value is not None}
+    return _context.set({**_context.get(), **fields})
+
+
+@contextlib.contextmanager
+def log_context(**fields):
+    """Поля контекста только внутри блока with."""
+    token = bind_context(**fields)
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+class ContextFilter(logging.Filter):
+    """Переносит поля контекста в запись. Явно переданные в extra имеют приоритет."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Одна запись — одна строка JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler без форматирования в вызывающем потоке. Стандартный prepare()
+    склеивает трассировку исключения с текстом. Здесь только подставляются
+    аргументы в сообщение, а exc_info передаётся фоновому потоку как есть.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def setup_logging(
+    level: str = LOG_LEVEL,
+    log_file: str = LOG_FILE,
+    max_bytes: int = LOG_MAX_BYTES,
+    backup_count: int = LOG_BACKUP_COUNT,
+    console: bool = LOG_CONSOLE,
+) -> logging.handlers.QueueListener:
+    """Переводит корневой логгер на очередь и запускает фоновую запись (один раз за процесс)."""
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    directory = os.path.dirname(log_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+    handlers: list[logging.Handler] = [file_handler]
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+        handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging() -> None:
+    """Дописывает очередь и останавливает фоновый поток."""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
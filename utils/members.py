@@ -0,0 +1,58 @@
+"""
+utils/members.py
+Обход участников сервера без полной загрузки списка в кэш.
+
+При профиле кэша "minimal" (см. MEMBER_CACHE_PROFILE) сервер не загружается
+целиком при старте, и guild.members содержит только встреченных участников.
+Тогда участники читаются постранично через guild.fetch_members и
+обрабатываются пачками — в памяти одновременно только одна пачка.
+"""
+
+from collections.abc import AsyncIterator
+
+import discord
+
+MEMBER_PAGE_SIZE = 1000  # столько же отдаёт Discord за один запрос fetch_members
+
+
+async def iter_member_pages(guild: discord.Guild, page_size: int = MEMBER_PAGE_SIZE) -> AsyncIterator[list[discord.Member]]:
+    """Участники сервера (без ботов) пачками: из кэша, если сервер загружен целиком, иначе через API."""
+    if guild.chunked:
+        members = [member for member in guild.members if not member.bot]
+        for start in range(0, len(members), page_size):
+            yield members[start:start + page_size]
+        return
+
+    page = []
+    async for member in guild.fetch_members(limit=None):
+        if member.bot:
+            continue
+        page.append(member)
+        if len(page) >= page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+async def fetch_all_members(guild: discord.Guild) -> list[discord.Member]:
+    """Все участники сервера (без ботов) одним списком — для отчётов, где нужен полный состав."""
+    members = []
+    async for page in iter_member_pages(guild):
+        members.extend(page)
+    return members
+
+
+async def current_member(member: discord.Member) -> discord.Member | None:
+    """
+    Свежая копия участника: из кэша, иначе через API (профиль "minimal" не держит
+    роли незакэшированных участников в актуальном состоянии). None — участник ушёл.
+    Нужна перед member.edit(roles=...), который заменяет весь список ролей.
+    """
+    cached = member.guild.get_member(member.id)
+    if cached is not None:
+        return cached
+    try:
+        return await member.guild.fetch_member(member.id)
+    except discord.NotFound:
+        return None
@@ -0,0 +1,103 @@
+"""
+utils/personal_channels.py
+Индекс личных каналов студентов: member_id → channel_id по каждому серверу.
+
+ID канала хранится в users.personal_channel_id, а в памяти — словарь,
+который обновляется событиями создания, изменения и удаления каналов.
+Поиск канала ушедшего участника — O(1), без обхода всех категорий.
+Каналы, созданные до появления колонки, находятся по topic (там member.id).
+"""
+
+import discord
+
+
+def _topic_member_id(channel) -> int | None:
+    """ID участника из topic личного канала (topic — ровно его ID)."""
+    topic = getattr(channel, "topic", None)
+    if topic and topic.strip().isdigit():
+        return int(topic.strip())
+    return None
+
+
+class PersonalChannelIndex:
+    """Словари guild_id → {member_id: channel_id} и обратный channel_id → (guild_id, member_id)."""
+
+    def __init__(self):
+        self._by_member: dict[int, dict[int, int]] = {}
+        self._by_channel: dict[int, tuple[int, int]] = {}
+
+    def __len__(self):
+        return len(self._by_channel)
+
+    def _set(self, guild_id: int, member_id: int, channel_id: int) -> None:
+        members = self._by_member.setdefault(guild_id, {})
+        previous = members.get(member_id)
+        if previous is not None:
+            self._by_channel.pop(previous, None)
+        members[member_id] = channel_id
+        self._by_channel[channel_id] = (guild_id, member_id)
+
+    def _discard_channel(self, channel_id: int) -> None:
+        owner = self._by_channel.pop(channel_id, None)
+        if owner is None:
+            return
+        guild_id, member_id = owner
+        members = self._by_member.get(guild_id, {})
+        if members.get(member_id) == channel_id:
+            del members[member_id]
+
+    async def load_guild(self, guild: discord.Guild) -> int:
+        """Заполняет индекс сервера: сохранённые в users каналы и каналы с ID в topic. Возвращает число каналов."""
+        from database.models import User
+
+        channel_ids = {channel.id for channel in guild.text_channels}
+        for channel in guild.text_channels:
+            member_id = _topic_member_id(channel)
+            if member_id is not None:
+                self._set(guild.id, member_id, channel.id)
+
+        if channel_ids:
+            stored = await User.filter(personal_channel_id__in=list(channel_ids)).values_list(
+                "discord_id", "personal_channel_id"
+            )
+            for member_id, channel_id in stored:
+                self._set(guild.id, member_id, channel_id)
+        return len(self._by_member.get(guild.id, {}))
+
+    async def assign(self, guild: discord.Guild, member_id: int, channel: discord.abc.GuildChannel) -> None:
+        """Запоминает личный канал участника в памяти и в users.personal_channel_id."""
+        from database.models import User
+
+        self._set(guild.id, member_id, channel.id)
+        await User.filter(discord_id=member_id).update(personal_channel_id=channel.id)
+
+    async def find(self, guild: discord.Guild, member_id: int) -> discord.TextChannel | None:
+        """Личный канал участника на сервере или None."""
+        channel_id = self._by_member.get(guild.id, {}).get(member_id)
+        if channel_id is None:
+            from database.models import User
+
+            channel_id = await User.filter(discord_id=member_id).first().values_list("personal_channel_id", flat=True)
+        channel = guild.get_channel(channel_id) if channel_id else None
+        return channel if isinstance(channel, discord.TextChannel) else None
+
+    # -------------------------- События каналов --------------------------
+
+    def channel_created(self, channel: discord.abc.GuildChannel) -> None:
+        member_id = _topic_member_id(channel)
+        if member_id is not None:
+            self._set(channel.guild.id, member_id, channel.id)
+
+    async def channel_deleted(self, channel: discord.abc.GuildChannel) -> None:
+        from database.models import User
+
+        self._discard_channel(channel.id)
+        await User.filter(personal_channel_id=channel.id).update(personal_channel_id=None)
+
+    def channel_updated(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        if getattr(before, "topic", None) == getattr(after, "topic", None):
+            return
+        old_member_id = _topic_member_id(before)
+        if old_member_id is not None and self._by_channel.get(after.id) == (after.guild.id, old_member_id):
+            self._discard_channel(after.id)
+        self.channel_created(after)
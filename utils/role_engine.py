@@ -0,0 +1,79 @@
+"""
+utils/role_engine.py
+Назначение ролей участникам одним запросом на участника.
+
+Для каждого участника вычисляется итоговый набор ролей (текущие + добавить −
+убрать), и он применяется одним member.edit(roles=...) вместо пары
+add_roles/remove_roles. Массовое назначение идёт параллельно, но не больше
+ROLE_EDIT_CONCURRENCY запросов одновременно на сервер — запросы к участникам
+одного сервера делят общий лимит Discord.
+"""
+
+import asyncio
+from collections.abc import Iterable
+
+import discord
+
+from config import ROLE_EDIT_CONCURRENCY
+
+
+def target_roles(member: discord.Member, add: Iterable[discord.Role] = (), remove: Iterable[discord.Role] = ()):
+    """Итоговый набор ролей участника (без @everyone) в порядке текущих ролей."""
+    remove_ids = {role.id for role in remove}
+    roles = [role for role in member.roles if not role.is_default() and role.id not in remove_ids]
+    present = {role.id for role in roles}
+    for role in add:
+        if role.id not in present and role.id not in remove_ids:
+            roles.append(role)
+            present.add(role.id)
+    return roles
+
+
+class RoleEngine:
+    """Применяет наборы ролей; семафор на сервер ограничивает параллельные запросы."""
+
+    def __init__(self, concurrency: int = ROLE_EDIT_CONCURRENCY):
+        self.concurrency = concurrency
+        self._limits: dict[int, asyncio.Semaphore] = {}
+        self.calls = 0  # сделано запросов к API (для логов и замеров)
+
+    def _limit(self, guild: discord.Guild) -> asyncio.Semaphore:
+        limit = self._limits.get(guild.id)
+        if limit is None:
+            limit = self._limits[guild.id] = asyncio.Semaphore(self.concurrency)
+        return limit
+
+    async def apply(
+        self,
+        member: discord.Member,
+        add: Iterable[discord.Role] = (),
+        remove: Iterable[discord.Role] = (),
+        reason: str | None = None,
+    ) -> bool:
+        """Приводит роли участника к целевому набору. False — если менять нечего (запрос не делается)."""
+        roles = target_roles(member, add, remove)
+        current = {role.id for role in member.roles if not role.is_default()}
+        if {role.id for role in roles} == current:
+            return False
+        async with self._limit(member.guild):
+            self.calls += 1
+            await member.edit(roles=roles, reason=reason)
+        return True
+
+    async def apply_many(self, changes, reason: str | None = None) -> tuple[list[discord.Member], list[tuple]]:
+        """
+        Параллельно применяет [(участник, добавить, убрать), ...].
+        Возвращает (изменённые участники, [(участник, исключение), ...]).
+        """
+        changes = list(changes)
+        results = await asyncio.gather(
+            *(self.apply(member, add, remove, reason=reason) for member, add, remove in changes),
+            return_exceptions=True,
+        )
+        changed, failed = [], []
+        for (member, _, _), result in zip(changes, results):
+            if isinstance(result, Exception):
+                failed.append((member, result))
+            elif result:
+                changed.append(member)
+        return changed, failed
@@ -0,0 +1,248 @@
+"""
+utils/roster.py
+Асинхронный доступ к списку студентов.
+
+Все операции с файлом списка (utils.file_manager: Excel, Parquet или каталог
+CSV — см. utils.roster_backends) блокирующие, поэтому выполняются
+в отдельном однопоточном executor'е: event loop (heartbeat шлюза, команды,
+interaction'ы) не замирает, а обращения к файлу идут строго по очереди.
+
+Изменения (новый студент, новый/удалённый лист) проходят через единственного
+писателя RosterWriter: он собирает их в течение окна ROSTER_FLUSH_INTERVAL и
+записывает файл один раз на пачку.
+
+Копия списка хранится в таблице RosterEntry: проверка студента при
+регистрации — один запрос по индексу, а !rosterimport / !rosterexport
+синхронизируют таблицу с файлом целиком.
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from tortoise.transactions import in_transaction
+
+from config import ROSTER_FLUSH_INTERVAL
+from database.models import RosterEntry
+from utils import file_manager
+
+logger = logging.getLogger(__name__)
+
+# Размер пачки для bulk_create при импорте списка в базу
+IMPORT_BATCH_SIZE = 500
+
+# Один поток: записи в Excel не пересекаются между собой.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="roster-io")
+
+
+async def _run(func, *args):
+    """Выполняет синхронную функцию file_manager в executor'е списка."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args))
+
+
+class RosterWriter:
+    """Единственный писатель списка: очередь изменений и запись пачками."""
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self.flushes = 0  # сколько раз файл записывался пачкой
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    def _ensure_started(self) -> asyncio.Queue:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(), name="roster-writer")
+        return self._queue
+
+    async def submit(self, name: str, *args):
+        """Ставит изменение в очередь и ждёт результата после записи пачки."""
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_started().put_nowait(((name, *args), future))
+        return await future
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [await self._queue.get()]
+            if batch[0] is not None and self.flush_interval > 0:
+                await asyncio.sleep(self.flush_interval)
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            stopping = None in batch
+            batch = [item for item in batch if item is not None]
+            if not batch:
+                continue
+
+            mutations = [mutation for mutation, _ in batch]
+            try:
+                results = await _run(file_manager.apply_mutations, mutations)
+            except Exception as e:
+                results = [e] * len(batch)
+            self.flushes += 1
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def close(self):
+        """Дописывает всё, что стоит в очереди, и останавливает писателя."""
+        if self._task is None or self._task.done():
+            return
+        self._queue.put_nowait(None)
+        await self._task
+
+
+_writer = RosterWriter(ROSTER_FLUSH_INTERVAL)
+
+
+async def ensure_excel_exists() -> None:
+    """Создаёт пустой список, если его нет."""
+    await _run(file_manager.ensure_excel_exists)
+
+
+async def get_groups() -> list[str]:
+    """Возвращает список всех групп (листов)."""
+    return await _run(file_manager.get_groups)
+
+
+def _entry_filter(first_name: str, last_name: str, group: str) -> dict:
+    return {
+        "group": group,
+        "first_name_cf": first_name.strip().casefold(),
+        "last_name_cf": last_name.strip().casefold(),
+    }
+
+
+async def _mirror_student(first_name: str, last_name: str, group: str) -> None:
+    """Добавляет студента в RosterEntry (если его там ещё нет)."""
+    try:
+        await RosterEntry.get_or_create(
+            **_entry_filter(first_name, last_name, group),
+            defaults={"first_name": first_name.strip(), "last_name": last_name.strip()},
+        )
+    except Exception as e:
+        logger.warning("Не удалось сохранить студента в roster_entries: %s", e)
+
+
+async def add_or_check_student(first_name: str, last_name: str, group: str) -> bool:
+    """
+    Проверяет, есть ли группа и студент.
+    Если группы нет — False. Если студент новый — добавляет его через писателя.
+    Возвращает True, если группа существует.
+    """
+    try:
+        if await RosterEntry.exists(**_entry_filter(first_name, last_name, group)):
+            return True
+    except Exception as e:
+        logger.warning("roster_entries недоступна, проверка по файлу: %s", e)
+
+    try:
+        group_exists, student_exists = await _run(
+            file_manager.lookup_student, first_name, last_name, group
+        )
+        if not group_exists:
+            return False
+        if not student_exists and not await _writer.submit("add_student", first_name, last_name, group):
+            return False
+    except Exception:
+        logger.exception("Ошибка при добавлении/проверке студента")
+        return False
+
+    await _mirror_student(first_name, last_name, group)
+    return True
+
+
+async def ensure_group_sheet(group_name: str) -> bool:
+    """Гарантирует наличие листа группы. True — если лист создан заново."""
+    try:
+        return await _writer.submit("add_sheet", group_name)
+    except Exception:
+        logger.exception("Ошибка ensure_group_sheet(%r)", group_name)
+        raise
+
+
+async def remove_group_sheet(group_name: str) -> bool:
+    """Удаляет лист группы. True — если лист был найден и удалён."""
+    try:
+        removed = await _writer.submit("remove_sheet", group_name)
+    except Exception:
+        logger.exception("Ошибка remove_group_sheet(%r)", group_name)
+        return False
+
+    try:
+        await RosterEntry.filter(group=group_name).delete()
+    except Exception as e:
+        logger.warning("Не удалось очистить roster_entries для %r: %s", group_name, e)
+    return removed
+
+
+async def lookup_student(first_name: str, last_name: str, group: str) -> tuple[bool, bool]:
+    """(группа_существует, студент_уже_в_группе) — по индексу, без записи."""
+    return await _run(file_manager.lookup_student, first_name, last_name, group)
+
+
+async def suggest_group(query: str) -> str | None:
+    """Самая похожая существующая группа или None."""
+    matches = await _run(file_manager.suggest_groups, query, 1)
+    return matches[0][1] if matches else None
+
+
+async def suggest_student(first_name: str, last_name: str, group: str) -> tuple[str, str] | None:
+    """Самый похожий студент группы (имя, фамилия) или None."""
+    matches = await _run(file_manager.suggest_students, first_name, last_name, group, 1)
+    return matches[0][1] if matches else None
+
+
+async def list_students() -> list[tuple[str, str, str]]:
+    """Все строки списка [(группа, имя, фамилия), ...]."""
+    return await _run(file_manager.list_students)
+
+
+async def load_name_map() -> dict[tuple[str, str], str]:
+    """Возвращает словарь {(имя, фамилия): группа} по всему списку (casefold)."""
+    return await _run(file_manager.load_name_map)
+
+
+async def import_to_db() -> int:
+    """
+    Заменяет содержимое RosterEntry строками из файла (одна транзакция,
+    bulk_create пачками). Возвращает число загруженных строк.
+    """
+    students = await list_students()
+    entries = [
+        RosterEntry(
+            first_name=first_name,
+            last_name=last_name,
+            first_name_cf=first_name.casefold(),
+            last_name_cf=last_name.casefold(),
+            group=group,
+        )
+        for group, first_name, last_name in students
+    ]
+    async with in_transaction():
+        await RosterEntry.all().delete()
+        await RosterEntry.bulk_create(entries, batch_size=IMPORT_BATCH_SIZE)
+    return len(entries)
+
+
+async def export_from_db() -> int:
+    """
+    Переписывает листы файла по содержимому RosterEntry (через писателя).
+    Возвращает число выгруженных строк.
+    """
+    rows = await RosterEntry.all().order_by("id").values_list("group", "first_name", "last_name")
+    return await _writer.submit("replace_students", list(rows))
+
+
+async def close() -> None:
+    """Записывает отложенные изменения и останавливает executor."""
+    await _writer.close()
+    _executor.shutdown(wait=True)
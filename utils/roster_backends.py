@@ -0,0 +1,309 @@
+"""
+utils/roster_backends.py
+Форматы хранения списка студентов.
+
+Каждая группа — отдельный «лист» (Sheet) с колонками ИМЯ | ФАМИЛИЯ.
+Формат выбирается по пути READER_FILE_PATH:
+- *.xlsx / *.xlsm — книга Excel, лист на группу (openpyxl);
+- *.parquet / *.pq — один Parquet-файл с колонкой ГРУППА (нужен pyarrow);
+- каталог (путь без расширения) — по CSV-файлу на группу: <группа>.csv.
+"""
+
+import csv
+import importlib.util
+import os
+import stat
+import tempfile
+
+COLUMNS = ('ИМЯ', 'ФАМИЛИЯ')
+GROUP_COLUMN = 'ГРУППА'
+
+EXCEL_SUFFIXES = ('.xlsx', '.xlsm')
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+
+def normalize_name(value) -> str:
+    """Приводит имя/фамилию к виду для сравнения (без регистра и пробелов по краям)."""
+    if value is None:
+        return ""
+    return str(value).strip().casefold()
+
+
+class Sheet:
+    """
+    Лист группы: строка заголовка и строки данных как есть.
+    Порядок строк и дополнительные колонки сохраняются при перезаписи.
+    """
+
+    __slots__ = ("header", "rows")
+
+    def __init__(self, header=None, rows=None):
+        self.header = list(header) if header else list(COLUMNS)
+        self.rows = rows if rows is not None else []
+
+    def _name_columns(self):
+        try:
+            return self.header.index(COLUMNS[0]), self.header.index(COLUMNS[1])
+        except ValueError:
+            return None
+
+    def names(self):
+        """Пары (имя, фамилия) по строкам листа."""
+        columns = self._name_columns()
+        if columns is None:
+            return
+        first_col, last_col = columns
+        for row in self.rows:
+            first = row[first_col] if first_col < len(row) else None
+            last = row[last_col] if last_col < len(row) else None
+            yield first, last
+
+    def append(self, first_name, last_name):
+        columns = self._name_columns()
+        if columns is None:
+            raise ValueError(f"на листе нет колонок {COLUMNS[0]} | {COLUMNS[1]}")
+        row = [None] * len(self.header)
+        row[columns[0]] = first_name
+        row[columns[1]] = last_name
+        self.rows.append(tuple(row))
+
+    def sync_names(self, names) -> bool:
+        """
+        Приводит лист к набору имён {(имя_cf, фамилия_cf): (имя, фамилия)}:
+        строки с другими именами удаляются, недостающие дописываются в конец.
+        Возвращает True, если лист изменился.
+        """
+        columns = self._name_columns()
+        if columns is None:
+            return False
+        first_col, last_col = columns
+        kept, seen = [], set()
+        for row in self.rows:
+            key = (
+                normalize_name(row[first_col] if first_col < len(row) else None),
+                normalize_name(row[last_col] if last_col < len(row) else None),
+            )
+            if key in names and key not in seen:
+                kept.append(row)
+                seen.add(key)
+        missing = [value for key, value in names.items() if key not in seen]
+        changed = len(kept) != len(self.rows) or bool(missing)
+        self.rows = kept
+        for first_name, last_name in missing:
+            self.append(first_name, last_name)
+        return changed
+
+
+def _file_mode(path) -> int:
+    """Права для записываемого файла: как у существующего, иначе как у open() (0666 с учётом umask)."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _replace_atomically(path, write, suffix):
+    """
+    Пишет файл через временный файл рядом с path и os.replace().
+    mkstemp создаёт файл с правами 0600 — перед заменой им выставляются права исходного файла.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".roster-", suffix=suffix, dir=directory)
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class RosterBackend:
+    """Формат хранения: чтение и запись всех групп целиком."""
+
+    kind = ""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def stamp(self):
+        """Отпечаток хранилища для инвалидации индекса: (mtime_ns, size)."""
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def read(self) -> dict:
+        """Возвращает {группа: Sheet}."""
+        raise NotImplementedError
+
+    def write(self, sheets: dict) -> None:
+        """Атомарно записывает {группа: Sheet}."""
+        raise NotImplementedError
+
+
+class ExcelBackend(RosterBackend):
+    """Книга Excel: лист на группу. Чтение read_only, запись write_only."""
+
+    kind = "xlsx"
+
+    def read(self):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(self.path, read_only=True, data_only=True)
+        try:
+            sheets = {}
+            for worksheet in workbook.worksheets:
+                rows = worksheet.iter_rows(values_only=True)
+                header = next(rows, None)
+                if header:
+                    while header and header[-1] is None:
+                        header = header[:-1]
+                data = [row for row in rows if any(cell is not None for cell in row)]
+                sheets[worksheet.title] = Sheet(header, data)
+            return sheets
+        finally:
+            workbook.close()
+
+    def write(self, sheets):
+        from openpyxl import Workbook
+
+        def _write(path):
+            workbook = Workbook(write_only=True)
+            for sheet_name, sheet in sheets.items():
+                worksheet = workbook.create_sheet(title=sheet_name)
+                worksheet.append(sheet.header)
+                for row in sheet.rows:
+                    worksheet.append(row)
+            workbook.save(path)
+
+        _replace_atomically(self.path, _write, ".xlsx")
+
+
+class CsvDirectoryBackend(RosterBackend):
+    """
+    Каталог CSV-файлов: <группа>.csv, первая строка — заголовок.
+    Каждый файл заменяется атомарно; файлы удалённых групп удаляются.
+    """
+
+    kind = "csv"
+    suffix = ".csv"
+
+    def _files(self):
+        entries = [
+            entry for entry in os.scandir(self.path)
+            if entry.is_file() and entry.name.endswith(self.suffix)
+        ]
+        return sorted(entries, key=lambda entry: entry.name)
+
+    def stamp(self):
+        stat = os.stat(self.path)
+        files = tuple(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in self._files()
+        )
+        return stat.st_mtime_ns, files
+
+    def _file_path(self, group):
+        if os.sep in group or (os.altsep and os.altsep in group) or group in ("", ".", ".."):
+            raise ValueError(f"недопустимое имя группы для CSV: {group!r}")
+        return os.path.join(self.path, group + self.suffix)
+
+    def read(self):
+        sheets = {}
+        for entry in self._files():
+            with open(entry.path, newline="", encoding="utf-8") as fh:
+                reader = csv.reader(fh)
+                header = next(reader, None)
+                data = [
+                    tuple(cell if cell != "" else None for cell in row)
+                    for row in reader
+                    if any(cell != "" for cell in row)
+                ]
+            sheets[entry.name[:-len(self.suffix)]] = Sheet(header, data)
+        return sheets
+
+    def write(self, sheets):
+        os.makedirs(self.path, exist_ok=True)
+        wanted = set()
+        for group, sheet in sheets.items():
+            path = self._file_path(group)
+            wanted.add(os.path.basename(path))
+
+            def _write(tmp_path, sheet=sheet):
+                with open(tmp_path, "w", newline="", encoding="utf-8") as fh:
+                    writer = csv.writer(fh)
+                    writer.writerow(sheet.header)
+                    writer.writerows(
+                        ["" if cell is None else cell for cell in row] for row in sheet.rows
+                    )
+
+            _replace_atomically(path, _write, self.suffix)
+
+        for entry in self._files():
+            if entry.name not in wanted:
+                os.remove(entry.path)
+
+
+class ParquetBackend(RosterBackend):
+    """
+    Один Parquet-файл: колонка ГРУППА + колонки листов.
+    Пустая группа хранится строкой, где заполнена только ГРУППА.
+    """
+
+    kind = "parquet"
+
+    def read(self):
+        import pandas as pd
+
+        df = pd.read_parquet(self.path)
+        header = [column for column in df.columns if column != GROUP_COLUMN]
+        df = df.astype(object).where(df.notna(), None)
+
+        sheets = {}
+        for group, part in df.groupby(GROUP_COLUMN, sort=False):
+            rows = [
+                row for row in part[header].itertuples(index=False, name=None)
+                if any(cell is not None for cell in row)
+            ]
+            sheets[str(group)] = Sheet(header, rows)
+        return sheets
+
+    def write(self, sheets):
+        import pandas as pd
+
+        header = [GROUP_COLUMN]
+        for sheet in sheets.values():
+            header.extend(column for column in sheet.header if column not in header)
+
+        records = []
+        for group, sheet in sheets.items():
+            if not sheet.rows:
+                records.append({GROUP_COLUMN: group})
+            for row in sheet.rows:
+                record = dict(zip(sheet.header, row))
+                record[GROUP_COLUMN] = group
+                records.append(record)
+
+        df = pd.DataFrame.from_records(records, columns=header).astype("string")
+        _replace_atomically(self.path, lambda path: df.to_parquet(path, index=False), ".parquet")
+
+
+def get_backend(path: str) -> RosterBackend:
+    """Выбирает формат хранения по пути (расширению)."""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix in EXCEL_SUFFIXES:
+        return ExcelBackend(path)
+    if suffix in PARQUET_SUFFIXES:
+        # Проверка при запуске: без движка Parquet pandas падает только при первом чтении
+        if importlib.util.find_spec("pyarrow") is None and importlib.util.find_spec("fastparquet") is None:
+            raise ImportError(f"Для списка студентов в Parquet ({path}) нужен pyarrow: pip install pyarrow")
+        return ParquetBackend(path)
+    if not suffix or os.path.isdir(path):
+        return CsvDirectoryBackend(path)
+    raise ValueError(f"Неизвестный формат списка студентов: {path}")
@@ -0,0 +1,100 @@
+"""
+utils/roster_report.py
+Сверка списка студентов, таблицы users и участников сервера (!rostercheck).
+
+Все три источника собираются в DataFrame'ы и сравниваются несколькими
+merge'ами за один проход — без запросов к базе на каждого участника.
+"""
+
+import pandas as pd
+
+UNKNOWN_GROUP = "Неизвестные"
+
+REPORT_COLUMNS = ["проблема", "группа", "имя", "фамилия", "discord_id", "участник", "детали"]
+
+UNREGISTERED = "не зарегистрирован"
+WRONG_ROLE = "роль не совпадает с группой"
+NO_ACCOUNT = "нет аккаунта Discord"
+
+
+def _casefold(series: pd.Series) -> pd.Series:
+    return series.fillna("").astype(str).str.strip().str.casefold()
+
+
+def build_report(roster_rows, users, members) -> pd.DataFrame:
+    """
+    Строит отчёт о расхождениях.
+    - roster_rows: [(группа, имя, фамилия), ...] из списка студентов;
+    - users: [{"discord_id", "first_name", "last_name", "group"}, ...] из таблицы users;
+    - members: [{"discord_id", "display_name", "roles": [имена ролей]}, ...] — участники без ботов.
+    Возвращает DataFrame с колонками REPORT_COLUMNS.
+    """
+    roster = pd.DataFrame(roster_rows, columns=["group", "first_name", "last_name"])
+    roster["first_cf"] = _casefold(roster["first_name"])
+    roster["last_cf"] = _casefold(roster["last_name"])
+    groups = set(roster["group"])
+
+    users_df = pd.DataFrame(users, columns=["discord_id", "first_name", "last_name", "group"])
+    users_df["first_cf"] = _casefold(users_df["first_name"])
+    users_df["last_cf"] = _casefold(users_df["last_name"])
+
+    members_df = pd.DataFrame(members, columns=["discord_id", "display_name", "roles"])
+    member_roles = members_df[["discord_id", "roles"]].explode("roles").rename(columns={"roles": "group"})
+    member_roles = member_roles[member_roles["group"].isin(groups)]
+
+    in_guild = members_df[["discord_id", "display_name"]].merge(users_df, on="discord_id", how="left")
+
+    # 1) Участники без записи в users или с группой «Неизвестные»
+    unregistered = in_guild[in_guild["group"].isna() | (in_guild["group"] == UNKNOWN_GROUP)].assign(
+        проблема=UNREGISTERED,
+        детали="",
+    )
+
+    # 2) Зарегистрированные, у которых нет роли своей группы или есть роль чужой
+    registered = in_guild[in_guild["group"].isin(groups - {UNKNOWN_GROUP})]
+    role_check = registered.merge(member_roles, on=["discord_id", "group"], how="left", indicator=True)
+    missing_role = role_check[role_check["_merge"] == "left_only"].drop(columns="_merge")
+
+    role_names = member_roles.groupby("discord_id")["group"].agg(lambda names: ", ".join(sorted(names)))
+    extra = registered.merge(
+        member_roles.rename(columns={"group": "role"}), on="discord_id", how="inner"
+    )
+    extra = extra[extra["role"] != extra["group"]].drop_duplicates("discord_id")
+
+    wrong_role = pd.concat([missing_role, extra.drop(columns="role")]).drop_duplicates("discord_id")
+    wrong_role = wrong_role.assign(
+        проблема=WRONG_ROLE,
+        детали="роли групп: " + wrong_role["discord_id"].map(role_names).fillna("нет").astype(str),
+    )
+
+    # 3) Строки списка, которым не соответствует ни один участник сервера
+    present = in_guild.dropna(subset=["group"])[["group", "first_cf", "last_cf", "discord_id"]]
+    matched = roster.merge(present, on=["group", "first_cf", "last_cf"], how="left", indicator=True)
+    no_account = matched[matched["_merge"] == "left_only"].assign(
+        проблема=NO_ACCOUNT,
+        display_name="",
+        детали="",
+    )
+
+    report = pd.concat([unregistered, wrong_role, no_account], ignore_index=True)
+    report = report.rename(
+        columns={
+            "group": "группа",
+            "first_name": "имя",
+            "last_name": "фамилия",
+            "display_name": "участник",
+        }
+    )
+    report["discord_id"] = report["discord_id"].astype("Int64")
+    return report.reindex(columns=REPORT_COLUMNS)
+
+
+def summarize(report: pd.DataFrame) -> dict[str, int]:
+    """Количество строк отчёта по каждой проблеме."""
+    counts = report["проблема"].value_counts()
+    return {problem: int(counts.get(problem, 0)) for problem in (UNREGISTERED, WRONG_ROLE, NO_ACCOUNT)}
+
+
+def to_csv_bytes(report: pd.DataFrame) -> bytes:
+    """CSV отчёта в UTF-8 с BOM (корректно открывается в Excel)."""
+    return report.to_csv(index=False).encode("utf-8-sig")
@@ -0,0 +1,49 @@
+"""
+utils/startup.py
+Замер этапов запуска бота: импорты, загрузка когов, первый READY, база данных.
+"""
+
+import time
+
+
+class StartupReport:
+    """Последовательные отметки этапов запуска с длительностью каждого."""
+
+    def __init__(self, started: float | None = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.stages: list[tuple[str, float]] = []
+        self.reported = False
+        self._last = self.started
+
+    def mark(self, stage: str) -> None:
+        """Фиксирует окончание этапа stage."""
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        return self._last - self.started
+
+    def format(self) -> str:
+        parts = ", ".join(f"{stage} {duration:.2f} с" for stage, duration in self.stages)
+        return f"⏱️ Запуск: {parts} — всего {self.total:.2f} с."
+
+
+def resident_memory_mib() -> float | None:
+    """Резидентная память процесса в МиБ (Linux, /proc); None, если узнать нельзя."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def format_memory(before: float | None, after: float | None) -> str:
+    """«120.5 → 180.2 МиБ» или «н/д», если память не измерена."""
+    if before is None or after is None:
+        return "н/д"
+    return f"{before:.1f} → {after:.1f} МиБ"